@@ -4,20 +4,30 @@ from dataclasses import asdict, replace
 
 import streamlit as st
 
-from model.run_model import run_model
-from state.cases import case_path, list_cases, load_case, save_case
+from model.cache import cached_run_model, prefetch_scenarios
+from state.assumptions import with_planning_years
+from state.cases import (
+    case_path,
+    list_cases,
+    load_case_with_warnings,
+    record_case,
+    save_case,
+)
 from state.persistence import load_assumptions
 from ui.pages import (
     balance_sheet,
     cashflow,
     cost_model,
+    case_leaderboard,
     case_management,
+    data_tables,
     equity_case,
     financing_debt,
     model_export,
     overview,
     pnl,
     revenue_model,
+    scenario_comparison,
     valuation,
 )
 
@@ -28,10 +38,12 @@ SECTIONS = {
         "Cashflow & Liquidity",
         "Balance Sheet",
         "Valuation & Purchase Price",
+        "Data Tables",
+        "Scenario Comparison",
     ],
     "PLANNING": ["Revenue Model", "Cost Model"],
     "FINANCING": ["Financing & Debt", "Equity Case"],
-    "SETTINGS": ["Case Management", "Model Export"],
+    "SETTINGS": ["Case Management", "Case Leaderboard", "Model Export"],
 }
 
 DEFAULT_PAGE = "Overview"
@@ -420,6 +432,15 @@ def _case_name(path: str) -> str:
     return name or "Unnamed Case"
 
 
+def _show_case_warnings(path: str, warnings: list[str]) -> None:
+    st.session_state["case_warnings"] = warnings
+    if warnings:
+        st.warning(
+            f"{_case_name(path)} loaded with {len(warnings)} adjusted fields; "
+            "see Case Management for the list."
+        )
+
+
 def _get_view_scenario(current: str) -> str:
     if "view_scenario" not in st.session_state:
         st.session_state["view_scenario"] = current
@@ -448,7 +469,14 @@ def main() -> None:
         "case" not in st.session_state
         or st.session_state.get("case_path") != data_path
     ):
-        loaded_assumptions = load_assumptions(data_path)
+        try:
+            loaded_assumptions, warnings = load_case_with_warnings(data_path)
+        except ValueError as exc:
+            st.error(f"Could not load {_case_name(data_path)}: {exc} Showing the Base Case instead.")
+            data_path = "data/base_case.json"
+            st.session_state["data_path"] = data_path
+            loaded_assumptions, warnings = load_case_with_warnings(data_path)
+        _show_case_warnings(data_path, warnings)
         st.session_state["case"] = loaded_assumptions
         st.session_state["case_path"] = data_path
         st.session_state["case_original"] = asdict(loaded_assumptions)
@@ -463,6 +491,7 @@ def main() -> None:
         "Cashflow & Liquidity",
         "Balance Sheet",
         "Valuation & Purchase Price",
+        "Data Tables",
     }
     analysis_pages = {
         "Overview",
@@ -498,9 +527,12 @@ def main() -> None:
     elif can_persist and asdict(updated_assumptions) != st.session_state.get(
         "case_original", {}
     ):
-        save_case(updated_assumptions, data_path)
+        record_case(updated_assumptions, data_path, st.session_state.get("case_original"))
+        st.session_state["case_original"] = asdict(updated_assumptions)
 
-    result = run_model(
+    if page in view_only_scenario_pages or page in {"Scenario Comparison", "Model Export"}:
+        prefetch_scenarios(updated_assumptions)
+    result = cached_run_model(
         view_assumptions if page in view_only_scenario_pages else updated_assumptions
     )
 
@@ -519,6 +551,10 @@ def main() -> None:
         page_updated_assumptions = equity_case.render(result, view_assumptions)
     elif page == "Valuation & Purchase Price":
         page_updated_assumptions = valuation.render(result, view_assumptions)
+    elif page == "Data Tables":
+        data_tables.render(view_assumptions)
+    elif page == "Scenario Comparison":
+        scenario_comparison.render(updated_assumptions)
     elif page == "Case Management":
         case_actions = case_management.render(updated_assumptions, data_path, case_options)
         scenario = case_actions["scenario"]
@@ -527,12 +563,20 @@ def main() -> None:
             st.session_state["case"] = updated_assumptions
             st.session_state["view_scenario"] = scenario
             if not data_path.endswith("base_case.json"):
-                save_case(updated_assumptions, data_path)
+                record_case(updated_assumptions, data_path, st.session_state.get("case_original"))
+                st.session_state["case_original"] = asdict(updated_assumptions)
+        planning_years = case_actions["planning_years"]
+        if planning_years != updated_assumptions.planning_years:
+            updated_assumptions = with_planning_years(updated_assumptions, planning_years)
+            st.session_state["case"] = updated_assumptions
+            if not data_path.endswith("base_case.json"):
+                record_case(updated_assumptions, data_path, st.session_state.get("case_original"))
                 st.session_state["case_original"] = asdict(updated_assumptions)
         if case_actions["reset"]:
             data_path = "data/base_case.json"
             st.session_state["data_path"] = data_path
             updated_assumptions = load_assumptions(data_path)
+            st.session_state["case_warnings"] = []
             st.session_state["case"] = updated_assumptions
             st.session_state["case_path"] = data_path
             st.session_state["case_original"] = asdict(updated_assumptions)
@@ -543,26 +587,39 @@ def main() -> None:
                 data_path = load_choice
             else:
                 data_path = str(case_path(load_choice))
-            st.session_state["data_path"] = data_path
-            updated_assumptions = load_case(data_path)
-            st.session_state["case"] = updated_assumptions
-            st.session_state["case_path"] = data_path
-            st.session_state["case_original"] = asdict(updated_assumptions)
-            st.session_state["view_scenario"] = updated_assumptions.scenario
+            try:
+                loaded_assumptions, warnings = load_case_with_warnings(data_path)
+            except ValueError as exc:
+                st.error(f"Could not load {_case_name(data_path)}: {exc}")
+                data_path = st.session_state["data_path"]
+            else:
+                _show_case_warnings(data_path, warnings)
+                updated_assumptions = loaded_assumptions
+                st.session_state["data_path"] = data_path
+                st.session_state["case"] = updated_assumptions
+                st.session_state["case_path"] = data_path
+                st.session_state["case_original"] = asdict(updated_assumptions)
+                st.session_state["view_scenario"] = updated_assumptions.scenario
         if case_actions["save"]:
-            save_case(updated_assumptions, data_path)
+            save_case(updated_assumptions, data_path, st.session_state.get("case_original"))
             st.session_state["case_original"] = asdict(updated_assumptions)
         if case_actions["save_as"] and case_actions["new_case_name"]:
             new_path = str(case_path(case_actions["new_case_name"]))
-            save_case(updated_assumptions, new_path)
+            overlay_of = (
+                data_path if case_actions["save_as_overlay"] and new_path != data_path else None
+            )
+            save_case(updated_assumptions, new_path, source=data_path, overlay_of=overlay_of)
             st.session_state["data_path"] = new_path
             st.session_state["case_path"] = new_path
+            st.session_state["case_warnings"] = []
             data_path = new_path
             st.session_state["case_original"] = asdict(updated_assumptions)
         if case_actions["save_as"] and not case_actions["new_case_name"]:
             st.markdown("Enter a case name before saving a copy.")
         if case_actions["load"] and case_actions["load_choice"] == "Select case...":
             st.markdown("Select a case to load, then click Load Selected Case.")
+    elif page == "Case Leaderboard":
+        case_leaderboard.render(data_path)
     elif page == "Model Export":
         model_export.render(updated_assumptions, result)
 
@@ -579,7 +636,8 @@ def main() -> None:
         ):
             pass
         elif asdict(persist_assumptions) != st.session_state.get("case_original", {}):
-            save_case(persist_assumptions, data_path)
+            record_case(persist_assumptions, data_path, st.session_state.get("case_original"))
+            st.session_state["case_original"] = asdict(persist_assumptions)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+
+from benchmarks.run_model_latency import _time_per_call
+from model.break_even import BREAK_EVEN_TARGETS, solve_break_even
+from state.persistence import load_assumptions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the per-year break-even solver.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    assumptions = load_assumptions(args.case)
+    print(f"case:        {args.case}")
+    for target in BREAK_EVEN_TARGETS:
+        seconds = _time_per_call(
+            lambda a: solve_break_even(a, target), assumptions, args.iterations
+        )
+        methods = Counter(
+            method
+            for solution in solve_break_even(assumptions, target).values()
+            for method in solution.methods
+        )
+        summary = ", ".join(f"{count} {method}" for method, count in sorted(methods.items()))
+        print(f"{target:<13}{seconds * 1e3:8.1f} ms  ({summary})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from model.portfolio import iter_case_files
+from state.catalog import CaseCatalog
+
+
+def _glob_listing(directory: Path) -> list[str]:
+    return sorted(path.stem for path in directory.glob("*.json"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time catalog listing against directory globbing.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--cases", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    data = json.loads(Path(args.case).read_text(encoding="utf-8"))
+    scenarios = ("Base", "Best", "Worst")
+    with tempfile.TemporaryDirectory() as directory:
+        cases = Path(directory) / "cases"
+        cases.mkdir()
+        for index in range(args.cases):
+            data["scenario"] = scenarios[index % len(scenarios)]
+            (cases / f"case_{index:05d}.json").write_text(json.dumps(data), encoding="utf-8")
+        catalog = CaseCatalog(Path(directory) / "catalog.sqlite3", (cases,))
+
+        start = time.perf_counter()
+        catalog.refresh(force=True)
+        initial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            listed = _glob_listing(cases)
+        glob_listing = (time.perf_counter() - start) / args.repeats
+
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            catalogued = catalog.names(directory=cases)
+        catalog_listing = (time.perf_counter() - start) / args.repeats
+        assert catalogued == listed
+
+        paths = catalog.paths(directory=cases)
+        start = time.perf_counter()
+        fingerprints = [digest for _, digest, _ in iter_case_files(paths)]
+        hashing = time.perf_counter() - start
+        start = time.perf_counter()
+        entries = catalog.entries(paths)
+        lookup = time.perf_counter() - start
+        assert fingerprints == [entries[path].fingerprint for path in paths]
+
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            filtered = catalog.cases(scenario="Worst", search="_01", order_by="mtime_ns", limit=50)
+        catalog_query = (time.perf_counter() - start) / args.repeats
+
+        for index, path in enumerate(paths[: len(paths) // 2]):
+            catalog.store_kpis(path, entries[path].fingerprint, {"irr": index / len(paths)})
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            ranked = catalog.paths(directory=cases, order_by="irr", descending=True)
+        kpi_order = (time.perf_counter() - start) / args.repeats
+        assert len(ranked) == len(paths) and ranked[0] == paths[len(paths) // 2 - 1]
+
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            catalog.refresh(force=True)
+        unchanged = (time.perf_counter() - start) / args.repeats
+
+        touched = max(1, args.cases // 100)
+        shutil.copy(cases / "case_00000.json", cases / "extra.json")
+        for index in range(touched):
+            data["scenario"] = "Best"
+            (cases / f"case_{index:05d}.json").write_text(json.dumps(data), encoding="utf-8")
+        start = time.perf_counter()
+        changed = catalog.refresh(force=True)
+        incremental = time.perf_counter() - start
+
+    print(f"cases:       {args.cases} ({len(filtered)} in filtered query)")
+    print(f"index:       {initial * 1e3:8.2f} ms (first scan, hashes every file)")
+    print(f"glob:        {glob_listing * 1e3:8.2f} ms per listing")
+    print(
+        f"catalog:     {catalog_listing * 1e3:8.2f} ms per listing "
+        f"({glob_listing / catalog_listing:.1f}x faster than glob)"
+    )
+    print(f"hash:        {hashing * 1e3:8.2f} ms (read + fingerprint every file, old leaderboard)")
+    print(f"entries:     {lookup * 1e3:8.2f} ms (catalog fingerprints and KPIs)")
+    print(f"query:       {catalog_query * 1e3:8.2f} ms (scenario + name filter, mtime order)")
+    print(f"ranking:     {kpi_order * 1e3:8.2f} ms per listing (IRR order, half without KPIs)")
+    print(f"poll:        {unchanged * 1e3:8.2f} ms (stat-only refresh, nothing changed)")
+    print(f"incremental: {incremental * 1e3:8.2f} ms ({changed} changed files re-hashed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from dataclasses import asdict, replace
+from pathlib import Path
+
+from state.history import CaseHistory, diff_assumptions
+from state.persistence import load_assumptions
+from state.schema import build_assumptions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the content-addressed case history.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--versions", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    assumptions = load_assumptions(args.case)
+    versions = []
+    for _ in range(args.versions):
+        financing = replace(
+            assumptions.financing, interest_rate_pct=round(rng.uniform(0.03, 0.09), 4)
+        )
+        transaction = replace(
+            assumptions.transaction_and_financing,
+            purchase_price_eur=round(rng.uniform(4e6, 6e6), -3),
+        )
+        assumptions = replace(
+            assumptions, financing=financing, transaction_and_financing=transaction
+        )
+        versions.append(asdict(assumptions))
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "history.sqlite3"
+        history = CaseHistory(database)
+        start = time.perf_counter()
+        keys = [history.commit("case.json", data, "Saved") for data in versions]
+        commit = (time.perf_counter() - start) / len(versions)
+
+        start = time.perf_counter()
+        entries = history.log("case.json")
+        log = time.perf_counter() - start
+        assert [entry.version for entry in entries] == keys[::-1]
+
+        start = time.perf_counter()
+        checkouts = [history.checkout(key) for key in keys[-20:]]
+        checkout = (time.perf_counter() - start) / len(checkouts)
+        assert checkouts[-1] == versions[-1]
+
+        start = time.perf_counter()
+        changes = history.diff(keys[0], keys[-1])
+        diff = time.perf_counter() - start
+
+        old, new = build_assumptions(versions[0]), build_assumptions(versions[-1])
+        start = time.perf_counter()
+        for _ in range(100):
+            diff_assumptions(old, new)
+        leaf_diff = (time.perf_counter() - start) / 100
+
+        stats = history.stats()
+        history._connection.execute("VACUUM")
+        stored = database.stat().st_size
+        full = sum(len(json.dumps(data, indent=2)) for data in versions)
+
+    keyframes = stats["objects"] - stats["deltas"]
+    print(f"versions:    {args.versions} ({stats['deltas']} deltas, {keyframes} keyframes)")
+    print(f"storage:     {stored / 1024:8.1f} KiB on disk ({stats['payload_bytes'] / 1024:.1f} KiB payload)")
+    print(f"full copies: {full / 1024:8.1f} KiB")
+    print(f"commit:      {commit * 1e3:8.3f} ms per version")
+    print(f"log:         {log * 1e3:8.3f} ms ({len(entries)} entries)")
+    print(f"checkout:    {checkout * 1e3:8.3f} ms per version (delta chain replay)")
+    print(f"diff:        {diff * 1e3:8.3f} ms ({len(changes)} changed leaves, checkout + load both)")
+    print(f"leaf diff:   {leaf_diff * 1e3:8.3f} ms (Assumptions vs Assumptions)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from model.run_model import run_model
+from state.persistence import build_assumptions_reference
+from state.schema import build_assumptions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time loading a large library of case files.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--cases", type=int, default=10_000)
+    parser.add_argument("--model-sample", type=int, default=200)
+    args = parser.parse_args()
+
+    template = json.loads(Path(args.case).read_text(encoding="utf-8"))
+    price = template["transaction_and_financing"]["purchase_price_eur"]
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index in range(args.cases):
+            template["transaction_and_financing"]["purchase_price_eur"] = price * (
+                0.8 + 0.4 * index / max(args.cases - 1, 1)
+            )
+            path = Path(directory) / f"case_{index:05d}.json"
+            path.write_text(json.dumps(template), encoding="utf-8")
+            paths.append(path)
+
+        # Streamed like a portfolio job, so no case outlives its evaluation.
+        read = parse = build = reference = 0.0
+        sample = []
+        for path in paths:
+            start = time.perf_counter()
+            payload = path.read_bytes()
+            parsed = time.perf_counter()
+            data = json.loads(payload)
+            built = time.perf_counter()
+            assumptions = build_assumptions(data)
+            done = time.perf_counter()
+            expected = build_assumptions_reference(data)
+            referenced = time.perf_counter()
+            assert assumptions == expected
+            read += parsed - start
+            parse += built - parsed
+            build += done - built
+            reference += referenced - done
+            if len(sample) < args.model_sample:
+                sample.append(assumptions)
+
+    start = time.perf_counter()
+    for assumptions in sample:
+        run_model(assumptions)
+    model = (time.perf_counter() - start) / len(sample)
+
+    print(f"cases:       {args.cases} from {args.case}")
+    print(f"read:        {read:8.3f} s ({read / args.cases * 1e6:7.1f} us per case)")
+    print(f"json:        {parse:8.3f} s ({parse / args.cases * 1e6:7.1f} us per case)")
+    print(f"build:       {build:8.3f} s ({build / args.cases * 1e6:7.1f} us per case, schema loader)")
+    print(
+        f"reference:   {reference:8.3f} s ({reference / args.cases * 1e6:7.1f} us per case, "
+        f"merge loader, {reference / build:.1f}x slower)"
+    )
+    print(f"run_model:   {model * 1e6:8.1f} us per case (mean of {len(sample)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import argparse
+
+from benchmarks.run_model_latency import _time_per_call
+from model.data_table import grid_axis, run_data_table
+from model.run_model import run_model
+from state.persistence import load_assumptions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time a batched two-way data table.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--rows", default="transaction_and_financing.purchase_price_eur")
+    parser.add_argument("--columns", default="financing.interest_rate_pct")
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    assumptions = load_assumptions(args.case)
+    row_value, column_value = (
+        _current_value(assumptions, path) for path in (args.rows, args.columns)
+    )
+    rows = grid_axis(args.rows, row_value * 0.8, row_value * 1.2, args.steps)
+    columns = grid_axis(args.columns, column_value * 0.8, column_value * 1.2, args.steps)
+    cells = args.steps * args.steps
+    batched = _time_per_call(
+        lambda a: run_data_table(a, rows, columns), assumptions, args.iterations
+    )
+    single = _time_per_call(run_model, assumptions, args.iterations * 10)
+    table = run_data_table(assumptions, rows, columns)
+    print(f"case:        {args.case} ({args.steps} x {args.steps} = {cells} cells)")
+    print(f"batched:     {batched * 1e3:8.1f} ms")
+    print(f"sequential:  {single * cells * 1e3:8.1f} ms (estimated from run_model)")
+    print(f"failed:      {len(table.errors)} cells")
+
+
+def _current_value(assumptions: object, path: str) -> float:
+    value = assumptions
+    for part in path.split("."):
+        value = value[int(part)] if isinstance(value, list) else getattr(value, part)
+    return float(value)
+
+
+if __name__ == "__main__":
+    main()
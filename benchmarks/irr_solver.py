@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from model.irr import irr_many, solve_irr
+from state.persistence import load_assumptions
+from model.run_model import run_model
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare scalar and batched IRR solvers.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    base = np.asarray(run_model(load_assumptions(args.case)).equity["equity_cashflows"])
+    rng = np.random.default_rng(args.seed)
+    cashflows = np.repeat(base[None, :], args.size, axis=0)
+    cashflows[:, -1] *= rng.uniform(0.0, 3.0, args.size)
+
+    start = time.perf_counter()
+    scalar = np.array(
+        [np.nan if irr is None else irr for irr in map(solve_irr, cashflows.tolist())]
+    )
+    scalar_time = time.perf_counter() - start
+    start = time.perf_counter()
+    batched = irr_many(cashflows)
+    batched_time = time.perf_counter() - start
+
+    if not np.allclose(scalar, batched, equal_nan=True):
+        raise SystemExit("irr_many differs from solve_irr.")
+    print(f"case:      {args.case} ({args.size} cash-flow vectors)")
+    print(f"solve_irr: {scalar_time * 1e3:8.1f} ms ({scalar_time / args.size * 1e6:.1f} us/vector)")
+    print(f"irr_many:  {batched_time * 1e3:8.1f} ms ({batched_time / args.size * 1e6:.2f} us/vector)")
+    print(f"speedup:   {scalar_time / batched_time:8.1f}x")
+    print(f"no IRR:    {int(np.isnan(batched).sum())} vectors")
+
+
+if __name__ == "__main__":
+    main()
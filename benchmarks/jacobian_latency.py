@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import argparse
+
+from benchmarks.run_model_latency import _time_per_call
+from model.autodiff import run_jacobian
+from model.run_model import run_model
+from model.sensitivity import run_sensitivity, sensitivity_leaves
+from state.persistence import load_assumptions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the forward-mode Jacobian.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    assumptions = load_assumptions(args.case)
+    leaves = sensitivity_leaves(assumptions)
+    forward = _time_per_call(run_jacobian, assumptions, args.iterations)
+    bumped = _time_per_call(run_sensitivity, assumptions, args.iterations)
+    single = _time_per_call(run_model, assumptions, args.iterations * 10)
+    print(f"case:        {args.case} ({len(leaves)} drivers)")
+    print(f"forward:     {forward * 1e3:8.1f} ms (values + Jacobian, one pass)")
+    print(f"bumped:      {bumped * 1e3:8.1f} ms (batched tornado, {2 * len(leaves) + 1} variants)")
+    print(f"sequential:  {single * (len(leaves) + 1) * 1e3:8.1f} ms (estimated, one-sided bumps)")
+    result = run_jacobian(assumptions)
+    for leaf, derivative, impact in result.ranking("irr", top=3):
+        print(f"irr <- {leaf.label:<40} d/dx {derivative:,.4g}  +1%: {impact:,.4g}")
+
+
+if __name__ == "__main__":
+    main()
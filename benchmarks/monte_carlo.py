@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from model.simulation import (
+    DEFAULT_CHUNK_SIZE,
+    normal,
+    pool_workers,
+    run_monte_carlo,
+    triangular,
+    uniform,
+)
+from state.persistence import load_assumptions
+
+DRIVERS = {
+    "utilization_rate_pct": normal(1.0, 0.08),
+    "group_day_rate_eur": triangular(0.85, 1.0, 1.1),
+    "consultant_fte": normal(0.0, 1.5, apply="shift", per_year=True),
+    "consultant_loaded_cost_eur": uniform(0.95, 1.1),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time a Monte Carlo run over revenue and cost drivers.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--paths", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    assumptions = load_assumptions(args.case)
+    print(f"case: {args.case} ({args.paths} paths)")
+    for workers in args.workers:
+        start = time.perf_counter()
+        result = run_monte_carlo(assumptions, DRIVERS, args.paths, args.seed, workers=workers)
+        elapsed = time.perf_counter() - start
+        used = pool_workers(workers, args.paths, -(-args.paths // DEFAULT_CHUNK_SIZE))
+        print(
+            f"workers={workers} ({used} used): {elapsed:6.2f} s "
+            f"({elapsed / args.paths * 1e6:5.1f} us/path), "
+            f"breach probability {result.breach_probability:.1%}, "
+            f"median IRR {result.band('irr', 50.0):.1%}, "
+            f"P5 IRR {result.band('irr', 5.0):.1%}, no IRR {result.no_irr_probability:.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+import tempfile
+import time
+from dataclasses import asdict, replace
+from pathlib import Path
+
+from state import journal
+from state.catalog import CaseCatalog
+from state.journal import case_journal, read_case_data
+from state.persistence import load_assumptions
+from state.schema import build_assumptions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time overlay cases derived from one parent.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--cases", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        parent = root / "base_case.json"
+        shutil.copy(args.case, parent)
+        cases = root / "cases"
+        cases.mkdir()
+        base = load_assumptions(parent)
+        paths = []
+        for index in range(args.cases):
+            variant = replace(
+                base,
+                financing=replace(base.financing, interest_rate_pct=rng.uniform(0.03, 0.09)),
+                tax_and_distributions=replace(
+                    base.tax_and_distributions, tax_rate_pct=rng.uniform(0.2, 0.35)
+                ),
+            )
+            path = cases / f"case_{index:05d}.json"
+            case_journal(path).compact(asdict(variant), parent=parent)
+            paths.append(path)
+        overlay_bytes = sum(path.stat().st_size for path in paths)
+        full_bytes = parent.stat().st_size * args.cases
+
+        catalog = CaseCatalog(root / "catalog.sqlite3", (root, cases))
+        journal._RESOLVED.clear()
+        journal._NORMALIZED.clear()
+        start = time.perf_counter()
+        resolved = [build_assumptions(read_case_data(path)) for path in paths]
+        cold = (time.perf_counter() - start) / len(paths)
+        start = time.perf_counter()
+        for path in paths:
+            build_assumptions(read_case_data(path))
+        warm = (time.perf_counter() - start) / len(paths)
+        catalog.refresh(force=True)
+
+        data = json.loads(parent.read_text(encoding="utf-8"))
+        data["transaction_and_financing"]["purchase_price_eur"] *= 0.9
+        parent.write_text(json.dumps(data), encoding="utf-8")
+        start = time.perf_counter()
+        updated = [build_assumptions(read_case_data(path)) for path in paths]
+        after = (time.perf_counter() - start) / len(paths)
+        start = time.perf_counter()
+        changed = catalog.refresh(force=True)
+        invalidate = time.perf_counter() - start
+        assert all(
+            case.transaction_and_financing.purchase_price_eur
+            == data["transaction_and_financing"]["purchase_price_eur"]
+            and case.financing == previous.financing
+            for case, previous in zip(updated, resolved)
+        )
+
+    print(f"cases:       {args.cases} overlays of {args.case}")
+    print(f"storage:     {overlay_bytes / 1024:8.1f} KiB as overlays")
+    print(f"full copies: {full_bytes / 1024:8.1f} KiB")
+    print(f"resolve:     {cold * 1e6:8.1f} us per case cold, {warm * 1e6:.1f} us cached")
+    print(f"re-resolve:  {after * 1e6:8.1f} us per case after the parent changed")
+    print(f"catalog:     {invalidate * 1e3:8.1f} ms refresh ({changed} cases re-fingerprinted)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import argparse
+
+from benchmarks.run_model_latency import _time_per_call
+from model.periodic import PERIODICITIES, run_model_periodic
+from model.run_model import run_model
+from state.assumptions import with_planning_years
+from state.persistence import load_assumptions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare sub-annual engine latency with run_model.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    assumptions = with_planning_years(load_assumptions(args.case), args.years)
+    annual = _time_per_call(run_model, assumptions, args.iterations)
+    print(f"case: {args.case} ({args.years} years)")
+    print(f"run_model:          {annual * 1e6:8.1f} us/call")
+    for periodicity, periods_per_year in PERIODICITIES.items():
+        elapsed = _time_per_call(
+            lambda a: run_model_periodic(a, periodicity), assumptions, args.iterations
+        )
+        print(
+            f"{periodicity:<9} {args.years * periods_per_year:>3} periods: "
+            f"{elapsed * 1e6:8.1f} us/call ({elapsed / annual:4.1f}x run_model)"
+        )
+
+
+if __name__ == "__main__":
+    main()
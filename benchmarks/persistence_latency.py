@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import argparse
+import shutil
+import tempfile
+import time
+from dataclasses import asdict, replace
+from pathlib import Path
+
+from state.cases import load_case
+from state.journal import case_journal
+from state.persistence import _write_json_atomic, load_assumptions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time journaled case edits against full rewrites.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--edits", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "case.json"
+        shutil.copy(args.case, path)
+        assumptions = load_assumptions(path)
+        edits = [
+            replace(
+                assumptions,
+                financing=replace(assumptions.financing, interest_rate_pct=0.05 + index * 1e-5),
+            )
+            for index in range(args.edits)
+        ]
+
+        snapshots = [asdict(edit) for edit in edits]
+
+        start = time.perf_counter()
+        for data in snapshots:
+            _write_json_atomic(data, path)
+        rewrite = (time.perf_counter() - start) / len(edits)
+
+        _write_json_atomic(asdict(assumptions), path)
+        journal = case_journal(path)
+        original = asdict(assumptions)
+        start = time.perf_counter()
+        for data in snapshots:
+            journal.record(data, original)
+            original = data
+        record = (time.perf_counter() - start) / len(edits)
+
+        start = time.perf_counter()
+        journal.flush()
+        flush = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded = load_case(path)
+        replay = time.perf_counter() - start
+        start = time.perf_counter()
+        journal.compact()
+        compact = time.perf_counter() - start
+        assert loaded == edits[-1]
+
+    print(f"case:        {args.case} ({args.edits} edits)")
+    print(f"rewrite:     {rewrite * 1e3:8.3f} ms per edit (atomic full snapshot)")
+    print(f"journal:     {record * 1e3:8.3f} ms per edit (diff + debounced append)")
+    print(f"flush:       {flush * 1e3:8.3f} ms")
+    print(f"load:        {replay * 1e3:8.3f} ms (snapshot + journal replay)")
+    print(f"compact:     {compact * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import argparse
+
+from benchmarks.run_model_latency import _time_per_call
+from model.run_model import run_model_fused, run_model_reference
+from state.assumptions import with_planning_years
+from state.persistence import load_assumptions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure run_model cost by planning horizon.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--horizons", type=int, nargs="+", default=[5, 10, 15, 20, 30, 40])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    base = load_assumptions(args.case)
+    print(f"case: {args.case}")
+    print(f"{'years':>5} {'reference us':>13} {'fused us':>10} {'fused us/year':>14}")
+    for years in args.horizons:
+        assumptions = with_planning_years(base, years)
+        if run_model_fused(assumptions) != run_model_reference(assumptions):
+            raise SystemExit(f"Fused engine output differs at {years} years.")
+        reference = _time_per_call(run_model_reference, assumptions, args.iterations)
+        fused = _time_per_call(run_model_fused, assumptions, args.iterations)
+        print(
+            f"{years:>5} {reference * 1e6:>13.1f} {fused * 1e6:>10.1f} "
+            f"{fused * 1e6 / years:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
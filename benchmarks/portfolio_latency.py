@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from model.memo import ResultCache
+from model.portfolio import PORTFOLIO_BATCH_SIZE, pool_workers, run_portfolio
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the case-library portfolio runner.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--cases", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    template = json.loads(Path(args.case).read_text(encoding="utf-8"))
+    price = template["transaction_and_financing"]["purchase_price_eur"]
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index in range(args.cases):
+            template["transaction_and_financing"]["purchase_price_eur"] = price * (
+                0.8 + 0.4 * index / max(args.cases - 1, 1)
+            )
+            path = Path(directory) / f"case_{index:05d}.json"
+            path.write_text(json.dumps(template), encoding="utf-8")
+            paths.append(str(path))
+
+        print(f"case:        {args.case} ({args.cases} variants)")
+        for workers in args.workers:
+            start = time.perf_counter()
+            run_portfolio(paths, workers=workers)
+            elapsed = time.perf_counter() - start
+            used = pool_workers(workers, args.cases, -(-args.cases // PORTFOLIO_BATCH_SIZE))
+            print(
+                f"workers={workers}:  {elapsed * 1e3:8.1f} ms "
+                f"({elapsed / args.cases * 1e3:.2f} ms per case, {used} used)"
+            )
+
+        cache = ResultCache(max_entries=args.cases)
+        run_portfolio(paths, cache=cache)
+        Path(paths[0]).write_text(json.dumps(template), encoding="utf-8")
+        start = time.perf_counter()
+        run_portfolio(paths, cache=cache)
+        print(f"one changed: {(time.perf_counter() - start) * 1e3:8.1f} ms (cached fingerprints)")
+
+
+if __name__ == "__main__":
+    main()
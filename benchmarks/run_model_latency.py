@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from model.irr import solve_irr
+from model.run_model import run_model_fused, run_model_reference
+from state.persistence import load_assumptions
+
+
+def _time_per_call(engine, assumptions, iterations: int, repeats: int = 5) -> float:
+    engine(assumptions)
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            engine(assumptions)
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare run_model engine latency.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    assumptions = load_assumptions(args.case)
+    if run_model_fused(assumptions) != run_model_reference(assumptions):
+        raise SystemExit("Fused engine output differs from the reference engine.")
+
+    reference = _time_per_call(run_model_reference, assumptions, args.iterations)
+    fused = _time_per_call(run_model_fused, assumptions, args.iterations)
+    cashflows = run_model_fused(assumptions).equity["equity_cashflows"]
+    irr = _time_per_call(solve_irr, cashflows, args.iterations)
+    print(f"case:      {args.case}")
+    print(f"reference: {reference * 1e6:8.1f} us/call")
+    print(f"fused:     {fused * 1e6:8.1f} us/call")
+    print(f"speedup:   {reference / fused:8.2f}x")
+    print(f"irr share: {irr * 1e6:8.1f} us/call (shared by both engines)")
+    print(f"speedup excluding irr: {(reference - irr) / (fused - irr):8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
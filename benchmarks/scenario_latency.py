@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import argparse
+
+from benchmarks.run_model_latency import _time_per_call
+from model.cache import RESULT_CACHE, cached_run_all_scenarios
+from model.run_model import run_model
+from model.scenarios import run_all_scenarios, scenario_variants
+from model.stages import STAGE_GRAPH, run_model_incremental, stage_stats
+from state.persistence import load_assumptions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time evaluating every scenario of a case.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    assumptions = load_assumptions(args.case)
+    variants = list(scenario_variants(assumptions).values())
+
+    def all_at_once(case):
+        STAGE_GRAPH.clear()
+        return run_all_scenarios(case)
+
+    def separately(case):
+        results = []
+        for variant in variants:
+            STAGE_GRAPH.clear()
+            results.append(run_model_incremental(variant))
+        return results
+
+    shared = _time_per_call(all_at_once, assumptions, args.iterations)
+    unshared = _time_per_call(separately, assumptions, args.iterations)
+    fused = _time_per_call(lambda case: [run_model(variant) for variant in variants], assumptions, args.iterations)
+    before = {name: stats["hits"] for name, stats in stage_stats().items()}
+    all_at_once(assumptions)
+    hits = {name: stats["hits"] - before[name] for name, stats in stage_stats().items()}
+    RESULT_CACHE.clear()
+    cached_run_all_scenarios(assumptions)
+    warm = _time_per_call(cached_run_all_scenarios, assumptions, args.iterations)
+    print(f"case:         {args.case} ({len(variants)} scenarios)")
+    print(f"all at once:  {shared * 1e3:8.2f} ms (shared stages: "
+          + ", ".join(f"{name} {count}" for name, count in hits.items() if count) + " hits)")
+    print(f"separately:   {unshared * 1e3:8.2f} ms (stage graph, nothing shared)")
+    print(f"fused:        {fused * 1e3:8.2f} ms (fused engine per scenario)")
+    print(f"cached:       {warm * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import argparse
+
+from benchmarks.run_model_latency import _time_per_call
+from model.run_model import run_model
+from model.sensitivity import SENSITIVITY_METRICS, run_sensitivity, sensitivity_leaves
+from state.persistence import load_assumptions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the batched tornado sensitivity.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--bump", type=float, default=0.1)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    assumptions = load_assumptions(args.case)
+    leaves = sensitivity_leaves(assumptions)
+    batched = _time_per_call(
+        lambda a: run_sensitivity(a, args.bump), assumptions, args.iterations
+    )
+    single = _time_per_call(run_model, assumptions, args.iterations * 10)
+    print(f"case:        {args.case} ({len(leaves)} leaves, {2 * len(leaves) + 1} variants)")
+    print(f"batched:     {batched * 1e3:8.1f} ms")
+    print(f"sequential:  {single * (2 * len(leaves) + 1) * 1e3:8.1f} ms (estimated from run_model)")
+    result = run_sensitivity(assumptions, args.bump)
+    for metric in SENSITIVITY_METRICS:
+        top = result.tornado(metric, 1)[0]
+        print(f"top {metric:<10} {top.leaf.label} (swing {top.swing:,.4g})")
+
+
+if __name__ == "__main__":
+    main()
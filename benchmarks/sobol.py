@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from model.global_sensitivity import DEFAULT_FACTORS, SOBOL_METRICS, run_sobol
+from state.persistence import load_assumptions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time Sobol indices over revenue and cost drivers.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--samples", type=int, default=12_500)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    assumptions = load_assumptions(args.case)
+    evaluations = args.samples * (len(DEFAULT_FACTORS) + 2)
+    print(f"case: {args.case} ({args.samples} samples, {evaluations} evaluations)")
+    for workers in args.workers:
+        start = time.perf_counter()
+        result = run_sobol(assumptions, samples=args.samples, seed=args.seed, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"workers={workers}: {elapsed:6.2f} s ({elapsed / evaluations * 1e6:5.1f} us/evaluation)")
+    for metric in SOBOL_METRICS:
+        print(f"{metric}:")
+        for factor, first, total in result.ranking(metric):
+            print(f"  {factor:<28} S1 {first:6.3f}  ST {total:6.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from model.run_model import run_model
+from model.stress import stress_frontier
+from state.persistence import load_assumptions
+from ui.pages.quick_adjust import _apply_quick_inputs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the covenant stress frontier.")
+    parser.add_argument("--case", default="data/base_case.json")
+    args = parser.parse_args()
+
+    assumptions = load_assumptions(args.case)
+    utilization = range(-30, 31)
+    pricing = range(-20, 6)
+    start = time.perf_counter()
+    frontier = stress_frontier(assumptions, utilization, pricing)
+    batched = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(200):
+        run_model(_apply_quick_inputs(assumptions, -5, -5, 10))
+    single = (time.perf_counter() - start) / 200
+    print(f"case:        {args.case} ({len(utilization)} x {len(pricing)} stress grid)")
+    print(f"frontier:    {batched * 1e3:8.1f} ms ({frontier.evaluations} evaluations)")
+    print(
+        f"sequential:  {single * frontier.evaluations * 1e3:8.1f} ms "
+        "(estimated, replace + run_model per point)"
+    )
+
+
+if __name__ == "__main__":
+    main()
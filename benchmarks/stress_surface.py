@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from model.run_model import run_model
+from model.stress import stress_surface
+from state.persistence import load_assumptions
+from ui.pages.quick_adjust import _apply_quick_inputs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the precomputed stress surface.")
+    parser.add_argument("--case", default="data/base_case.json")
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    assumptions = load_assumptions(args.case)
+    utilization = range(-30, 31)
+    pricing = range(-20, 6)
+    cost = range(0, 151)
+    start = time.perf_counter()
+    surface = stress_surface(assumptions, utilization, pricing, cost)
+    build = time.perf_counter() - start
+
+    points = [
+        (utilization[i % len(utilization)], pricing[i % len(pricing)], cost[i % len(cost)])
+        for i in range(args.lookups)
+    ]
+    start = time.perf_counter()
+    for point in points:
+        surface.operating_result(*point)
+    lookup = (time.perf_counter() - start) / len(points)
+
+    start = time.perf_counter()
+    for point in points[:200]:
+        run_model(_apply_quick_inputs(assumptions, *point))
+    recompute = (time.perf_counter() - start) / min(200, len(points))
+    lattice = len(utilization) * len(pricing) * len(cost)
+    print(f"case:        {args.case} ({lattice} lattice points)")
+    print(f"build:       {build * 1e3:8.1f} ms, {surface.nbytes / 1e6:.2f} MB")
+    print(f"lookup:      {lookup * 1e6:8.1f} us")
+    print(f"recompute:   {recompute * 1e6:8.1f} us (replace + run_model)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,467 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from model.batch import (
+    _apply_dscr,
+    _balance_sheet_kernel,
+    _cashflow_kernel,
+    _cost_kernel,
+    _investment_kernel,
+    _pnl_kernel,
+    _revenue_kernel,
+    _solve_debt,
+    pack_assumptions,
+)
+from model.irr import irr_many
+from model.sensitivity import _LINKED_FIELDS, SensitivityLeaf, sensitivity_leaves
+from state.assumptions import Assumptions
+
+JACOBIAN_METRICS = {
+    "irr": None,
+    "net_income": ("pnl", "net_income"),
+    "cash_balance": ("cashflow", "cash_balance"),
+    "dscr": ("debt", "dscr"),
+}
+
+
+class Dual:
+    # An array of values with one tangent per seeded direction on a trailing
+    # axis, so value shapes broadcast exactly as they would for plain arrays.
+    # A tangent may be shared with another Dual or be a broadcast view; it is
+    # copied on the first write.
+    __slots__ = ("value", "tangent", "_shared")
+    __hash__ = None
+
+    def __init__(self, value: np.ndarray, tangent: np.ndarray, shared: bool = False) -> None:
+        self.value = value
+        self.tangent = tangent
+        self._shared = shared
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.value.shape
+
+    @property
+    def ndim(self) -> int:
+        return self.value.ndim
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.value.dtype
+
+    @property
+    def directions(self) -> int:
+        return self.tangent.shape[-1]
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __repr__(self) -> str:
+        return f"Dual({self.value!r}, directions={self.directions})"
+
+    def __format__(self, spec: str) -> str:
+        return format(self.value, spec)
+
+    def __array__(self, dtype=None, copy=None):
+        raise TypeError("Dual values cannot be converted to plain arrays; use .value.")
+
+    def __getitem__(self, key) -> Dual:
+        return Dual(self.value[key], self.tangent[_tangent_key(key)], self._shared)
+
+    def __setitem__(self, key, other) -> None:
+        if self._shared:
+            self.tangent = self.tangent.copy()
+            self._shared = False
+        tangent_key = _tangent_key(key)
+        if isinstance(other, Dual):
+            self.value[key] = other.value
+            self.tangent[tangent_key] = other.tangent
+        else:
+            self.value[key] = other
+            self.tangent[tangent_key] = 0.0
+
+    def copy(self) -> Dual:
+        return Dual(self.value.copy(), self.tangent.copy())
+
+    def min(self, axis: int) -> Dual:
+        return self._extreme(axis, np.min)
+
+    def max(self, axis: int) -> Dual:
+        return self._extreme(axis, np.max)
+
+    def _extreme(self, axis: int, reduce) -> Dual:
+        value = reduce(self.value, axis=axis)
+        tied = self.value == np.expand_dims(value, axis)
+        # At a tie the extreme moves with the tied entry that moves it first.
+        fill = np.inf if reduce is np.min else -np.inf
+        tangent = reduce(np.where(tied[..., None], self.tangent, fill), axis=axis % self.ndim)
+        return Dual(value, np.where(np.isnan(value)[..., None], np.nan, tangent))
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return _dual(self.value + other.value, self.tangent + other.tangent)
+        return _dual(self.value + other, self.tangent, True)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return _dual(self.value - other.value, self.tangent - other.tangent)
+        return _dual(self.value - other, self.tangent, True)
+
+    def __rsub__(self, other):
+        return _dual(other - self.value, -self.tangent)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return _apply(np.multiply, self, other)
+        return _dual(self.value * other, self.tangent * _lift(other))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return _apply(np.true_divide, self, other)
+        return _dual(self.value / other, self.tangent / _lift(other))
+
+    def __rtruediv__(self, other):
+        return _apply(np.true_divide, other, self)
+
+    def __pow__(self, other):
+        return _apply(np.power, self, other)
+
+    def __rpow__(self, other):
+        return _apply(np.power, other, self)
+
+    def __neg__(self):
+        return Dual(-self.value, -self.tangent)
+
+    def __pos__(self):
+        return _apply(np.positive, self)
+
+    def __abs__(self):
+        return _apply(np.absolute, self)
+
+    def __lt__(self, other):
+        return self.value < _value(other)
+
+    def __le__(self, other):
+        return self.value <= _value(other)
+
+    def __gt__(self, other):
+        return self.value > _value(other)
+
+    def __ge__(self, other):
+        return self.value >= _value(other)
+
+    def __eq__(self, other):
+        return self.value == _value(other)
+
+    def __ne__(self, other):
+        return self.value != _value(other)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if ufunc in _PASSTHROUGH_UFUNCS:
+            return ufunc(*[_value(item) for item in inputs])
+        if ufunc not in _UFUNC_RULES or len(inputs) > 2:
+            return NotImplemented
+        return _apply(ufunc, *inputs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        rule = _FUNCTION_RULES.get(func)
+        if rule is None:
+            return NotImplemented
+        return rule(*args, **kwargs)
+
+
+@dataclass(frozen=True)
+class JacobianResult:
+    leaves: Tuple[SensitivityLeaf, ...]
+    values: Dict[str, np.ndarray]
+    jacobian: Dict[str, np.ndarray]
+    kinks: Dict[str, np.ndarray]
+
+    def gradient(self, metric: str, year: int | None = None) -> np.ndarray:
+        if metric not in JACOBIAN_METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {tuple(JACOBIAN_METRICS)}.")
+        if JACOBIAN_METRICS[metric] is None:
+            return self.jacobian[metric]
+        if year is None:
+            raise ValueError(f"Metric '{metric}' is per year; pass a year.")
+        return self.jacobian[metric][year]
+
+    def ranking(
+        self, metric: str, year: int | None = None, top: int | None = None
+    ) -> List[Tuple[SensitivityLeaf, float, float]]:
+        gradient = self.gradient(metric, year)
+        # Impact of a +1% move in each driver, to compare drivers in different units.
+        impact = gradient * np.array([leaf.value for leaf in self.leaves]) / 100
+        order = np.argsort(-np.nan_to_num(np.abs(impact), nan=-np.inf), kind="stable")[:top]
+        return [
+            (self.leaves[index], float(gradient[index]), float(impact[index]))
+            for index in order
+        ]
+
+
+def run_jacobian(
+    assumptions: Assumptions,
+    leaves: Tuple[SensitivityLeaf, ...] | None = None,
+) -> JacobianResult:
+    if leaves is None:
+        leaves = sensitivity_leaves(assumptions)
+    base = pack_assumptions([assumptions])
+    directions = len(leaves)
+    inputs = {
+        name: Dual(values, np.zeros(values.shape + (directions,)))
+        if values.dtype == np.float64
+        else values
+        for name, values in base.items()
+    }
+    for index, leaf in enumerate(leaves):
+        for name in (leaf.name,) + _LINKED_FIELDS.get(leaf.name, ()):
+            if leaf.year is None:
+                inputs[name].tangent[0, index] = 1.0
+            else:
+                inputs[name].tangent[0, leaf.year, index] = 1.0
+
+    size, years = inputs["workdays_per_year"].shape
+    errors = np.full(size, None, dtype=object)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        revenue = _revenue_kernel(inputs, years)
+        cost = _cost_kernel(inputs, revenue["final_total"], years)
+        debt = _solve_debt(inputs, revenue, cost, years, errors)
+        cashflow = _cashflow_kernel(inputs, revenue, cost, debt, years, errors)
+        pnl = _pnl_kernel(inputs, revenue, cost, cashflow, debt)
+        _apply_dscr(inputs, debt, cashflow)
+        balance_sheet = _balance_sheet_kernel(inputs, pnl, cashflow, debt, years, errors)
+        equity = _investment_kernel(inputs, pnl, balance_sheet, years, _dual_irr)
+    if errors[0] is not None:
+        raise ValueError(errors[0])
+
+    tables = {"pnl": pnl, "cashflow": cashflow, "debt": debt}
+    outputs = {
+        metric: equity["irr"] if path is None else tables[path[0]][path[1]]
+        for metric, path in JACOBIAN_METRICS.items()
+    }
+    guarantee_pct = base["guarantee_pct_by_year"][0]
+    return JacobianResult(
+        leaves=leaves,
+        values={metric: output.value[0] for metric, output in outputs.items()},
+        jacobian={metric: output.tangent[0] for metric, output in outputs.items()},
+        kinks={
+            "guarantee_clamp": (guarantee_pct == 0.0) | (guarantee_pct == 1.0),
+            "guarantee_floor": (
+                revenue["modeled_group_revenue"].value[0]
+                == revenue["guaranteed_floor"].value[0]
+            ),
+            "tax_floor": pnl["ebt"].value[0] == 0.0,
+        },
+    )
+
+
+def _dual_irr(cashflows: Dual) -> Dual:
+    rate = irr_many(cashflows.value)
+    # Implicit function theorem on NPV(rate, cashflows) = 0.
+    periods = np.arange(cashflows.shape[1])
+    discount = (1 + rate)[:, None] ** -periods
+    slope = -np.sum(periods * cashflows.value * discount, axis=1) / (1 + rate)
+    tangent = -np.sum(discount[..., None] * cashflows.tangent, axis=1) / slope[:, None]
+    return Dual(rate, tangent)
+
+
+def _value(item):
+    return item.value if isinstance(item, Dual) else item
+
+
+def _apply(ufunc, first, second=None) -> Dual:
+    # Plain operands carry no tangent rather than a block of zeros.
+    if isinstance(first, Dual):
+        first, first_tangent = first.value, first.tangent
+    else:
+        first_tangent = None
+    if second is None:
+        value = ufunc(first)
+        tangent = _UFUNC_RULES[ufunc](value, first, first_tangent)
+        return _dual(value, tangent, tangent is first_tangent)
+    if isinstance(second, Dual):
+        second, second_tangent = second.value, second.tangent
+    else:
+        second_tangent = None
+    value = ufunc(first, second)
+    tangent = _UFUNC_RULES[ufunc](value, first, second, first_tangent, second_tangent)
+    return _dual(value, tangent, tangent is first_tangent or tangent is second_tangent)
+
+
+def _dual(value: np.ndarray, tangent: np.ndarray, shared: bool = False) -> Dual:
+    target = value.shape + tangent.shape[-1:]
+    if tangent.shape != target:
+        return Dual(value, np.broadcast_to(tangent, target), True)
+    return Dual(value, tangent, shared)
+
+
+def _lift(value):
+    return value[..., None] if isinstance(value, np.ndarray) else value
+
+
+def _tangent_key(key):
+    # Keys index leading axes only, so the directions axis is kept unless an
+    # Ellipsis would swallow it.
+    if type(key) is tuple:
+        for part in key:
+            if part is Ellipsis:
+                return key + (slice(None),)
+        return key
+    return (key, slice(None)) if key is Ellipsis else key
+
+
+def _add(value, a, b, ta, tb):
+    if tb is None:
+        return ta
+    return tb if ta is None else ta + tb
+
+
+def _subtract(value, a, b, ta, tb):
+    if tb is None:
+        return ta
+    return -tb if ta is None else ta - tb
+
+
+def _multiply(value, a, b, ta, tb):
+    if tb is None:
+        return ta * _lift(b)
+    if ta is None:
+        return _lift(a) * tb
+    return ta * _lift(b) + _lift(a) * tb
+
+
+def _divide(value, a, b, ta, tb):
+    if tb is None:
+        return ta / _lift(b)
+    tangent = -_lift(value) * tb if ta is None else ta - _lift(value) * tb
+    return tangent / _lift(b)
+
+
+def _power(value, base, exponent, base_tangent, exponent_tangent):
+    tangent = None
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if base_tangent is not None:
+            slope = np.where(exponent == 0, 0.0, exponent * base ** (exponent - 1.0))
+            tangent = _lift(slope) * base_tangent
+        if exponent_tangent is not None and np.any(exponent_tangent):
+            term = _lift(value * np.log(base)) * exponent_tangent
+            tangent = term if tangent is None else tangent + term
+    if tangent is None:
+        return np.zeros(np.shape(value) + exponent_tangent.shape[-1:])
+    return tangent
+
+
+def _select(pick_first: np.ndarray, pick_second: np.ndarray, tie_rule):
+    # Kinks (ties of max/min, the 0% and 100% guarantee bounds, EBT of zero)
+    # take the one-sided derivative for an increase of each seeded driver.
+    def rule(value, first, second, first_tangent, second_tangent):
+        picked_first = pick_first(first, second)
+        picked_second = pick_second(first, second)
+        if first_tangent is not None and picked_first.all():
+            return first_tangent
+        if second_tangent is not None and picked_second.all():
+            return second_tangent
+        first_tangent = 0.0 if first_tangent is None else first_tangent
+        second_tangent = 0.0 if second_tangent is None else second_tangent
+        if (picked_first | picked_second).all():
+            return np.where(_lift(picked_first), first_tangent, second_tangent)
+        return np.where(
+            _lift(picked_first),
+            first_tangent,
+            np.where(
+                _lift(picked_second),
+                second_tangent,
+                tie_rule(first_tangent, second_tangent),
+            ),
+        )
+
+    return rule
+
+
+def _absolute(value, item, tangent):
+    return np.where(_lift(item > 0), tangent, np.where(_lift(item < 0), -tangent, np.abs(tangent)))
+
+
+_UFUNC_RULES = {
+    np.add: _add,
+    np.subtract: _subtract,
+    np.multiply: _multiply,
+    np.true_divide: _divide,
+    np.negative: lambda value, a, ta: -ta,
+    np.positive: lambda value, a, ta: ta,
+    np.power: _power,
+    np.maximum: _select(np.greater, np.less, np.maximum),
+    np.minimum: _select(np.less, np.greater, np.minimum),
+    np.absolute: _absolute,
+}
+_PASSTHROUGH_UFUNCS = {
+    np.greater,
+    np.greater_equal,
+    np.less,
+    np.less_equal,
+    np.equal,
+    np.not_equal,
+    np.isnan,
+    np.isfinite,
+    np.isinf,
+    np.sign,
+}
+
+
+def _like(prototype, dtype=None, order="K", subok=True, shape=None):
+    shape = prototype.shape if shape is None else tuple(np.atleast_1d(shape))
+    return Dual(np.zeros(shape), np.zeros(shape + (prototype.directions,)))
+
+
+def _where(condition, first, second):
+    condition = np.asarray(_value(condition))
+    first_tangent = first.tangent if isinstance(first, Dual) else None
+    second_tangent = second.tangent if isinstance(second, Dual) else None
+    value = np.where(condition, _value(first), _value(second))
+    if first_tangent is None and second_tangent is None:
+        return value
+    if first_tangent is not None and condition.all():
+        return _dual(value, first_tangent, True)
+    if second_tangent is not None and not condition.any():
+        return _dual(value, second_tangent, True)
+    tangent = np.where(
+        _lift(condition),
+        0.0 if first_tangent is None else first_tangent,
+        0.0 if second_tangent is None else second_tangent,
+    )
+    return _dual(value, tangent)
+
+
+def _clip(item, low, high):
+    return np.minimum(np.maximum(item, low), high)
+
+
+def _repeat(item, repeats, axis):
+    axis %= item.ndim
+    return Dual(np.repeat(item.value, repeats, axis=axis), np.repeat(item.tangent, repeats, axis=axis))
+
+
+def _nan_to_num(item, copy=True, nan=0.0, posinf=None, neginf=None):
+    value = np.nan_to_num(item.value, nan=nan, posinf=posinf, neginf=neginf)
+    replaced = _lift(~np.isfinite(item.value))
+    return Dual(value, np.where(replaced, 0.0, item.tangent))
+
+
+_FUNCTION_RULES = {
+    np.zeros_like: _like,
+    np.empty_like: _like,
+    np.where: _where,
+    np.clip: _clip,
+    np.repeat: _repeat,
+    np.nan_to_num: _nan_to_num,
+}
@@ -0,0 +1,809 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Mapping, Sequence
+
+import numpy as np
+
+from model.columnar import ColumnTable
+from model.irr import irr_many
+from model.run_model import ModelResult, _check_planning_horizon
+from state.assumptions import Assumptions
+
+REVENUE_YEAR_FIELDS = (
+    "workdays_per_year",
+    "utilization_rate_pct",
+    "group_day_rate_eur",
+    "external_day_rate_eur",
+    "day_rate_growth_pct",
+    "revenue_growth_pct",
+    "group_capacity_share_pct",
+    "external_capacity_share_pct",
+    "guarantee_pct_by_year",
+)
+PERSONNEL_FIELDS = (
+    "consultant_fte",
+    "consultant_loaded_cost_eur",
+    "backoffice_fte",
+    "backoffice_loaded_cost_eur",
+    "management_cost_eur",
+)
+FIXED_OVERHEAD_FIELDS = (
+    "advisory_eur",
+    "legal_eur",
+    "it_software_eur",
+    "office_rent_eur",
+    "services_eur",
+    "other_services_eur",
+)
+VARIABLE_COST_PREFIXES = ("training", "travel", "communication")
+SCALAR_SECTIONS = (
+    "transaction_and_financing",
+    "financing",
+    "cashflow",
+    "balance_sheet",
+    "tax_and_distributions",
+    "valuation",
+)
+YEARLY_SECTIONS = {
+    "personnel_by_year": PERSONNEL_FIELDS,
+    "fixed_overhead_by_year": FIXED_OVERHEAD_FIELDS,
+    "variable_costs_by_year": tuple(
+        f"{prefix}_value" for prefix in VARIABLE_COST_PREFIXES
+    ),
+}
+AMORTIZATION_CODES = {"Linear": 0, "Bullet": 1, "Sculpted": 2}
+
+_TEXT_FIELDS = {"amortization_type", "special_repayment_year"}
+
+
+@dataclass
+class BatchResult:
+    size: int
+    years: int
+    tables: Dict[str, Dict[str, np.ndarray]]
+    equity: Dict[str, np.ndarray]
+    valid: np.ndarray
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def column(self, table: str, name: str) -> np.ndarray:
+        return self.tables[table][name]
+
+    @property
+    def irr(self) -> np.ndarray:
+        return self.equity["irr"]
+
+    @property
+    def exit_value(self) -> np.ndarray:
+        return self.equity["exit_value"]
+
+    @property
+    def min_cash(self) -> np.ndarray:
+        return self.tables["cashflow"]["cash_balance"].min(axis=1)
+
+    @property
+    def min_dscr(self) -> np.ndarray:
+        return self.tables["debt"]["dscr"].min(axis=1)
+
+    @property
+    def covenant_breach(self) -> np.ndarray:
+        return self.tables["debt"]["covenant_breach"].any(axis=1)
+
+    def result(self, index: int) -> ModelResult:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Batch index {index} out of range.")
+        if index in self.errors:
+            raise ValueError(self.errors[index])
+        revenue = self.tables["revenue"]
+        return ModelResult(
+            revenue={
+                "revenue_final_by_year": revenue["final_total"][index].tolist(),
+                "components_by_year": _table(revenue, index, self.years),
+            },
+            cost=_table(self.tables["cost"], index, self.years),
+            pnl=_table(self.tables["pnl"], index, self.years, with_year=True),
+            debt=_table(self.tables["debt"], index, self.years, with_year=True),
+            cashflow=_table(self.tables["cashflow"], index, self.years, with_year=True),
+            balance_sheet=_table(
+                self.tables["balance_sheet"], index, self.years, with_year=True
+            ),
+            equity={
+                "initial_equity": float(self.equity["initial_equity"][index]),
+                "equity_cashflows": self.equity["equity_cashflows"][index].tolist(),
+                "exit_value": float(self.equity["exit_value"][index]),
+                "enterprise_value": float(self.equity["enterprise_value"][index]),
+                "net_debt_exit": float(self.equity["net_debt_exit"][index]),
+                "excess_cash_exit": float(self.equity["excess_cash_exit"][index]),
+                "irr": _optional_float(self.equity["irr"][index]),
+            },
+        )
+
+
+def run_model_batch(
+    cases: Assumptions | Sequence[Assumptions],
+    overrides: Mapping[str, object] | None = None,
+) -> BatchResult:
+    if isinstance(cases, Assumptions):
+        inputs = pack_assumptions([cases])
+        size = _override_size(overrides) if overrides else 1
+        inputs = {name: np.repeat(values, size, axis=0) for name, values in inputs.items()}
+    else:
+        cases = list(cases)
+        if not cases:
+            raise ValueError("run_model_batch requires at least one case.")
+        inputs = pack_assumptions(cases)
+    if overrides:
+        apply_overrides(inputs, overrides)
+    return evaluate_batch(inputs)
+
+
+def pack_assumptions(cases: Sequence[Assumptions]) -> Dict[str, np.ndarray]:
+    inputs: Dict[str, np.ndarray] = {}
+    scenarios = []
+    for assumptions in cases:
+        scenario = assumptions.revenue.scenarios.get(assumptions.scenario)
+        if scenario is None:
+            raise ValueError(f"Unknown scenario '{assumptions.scenario}'.")
+        _check_planning_horizon(assumptions)
+        scenarios.append(scenario)
+    horizons = {assumptions.planning_years for assumptions in cases}
+    if len(horizons) > 1:
+        raise ValueError(
+            f"Batch cases must share one planning horizon, got {sorted(horizons)}."
+        )
+
+    inputs["scenario"] = np.array(
+        [assumptions.scenario for assumptions in cases], dtype=object
+    )
+    for name in REVENUE_YEAR_FIELDS:
+        inputs[name] = _float_array([getattr(row, name) for row in scenarios])
+    inputs["reference_revenue_eur"] = _float_array(
+        [row.reference_revenue_eur for row in scenarios]
+    )
+
+    inputs["inflation_apply"] = np.array(
+        [bool(assumptions.cost.inflation_apply) for assumptions in cases]
+    )
+    inputs["inflation_rate_pct"] = _float_array(
+        [assumptions.cost.inflation_rate_pct for assumptions in cases]
+    )
+    for section, names in YEARLY_SECTIONS.items():
+        rows_by_case = [getattr(assumptions.cost, section) for assumptions in cases]
+        for name in names:
+            inputs[name] = _float_array(
+                [[getattr(row, name) for row in rows] for rows in rows_by_case]
+            )
+    for prefix in VARIABLE_COST_PREFIXES:
+        inputs[f"{prefix}_is_pct"] = np.array(
+            [
+                [getattr(row, f"{prefix}_type") == "%" for row in assumptions.cost.variable_costs_by_year]
+                for assumptions in cases
+            ]
+        )
+
+    for section in SCALAR_SECTIONS:
+        values = [getattr(assumptions, section) for assumptions in cases]
+        for name in values[0].__dataclass_fields__:
+            if name in _TEXT_FIELDS:
+                continue
+            raw = [getattr(row, name) for row in values]
+            if any(isinstance(value, str) for value in raw):
+                continue
+            inputs[name] = _float_array(raw)
+    inputs["amortization_type"] = np.array(
+        [
+            AMORTIZATION_CODES.get(assumptions.financing.amortization_type, 0)
+            for assumptions in cases
+        ]
+    )
+    inputs["special_repayment_year"] = _float_array(
+        [
+            -1 if assumptions.financing.special_repayment_year is None
+            else assumptions.financing.special_repayment_year
+            for assumptions in cases
+        ]
+    )
+    return inputs
+
+
+def apply_overrides(
+    inputs: Dict[str, np.ndarray], overrides: Mapping[str, object]
+) -> None:
+    size = inputs["purchase_price_eur"].shape[0]
+    for path, raw_values in overrides.items():
+        name, year_index, scenario = resolve_path(path)
+        if name not in inputs:
+            raise ValueError(f"Unknown override path '{path}'.")
+        target = inputs[name]
+        values = np.asarray(raw_values)
+        if target.dtype == bool:
+            values = values.astype(bool)
+        else:
+            values = values.astype(target.dtype)
+        if values.ndim == 0:
+            values = np.full(size, values)
+        if values.shape[0] != size:
+            raise ValueError(
+                f"Override '{path}' has {values.shape[0]} values for {size} cases."
+            )
+        rows = (
+            slice(None)
+            if scenario is None
+            else np.flatnonzero(inputs["scenario"] == scenario)
+        )
+        if scenario is not None:
+            values = values[rows]
+        if target.ndim == 1:
+            if values.ndim != 1:
+                raise ValueError(f"Override '{path}' must be one value per case.")
+            target[rows] = values
+        elif year_index is not None:
+            target[rows, year_index] = values
+        elif values.ndim == 1:
+            target[rows] = values[:, None]
+        else:
+            target[rows] = values
+
+
+def resolve_path(path: str) -> tuple[str, int | None, str | None]:
+    parts = path.split(".")
+    scenario = None
+    if len(parts) > 2 and parts[0] == "revenue" and parts[1] == "scenarios":
+        scenario = parts[2]
+        parts = parts[3:]
+    year_index = None
+    indexed = [part for part in parts if part.isdigit()]
+    if indexed:
+        year_index = int(indexed[-1])
+        parts = [part for part in parts if not part.isdigit()]
+    if not parts:
+        raise ValueError(f"Unknown override path '{path}'.")
+    return parts[-1], year_index, scenario
+
+
+def evaluate_batch(inputs: Dict[str, np.ndarray]) -> BatchResult:
+    size, years = inputs["workdays_per_year"].shape
+    errors = np.full(size, None, dtype=object)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        revenue = _revenue_kernel(inputs, years)
+        cost = _cost_kernel(inputs, revenue["final_total"], years)
+        debt = _solve_debt(inputs, revenue, cost, years, errors)
+        cashflow = _cashflow_kernel(inputs, revenue, cost, debt, years, errors)
+        pnl = _pnl_kernel(inputs, revenue, cost, cashflow, debt)
+        _apply_dscr(inputs, debt, cashflow)
+        balance_sheet = _balance_sheet_kernel(inputs, pnl, cashflow, debt, years, errors)
+        equity = _investment_kernel(inputs, pnl, balance_sheet, years)
+
+    valid = np.array([message is None for message in errors], dtype=bool)
+    return BatchResult(
+        size=size,
+        years=years,
+        tables={
+            "revenue": revenue,
+            "cost": cost,
+            "pnl": pnl,
+            "debt": debt,
+            "cashflow": cashflow,
+            "balance_sheet": balance_sheet,
+        },
+        equity=equity,
+        valid=valid,
+        errors={
+            int(index): str(errors[index]) for index in np.flatnonzero(~valid)
+        },
+    )
+
+
+def _revenue_kernel(inputs: Dict[str, np.ndarray], years: int) -> Dict[str, np.ndarray]:
+    fte = np.maximum(0.0, inputs["consultant_fte"])
+    group_share = inputs["group_capacity_share_pct"]
+    external_share = inputs["external_capacity_share_pct"]
+    total_share = group_share + external_share
+    positive = total_share > 0
+    group_share = np.where(positive, group_share / total_share, group_share)
+    external_share = np.where(positive, external_share / total_share, external_share)
+
+    growth = 1 + inputs["day_rate_growth_pct"]
+    growth_factor = np.empty_like(growth)
+    for year_index in range(years):
+        growth_factor[:, year_index] = growth[:, year_index] ** year_index
+    group_rate = inputs["group_day_rate_eur"] * growth_factor
+    external_rate = inputs["external_day_rate_eur"] * growth_factor
+
+    capacity_days = fte * inputs["workdays_per_year"] * inputs["utilization_rate_pct"]
+    adjusted_capacity_days = capacity_days * (1 + inputs["revenue_growth_pct"])
+    modeled_group_revenue = adjusted_capacity_days * group_share * group_rate
+    modeled_external_revenue = adjusted_capacity_days * external_share * external_rate
+    modeled_total_revenue = modeled_group_revenue + modeled_external_revenue
+
+    reference_value = np.maximum(0.0, inputs["reference_revenue_eur"])[:, None]
+    guarantee_pct = np.minimum(np.maximum(inputs["guarantee_pct_by_year"], 0.0), 1.0)
+    guaranteed_floor = reference_value * guarantee_pct
+    guaranteed_group_revenue = np.maximum(modeled_group_revenue, guaranteed_floor)
+    final_total = guaranteed_group_revenue + modeled_external_revenue
+    share_guaranteed = np.where(
+        final_total != 0, guaranteed_group_revenue / final_total, 0.0
+    )
+    return {
+        "consulting_fte": fte,
+        "capacity_days": capacity_days,
+        "adjusted_capacity_days": adjusted_capacity_days,
+        "group_share_pct": group_share,
+        "external_share_pct": external_share,
+        "modeled_group_revenue": modeled_group_revenue,
+        "modeled_external_revenue": modeled_external_revenue,
+        "modeled_total_revenue": modeled_total_revenue,
+        "guaranteed_floor": guaranteed_floor,
+        "guaranteed_group_revenue": guaranteed_group_revenue,
+        "final_total": final_total,
+        "share_guaranteed": share_guaranteed,
+    }
+
+
+def _inflation_factor(inputs: Dict[str, np.ndarray], years: int) -> np.ndarray:
+    base = 1 + inputs["inflation_rate_pct"]
+    factor = np.empty_like(base, shape=(base.shape[0], years))
+    for year_index in range(years):
+        factor[:, year_index] = base ** year_index
+    return np.where(inputs["inflation_apply"][:, None], factor, 1.0)
+
+
+def _cost_kernel(
+    inputs: Dict[str, np.ndarray], revenue: np.ndarray, years: int
+) -> Dict[str, np.ndarray]:
+    inflation_factor = _inflation_factor(inputs, years)
+    consultant_total = (
+        np.maximum(0.0, inputs["consultant_fte"])
+        * np.maximum(0.0, inputs["consultant_loaded_cost_eur"])
+        * inflation_factor
+    )
+    backoffice_total = (
+        np.maximum(0.0, inputs["backoffice_fte"])
+        * np.maximum(0.0, inputs["backoffice_loaded_cost_eur"])
+        * inflation_factor
+    )
+    management_total = np.maximum(0.0, inputs["management_cost_eur"]) * inflation_factor
+    personnel_total = consultant_total + backoffice_total + management_total
+
+    fixed_sum = np.zeros_like(revenue)
+    for name in FIXED_OVERHEAD_FIELDS:
+        fixed_sum = fixed_sum + np.maximum(0.0, inputs[name])
+    fixed_total = fixed_sum * inflation_factor
+
+    variable_total = np.zeros_like(revenue)
+    for prefix in VARIABLE_COST_PREFIXES:
+        value = np.maximum(0.0, inputs[f"{prefix}_value"])
+        variable_total = variable_total + np.where(
+            inputs[f"{prefix}_is_pct"], revenue * value, value * inflation_factor
+        )
+
+    overhead_total = fixed_total + variable_total
+    return {
+        "consultant_costs": consultant_total,
+        "backoffice_costs": backoffice_total,
+        "management_costs": management_total,
+        "personnel_costs": personnel_total,
+        "overhead_and_variable_costs": overhead_total,
+        "total_operating_costs": personnel_total + overhead_total,
+    }
+
+
+def _solve_debt(
+    inputs: Dict[str, np.ndarray],
+    revenue: Dict[str, np.ndarray],
+    cost: Dict[str, np.ndarray],
+    years: int,
+    errors: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    debt = _debt_kernel(inputs, years, errors)
+    if not (inputs["amortization_type"] == AMORTIZATION_CODES["Sculpted"]).any():
+        return debt
+    cashflow = _cashflow_kernel(inputs, revenue, cost, debt, years, errors)
+    return _debt_kernel(inputs, years, errors, cashflow)
+
+
+def _debt_kernel(
+    inputs: Dict[str, np.ndarray],
+    years: int,
+    errors: np.ndarray,
+    cashflow: Dict[str, np.ndarray] | None = None,
+) -> Dict[str, np.ndarray]:
+    size = errors.shape[0]
+    initial_debt = inputs["senior_debt_amount_eur"]
+    interest_rate = inputs["interest_rate_pct"]
+    bullet = inputs["amortization_type"] == AMORTIZATION_CODES["Bullet"]
+    sculpted = inputs["amortization_type"] == AMORTIZATION_CODES["Sculpted"]
+    amort_period = inputs["amortization_period_years"]
+    grace_period = inputs["grace_period_years"]
+    special_year = inputs["special_repayment_year"]
+    special_amount = inputs["special_repayment_amount_eur"]
+    min_dscr = inputs["minimum_dscr"]
+    tax_rate = inputs["tax_cash_rate_pct"]
+    tax_lag = inputs["tax_payment_lag_years"]
+    bullet_year = np.maximum(amort_period - 1, 0)
+    _flag(errors, sculpted & (min_dscr <= 0), "Sculpted repayment requires a positive minimum DSCR.")
+
+    columns = {
+        name: np.zeros_like(initial_debt, shape=(size, years))
+        for name in (
+            "opening_debt",
+            "debt_drawdown",
+            "scheduled_repayment",
+            "special_repayment",
+            "total_repayment",
+            "closing_debt",
+            "interest_expense",
+            "debt_service",
+        )
+    }
+    outstanding = np.zeros(size)
+    previous_taxes_due = np.zeros(size)
+    for year_index in range(years):
+        drawdown = initial_debt if year_index == 0 else np.zeros(size)
+        opening = outstanding + drawdown
+        interest = opening * interest_rate
+        in_window = (year_index >= grace_period) & (year_index < amort_period)
+        linear = np.where(in_window, opening / amort_period, 0.0)
+        sculpt = np.zeros(size)
+        if cashflow is not None:
+            ebitda = cashflow["ebitda"][:, year_index]
+            taxes_due = (
+                np.maximum(ebitda - cashflow["depreciation"][:, year_index] - interest, 0)
+                * tax_rate
+            )
+            taxes_paid = np.where(
+                tax_lag == 0,
+                taxes_due,
+                np.where(tax_lag == 1, previous_taxes_due, 0.0),
+            )
+            previous_taxes_due = taxes_due
+            cfads = (
+                ebitda
+                - taxes_paid
+                - cashflow["working_capital_change"][:, year_index]
+                - cashflow["capex"][:, year_index]
+            )
+            sculpt = np.where(
+                in_window & (min_dscr > 0),
+                np.clip(cfads / min_dscr - interest, 0.0, opening),
+                0.0,
+            )
+        scheduled = np.where(
+            bullet,
+            np.where(year_index == bullet_year, opening, 0.0),
+            np.where(sculpted, sculpt, linear),
+        )
+        expected = opening / amort_period
+        _flag(
+            errors,
+            ~bullet
+            & ~sculpted
+            & (year_index >= grace_period)
+            & (opening > 0)
+            & (amort_period != 0)
+            & (np.abs(scheduled - expected) > 1e-6),
+            "Scheduled repayment does not scale with senior debt amount.",
+        )
+        special = np.where(special_year == year_index, special_amount, 0.0)
+        total_repayment = np.minimum(opening, scheduled + special)
+        debt_service = interest + total_repayment
+        active = (initial_debt > 0) & (opening > 0)
+        _flag(errors, active & (interest == 0), "Interest expense is zero with positive debt balance.")
+        _flag(
+            errors,
+            active & ~sculpted & (scheduled == 0),
+            "Scheduled repayment is zero with positive debt balance.",
+        )
+        _flag(errors, active & (debt_service == 0), "Debt service is zero with positive debt balance.")
+        outstanding = np.maximum(opening - total_repayment, 0.0)
+
+        columns["opening_debt"][:, year_index] = opening
+        columns["debt_drawdown"][:, year_index] = drawdown
+        columns["scheduled_repayment"][:, year_index] = scheduled
+        columns["special_repayment"][:, year_index] = special
+        columns["total_repayment"][:, year_index] = total_repayment
+        columns["closing_debt"][:, year_index] = outstanding
+        columns["interest_expense"][:, year_index] = interest
+        columns["debt_service"][:, year_index] = debt_service
+
+    columns["principal_payment"] = columns["total_repayment"]
+    columns["outstanding_principal"] = columns["closing_debt"]
+    columns["minimum_dscr"] = np.repeat(inputs["minimum_dscr"][:, None], years, axis=1)
+    return columns
+
+
+def _cashflow_kernel(
+    inputs: Dict[str, np.ndarray],
+    revenue: Dict[str, np.ndarray],
+    cost: Dict[str, np.ndarray],
+    debt: Dict[str, np.ndarray],
+    years: int,
+    errors: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    size = errors.shape[0]
+    tax_rate = inputs["tax_cash_rate_pct"]
+    tax_lag = inputs["tax_payment_lag_years"]
+    capex_pct = inputs["capex_pct_revenue"]
+    working_capital_pct = inputs["working_capital_pct_revenue"]
+    depreciation_rate = inputs["depreciation_rate_pct"]
+    equity_amount = inputs["equity_contribution_eur"]
+    purchase_price = inputs["purchase_price_eur"]
+
+    final_revenue = revenue["final_total"]
+    ebitda = final_revenue - cost["personnel_costs"] - cost["overhead_and_variable_costs"]
+
+    names = (
+        "ebitda",
+        "depreciation",
+        "taxes_paid",
+        "working_capital_change",
+        "working_capital_balance",
+        "operating_cf",
+        "capex",
+        "acquisition_outflow",
+        "free_cashflow",
+        "debt_drawdown",
+        "equity_injection",
+        "interest_paid",
+        "debt_repayment",
+        "investing_cf",
+        "financing_cf",
+        "net_cashflow",
+        "opening_cash",
+        "cash_balance",
+        "_taxes_due",
+        "_fixed_assets",
+    )
+    columns = {name: np.zeros_like(purchase_price, shape=(size, years)) for name in names}
+    cash_balance = inputs["opening_cash_balance_eur"].copy()
+    fixed_assets = np.zeros(size)
+    working_capital_balance = np.zeros(size)
+    previous_taxes_due = np.zeros(size)
+    for year_index in range(years):
+        year_revenue = final_revenue[:, year_index]
+        year_ebitda = ebitda[:, year_index]
+        interest = debt["interest_expense"][:, year_index]
+        principal_repayment = debt["total_repayment"][:, year_index]
+        debt_drawdown = debt["debt_drawdown"][:, year_index]
+
+        working_capital_current = year_revenue * working_capital_pct
+        working_capital_change = working_capital_current - working_capital_balance
+        working_capital_balance = working_capital_current
+        capex = year_revenue * capex_pct
+
+        depreciation = (fixed_assets + capex) * depreciation_rate
+        fixed_assets = np.maximum(fixed_assets + capex - depreciation, 0.0)
+
+        ebit = year_ebitda - depreciation
+        ebt = ebit - interest
+        taxes_due = np.maximum(ebt, 0) * tax_rate
+        taxes_paid = np.where(
+            tax_lag == 0,
+            taxes_due,
+            np.where(tax_lag == 1, previous_taxes_due, 0.0),
+        )
+        previous_taxes_due = taxes_due
+
+        operating_cf = year_ebitda - taxes_paid - working_capital_change
+        if year_index == 0:
+            equity_injection = equity_amount
+            acquisition_outflow = -purchase_price
+            _flag(
+                errors,
+                debt_drawdown != inputs["initial_debt_eur"],
+                "Year 0 debt drawdown does not match initial debt amount.",
+            )
+        else:
+            equity_injection = np.zeros(size)
+            acquisition_outflow = np.zeros(size)
+
+        investing_cf = -capex + acquisition_outflow
+        free_cashflow = operating_cf + investing_cf
+        if year_index == 0:
+            financing_cf = debt_drawdown + equity_injection - interest - principal_repayment
+        else:
+            financing_cf = -(interest + principal_repayment)
+        net_cashflow = free_cashflow + financing_cf
+        opening_cash = cash_balance
+        cash_balance = cash_balance + net_cashflow
+
+        for name, value in (
+            ("ebitda", year_ebitda),
+            ("depreciation", depreciation),
+            ("taxes_paid", taxes_paid),
+            ("working_capital_change", working_capital_change),
+            ("working_capital_balance", working_capital_balance),
+            ("operating_cf", operating_cf),
+            ("capex", capex),
+            ("acquisition_outflow", acquisition_outflow),
+            ("free_cashflow", free_cashflow),
+            ("debt_drawdown", debt_drawdown),
+            ("equity_injection", equity_injection),
+            ("interest_paid", interest),
+            ("debt_repayment", principal_repayment),
+            ("investing_cf", investing_cf),
+            ("financing_cf", financing_cf),
+            ("net_cashflow", net_cashflow),
+            ("opening_cash", opening_cash),
+            ("cash_balance", cash_balance),
+            ("_taxes_due", taxes_due),
+            ("_fixed_assets", fixed_assets),
+        ):
+            columns[name][:, year_index] = value
+    return columns
+
+
+def _pnl_kernel(
+    inputs: Dict[str, np.ndarray],
+    revenue: Dict[str, np.ndarray],
+    cost: Dict[str, np.ndarray],
+    cashflow: Dict[str, np.ndarray],
+    debt: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    tax_rate = inputs["tax_cash_rate_pct"][:, None]
+    ebitda = cashflow["ebitda"]
+    depreciation = cashflow["depreciation"]
+    ebit = ebitda - depreciation
+    interest = debt["interest_expense"]
+    ebt = ebit - interest
+    taxes = np.maximum(ebt, 0.0) * tax_rate
+    return {
+        "revenue": revenue["final_total"],
+        "personnel_costs": cost["personnel_costs"],
+        "overhead_and_variable_costs": cost["overhead_and_variable_costs"],
+        "ebitda": ebitda,
+        "depreciation": depreciation,
+        "ebit": ebit,
+        "interest_expense": interest,
+        "ebt": ebt,
+        "taxes": taxes,
+        "net_income": ebt - taxes,
+    }
+
+
+def _apply_dscr(
+    inputs: Dict[str, np.ndarray],
+    debt: Dict[str, np.ndarray],
+    cashflow: Dict[str, np.ndarray],
+) -> None:
+    cfads = cashflow["operating_cf"] - cashflow["capex"]
+    debt_service = debt["debt_service"]
+    dscr = np.where(debt_service != 0, cfads / debt_service, 0.0)
+    debt["cfads"] = cfads
+    debt["dscr"] = dscr
+    debt["covenant_breach"] = dscr < inputs["minimum_dscr"][:, None]
+
+
+def _balance_sheet_kernel(
+    inputs: Dict[str, np.ndarray],
+    pnl: Dict[str, np.ndarray],
+    cashflow: Dict[str, np.ndarray],
+    debt: Dict[str, np.ndarray],
+    years: int,
+    errors: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    size = errors.shape[0]
+    cash = cashflow["cash_balance"]
+    fixed_assets = cashflow["_fixed_assets"]
+    working_capital = cashflow["working_capital_balance"]
+    financial_debt = debt["closing_debt"]
+    net_income = pnl["net_income"]
+    acquisition_intangible = np.repeat(inputs["purchase_price_eur"][:, None], years, axis=1)
+    equity_injection = np.zeros_like(net_income)
+    equity_injection[:, 0] = inputs["equity_contribution_eur"]
+    dividends = np.zeros((size, years))
+    equity_buyback = np.zeros((size, years))
+
+    equity_start = np.empty_like(net_income)
+    equity_end = np.empty_like(net_income)
+    tax_payable = np.empty_like(net_income)
+    running_equity = inputs["opening_equity_eur"]
+    running_tax_payable = np.zeros(size)
+    for year_index in range(years):
+        equity_start[:, year_index] = running_equity
+        running_equity = (
+            running_equity
+            + net_income[:, year_index]
+            - dividends[:, year_index]
+            + equity_injection[:, year_index]
+            - equity_buyback[:, year_index]
+        )
+        equity_end[:, year_index] = running_equity
+        running_tax_payable = running_tax_payable + (
+            pnl["taxes"][:, year_index] - cashflow["taxes_paid"][:, year_index]
+        )
+        tax_payable[:, year_index] = running_tax_payable
+
+    total_assets = cash + fixed_assets + working_capital + acquisition_intangible
+    total_liabilities = financial_debt + tax_payable
+    total_liabilities_equity = total_liabilities + equity_end
+    balance_check = total_assets - total_liabilities_equity
+    for year_index in range(years):
+        out_of_balance = np.abs(balance_check[:, year_index]) > 1.0
+        for index in np.flatnonzero(out_of_balance & (errors == None)):  # noqa: E711
+            errors[index] = (
+                f"Balance sheet out of balance in year {year_index}: "
+                f"{balance_check[index, year_index]}"
+            )
+    return {
+        "cash": cash,
+        "fixed_assets": fixed_assets,
+        "acquisition_intangible": acquisition_intangible,
+        "working_capital": working_capital,
+        "total_assets": total_assets,
+        "financial_debt": financial_debt,
+        "tax_payable": tax_payable,
+        "total_liabilities": total_liabilities,
+        "equity_start": equity_start,
+        "net_income": net_income,
+        "dividends": dividends,
+        "equity_injection": equity_injection,
+        "equity_buyback": equity_buyback,
+        "equity_end": equity_end,
+        "total_liabilities_equity": total_liabilities_equity,
+        "balance_check": balance_check,
+    }
+
+
+def _investment_kernel(
+    inputs: Dict[str, np.ndarray],
+    pnl: Dict[str, np.ndarray],
+    balance_sheet: Dict[str, np.ndarray],
+    years: int,
+    irr: Callable[[np.ndarray], np.ndarray] | None = None,
+) -> Dict[str, np.ndarray]:
+    equity_amount = inputs["equity_contribution_eur"]
+    exit_multiple = np.nan_to_num(inputs["seller_multiple"], nan=0.0)
+    enterprise_value = pnl["ebit"][:, -1] * exit_multiple
+    net_debt_exit = balance_sheet["financial_debt"][:, -1]
+    excess_cash = balance_sheet["cash"][:, -1]
+    exit_value = enterprise_value - net_debt_exit + excess_cash
+
+    equity_cashflows = np.zeros_like(equity_amount, shape=(equity_amount.shape[0], years + 1))
+    equity_cashflows[:, 0] = -equity_amount
+    equity_cashflows[:, -1] = 0.0 + exit_value
+    return {
+        "initial_equity": equity_amount,
+        "equity_cashflows": equity_cashflows,
+        "exit_value": exit_value,
+        "enterprise_value": enterprise_value,
+        "net_debt_exit": net_debt_exit,
+        "excess_cash_exit": excess_cash,
+        "irr": (irr or irr_many)(equity_cashflows),
+    }
+
+
+def _flag(errors: np.ndarray, mask: np.ndarray, message: str) -> None:
+    errors[mask & (errors == None)] = message  # noqa: E711
+
+
+def _optional_float(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+def _float_array(values: list) -> np.ndarray:
+    return np.array(values, dtype=float)
+
+
+def _override_size(overrides: Mapping[str, object]) -> int:
+    sizes = {np.asarray(values).shape[0] for values in overrides.values() if np.ndim(values)}
+    if len(sizes) > 1:
+        raise ValueError("All overrides must provide the same number of cases.")
+    return sizes.pop() if sizes else 1
+
+
+def _table(
+    columns: Dict[str, np.ndarray], index: int, years: int, with_year: bool = False
+) -> ColumnTable:
+    table = {"year": np.arange(years)} if with_year else {}
+    table.update(
+        (name, column[index])
+        for name, column in columns.items()
+        if not name.startswith("_")
+    )
+    return ColumnTable.from_columns(table)
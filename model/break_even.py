@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from model.batch import BatchResult, evaluate_batch, pack_assumptions
+from state.assumptions import Assumptions
+
+BREAK_EVEN_DRIVERS = {
+    "utilization": ("utilization_rate_pct",),
+    "day_rate": ("group_day_rate_eur", "external_day_rate_eur"),
+    "consultant_fte": ("consultant_fte",),
+}
+BREAK_EVEN_TARGETS = {
+    "ebitda": ("pnl", "ebitda"),
+    "net_cashflow": ("cashflow", "net_cashflow"),
+    "dscr": ("debt", "dscr"),
+}
+DEFAULT_TOLERANCE = 1e-9
+LINEARITY_TOLERANCE = 1e-7
+DEFAULT_POINTS = 16
+MAX_SCALE = 4.0
+MAX_ITERATIONS = 20
+
+
+@dataclass(frozen=True)
+class BreakEvenResult:
+    driver: str
+    target: str
+    plan: np.ndarray
+    values: np.ndarray
+    methods: Tuple[str, ...]
+
+    @property
+    def headroom(self) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.plan != 0, 1 - self.values / self.plan, np.nan)
+
+
+def solve_break_even(
+    assumptions: Assumptions,
+    target: str = "ebitda",
+    drivers: Sequence[str] = tuple(BREAK_EVEN_DRIVERS),
+    tolerance: float = DEFAULT_TOLERANCE,
+    points: int = DEFAULT_POINTS,
+) -> Dict[str, BreakEvenResult]:
+    if target not in BREAK_EVEN_TARGETS:
+        raise ValueError(f"Unknown break-even target '{target}', expected one of {sorted(BREAK_EVEN_TARGETS)}.")
+    unknown = sorted(set(drivers) - set(BREAK_EVEN_DRIVERS))
+    if unknown:
+        raise ValueError(f"Unknown break-even drivers {unknown}, expected any of {sorted(BREAK_EVEN_DRIVERS)}.")
+    if points < 2:
+        raise ValueError("Break-even root-finding needs at least two points per iteration.")
+    drivers = tuple(drivers)
+    base = pack_assumptions([assumptions])
+    years = base["workdays_per_year"].shape[1]
+    driver_index = np.repeat(np.arange(len(drivers)), years)
+    year_index = np.tile(np.arange(years), len(drivers))
+    count = driver_index.shape[0]
+
+    def residual(problems: np.ndarray, scales: np.ndarray) -> Tuple[np.ndarray, BatchResult]:
+        return _residual(base, drivers, target, driver_index[problems], year_index[problems], scales)
+
+    # Revenue, and with it every target, is linear in each driver until the
+    # guarantee floor or the tax floor kinks it, so two points fix the line.
+    everything = np.arange(count)
+    values, result = residual(
+        np.concatenate([everything[:1], everything]),
+        np.concatenate([[1.0], np.zeros(count)]),
+    )
+    at_plan = _target_residual(result, base, target, np.zeros(count, dtype=int), year_index)
+    at_zero = values[1:]
+    slope = at_plan - at_zero
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(slope != 0, -at_zero / slope, np.nan)
+    check, _ = residual(everything, np.nan_to_num(scale))
+    scale_of_residual = np.abs(at_plan) + np.abs(at_zero) + 1.0
+    closed_form = np.isfinite(scale) & (np.abs(check) <= LINEARITY_TOLERANCE * scale_of_residual)
+    methods = np.where(closed_form, "closed_form", "none").astype(object)
+
+    pending = np.flatnonzero(~closed_form & np.isfinite(at_plan))
+    if pending.size:
+        solved = _bracket(residual, pending, tolerance, points)
+        scale = np.where(closed_form, scale, np.nan)
+        scale[pending] = solved
+        methods[pending[np.isfinite(solved)]] = "root_find"
+    scale = np.where((scale >= 0) & (methods != "none"), scale, np.nan)
+
+    plan = _plan_values(base, result, drivers)
+    return {
+        driver: BreakEvenResult(
+            driver=driver,
+            target=target,
+            plan=plan[index],
+            values=plan[index] * scale[index * years : (index + 1) * years],
+            methods=tuple(methods[index * years : (index + 1) * years]),
+        )
+        for index, driver in enumerate(drivers)
+    }
+
+
+def _bracket(residual, problems: np.ndarray, tolerance: float, points: int) -> np.ndarray:
+    low = np.zeros(problems.size)
+    high = np.full(problems.size, MAX_SCALE)
+    found = np.zeros(problems.size, dtype=bool)
+    low_value = np.full(problems.size, np.nan)
+    high_value = np.full(problems.size, np.nan)
+    steps = np.linspace(0.0, 1.0, points + 1)
+    for iteration in range(MAX_ITERATIONS):
+        active = np.flatnonzero((high - low > tolerance) & (found | (iteration == 0)))
+        if active.size == 0:
+            break
+        grid = low[active, None] + (high - low)[active, None] * steps
+        values, _ = residual(np.repeat(problems[active], points + 1), grid.ravel())
+        values = values.reshape(active.size, points + 1)
+        crossing = (np.sign(values[:, :-1]) * np.sign(values[:, 1:]) <= 0) & np.isfinite(
+            values[:, :-1] * values[:, 1:]
+        )
+        # Prefer the crossing closest to the plan value (scale 1).
+        distance = np.where(crossing, np.abs((grid[:, :-1] + grid[:, 1:]) / 2 - 1.0), np.inf)
+        edge = np.argmin(distance, axis=1)
+        rows = np.arange(active.size)
+        has_crossing = crossing[rows, edge]
+        found[active] = has_crossing
+        low[active] = np.where(has_crossing, grid[rows, edge], low[active])
+        high[active] = np.where(has_crossing, grid[rows, edge + 1], high[active])
+        low_value[active] = values[rows, edge]
+        high_value[active] = values[rows, edge + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = np.where(
+            high_value != low_value, low_value / (low_value - high_value), 0.5
+        )
+    return np.where(found, low + np.clip(weight, 0.0, 1.0) * (high - low), np.nan)
+
+
+def _residual(
+    base: Dict[str, np.ndarray],
+    drivers: Tuple[str, ...],
+    target: str,
+    driver_index: np.ndarray,
+    year_index: np.ndarray,
+    scales: np.ndarray,
+) -> Tuple[np.ndarray, BatchResult]:
+    size = scales.shape[0]
+    inputs = {name: np.repeat(values, size, axis=0) for name, values in base.items()}
+    rows = np.arange(size)
+    for index, driver in enumerate(drivers):
+        selected = driver_index == index
+        for name in BREAK_EVEN_DRIVERS[driver]:
+            inputs[name][rows[selected], year_index[selected]] *= scales[selected]
+    result = evaluate_batch(inputs)
+    return _target_residual(result, inputs, target, rows, year_index), result
+
+
+def _target_residual(
+    result: BatchResult,
+    inputs: Dict[str, np.ndarray],
+    target: str,
+    rows: np.ndarray,
+    year_index: np.ndarray,
+) -> np.ndarray:
+    values = result.column(*BREAK_EVEN_TARGETS[target])[rows, year_index]
+    if target == "dscr":
+        serviced = result.column("debt", "debt_service")[rows, year_index] != 0
+        values = np.where(serviced, values - inputs["minimum_dscr"][rows], np.nan)
+    return np.where(result.valid[rows], values, np.nan)
+
+
+def _plan_values(
+    base: Dict[str, np.ndarray], result: BatchResult, drivers: Tuple[str, ...]
+) -> np.ndarray:
+    plan = []
+    for driver in drivers:
+        if driver == "day_rate":
+            days = result.column("revenue", "adjusted_capacity_days")[0]
+            modeled = result.column("revenue", "modeled_total_revenue")[0]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                plan.append(np.where(days != 0, modeled / days, np.nan))
+        else:
+            plan.append(base[BREAK_EVEN_DRIVERS[driver][0]][0].copy())
+    return np.array(plan)
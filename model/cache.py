@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
+from typing import Dict, List
+
+from model.break_even import BreakEvenResult, solve_break_even
+from model.goal_seek import GoalSeekResult, goal_seek
+from model.memo import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    ResultCache,
+    estimate_result_bytes,
+    fingerprint,
+    fingerprint_assumptions,
+)
+from model.portfolio import CaseSummary, run_portfolio
+from model.run_model import ModelResult
+from model.scenarios import scenario_variants
+from model.stress import StressFrontier, StressSurface, stress_frontier, stress_surface
+from model.stages import run_model_incremental, stage_stats
+from state.assumptions import Assumptions
+from state.catalog import KPI_COLUMNS, CatalogEntry
+from state.cases import case_catalog
+
+__all__ = [
+    "BREAK_EVEN_CACHE",
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_MAX_ENTRIES",
+    "GOAL_SEEK_CACHE",
+    "PORTFOLIO_CACHE",
+    "RESULT_CACHE",
+    "STRESS_CACHE",
+    "SURFACE_CACHE",
+    "ResultCache",
+    "cached_break_even",
+    "cached_goal_seek",
+    "cached_portfolio",
+    "cached_run_all_scenarios",
+    "cached_run_model",
+    "cached_stress_frontier",
+    "estimate_result_bytes",
+    "fingerprint",
+    "fingerprint_assumptions",
+    "prefetch_scenarios",
+    "request_stress_surface",
+    "result_cache_stats",
+    "stage_stats",
+]
+
+RESULT_CACHE = ResultCache()
+BREAK_EVEN_CACHE = ResultCache(max_entries=64)
+GOAL_SEEK_CACHE = ResultCache(max_entries=64)
+PORTFOLIO_CACHE = ResultCache(max_entries=1024)
+STRESS_CACHE = ResultCache(max_entries=32)
+SURFACE_CACHE = ResultCache(
+    max_entries=32, max_bytes=256 * 1024 * 1024, sizeof=lambda surface: surface.nbytes
+)
+_SURFACE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stress-surface")
+_SURFACE_PENDING: Dict[tuple, Future] = {}
+_SURFACE_LOCK = threading.Lock()
+
+
+def cached_run_model(assumptions: Assumptions) -> ModelResult:
+    return RESULT_CACHE.get_or_compute(
+        fingerprint_assumptions(assumptions), lambda: run_model_incremental(assumptions)
+    )
+
+
+def prefetch_scenarios(assumptions: Assumptions) -> None:
+    # Variants go through the stage graph, so they share its scenario-independent stages.
+    for variant in scenario_variants(assumptions).values():
+        try:
+            cached_run_model(variant)
+        except ValueError:
+            continue
+
+
+def cached_run_all_scenarios(assumptions: Assumptions) -> Dict[str, ModelResult]:
+    return {
+        name: cached_run_model(variant)
+        for name, variant in scenario_variants(assumptions).items()
+    }
+
+
+def cached_goal_seek(assumptions: Assumptions, target: str) -> GoalSeekResult:
+    return GOAL_SEEK_CACHE.get_or_compute(
+        (fingerprint_assumptions(assumptions), target), lambda: goal_seek(assumptions, target)
+    )
+
+
+def cached_break_even(assumptions: Assumptions, target: str) -> Dict[str, BreakEvenResult]:
+    return BREAK_EVEN_CACHE.get_or_compute(
+        (fingerprint_assumptions(assumptions), target), lambda: solve_break_even(assumptions, target)
+    )
+
+
+def cached_portfolio(paths: List[str], workers: int | None = None) -> List[CaseSummary]:
+    catalog = case_catalog()
+    entries = catalog.entries(paths)
+    stale = [path for path in paths if path not in entries or not entries[path].has_kpis]
+    evaluated = {}
+    if stale:
+        for summary in run_portfolio(stale, workers=workers, cache=PORTFOLIO_CACHE):
+            evaluated[summary.path] = summary
+            catalog.store_kpis(summary.path, summary.fingerprint, asdict(summary))
+    return [
+        evaluated[path] if path in evaluated else _summary_from_entry(entries[path])
+        for path in paths
+    ]
+
+
+def _summary_from_entry(entry: CatalogEntry) -> CaseSummary:
+    return CaseSummary(
+        entry.path,
+        entry.fingerprint,
+        **{column: getattr(entry, column) for column in KPI_COLUMNS},
+        error=entry.error,
+    )
+
+
+def cached_stress_frontier(
+    assumptions: Assumptions, utilization_deltas_pp: range, pricing_stresses_pct: range
+) -> StressFrontier:
+    return STRESS_CACHE.get_or_compute(
+        (fingerprint_assumptions(assumptions), utilization_deltas_pp, pricing_stresses_pct),
+        lambda: stress_frontier(assumptions, utilization_deltas_pp, pricing_stresses_pct),
+    )
+
+
+def request_stress_surface(
+    assumptions: Assumptions,
+    utilization_deltas_pp: range,
+    pricing_stresses_pct: range,
+    cost_inflation_pct: range,
+) -> StressSurface | None:
+    key = (
+        fingerprint_assumptions(assumptions),
+        utilization_deltas_pp,
+        pricing_stresses_pct,
+        cost_inflation_pct,
+    )
+    surface = SURFACE_CACHE.get(key)
+    if surface is not None:
+        return surface
+    with _SURFACE_LOCK:
+        if key not in _SURFACE_PENDING:
+            future = _SURFACE_EXECUTOR.submit(
+                stress_surface,
+                assumptions,
+                utilization_deltas_pp,
+                pricing_stresses_pct,
+                cost_inflation_pct,
+            )
+            _SURFACE_PENDING[key] = future
+            future.add_done_callback(lambda done, key=key: _store_surface(key, done))
+    return None
+
+
+def _store_surface(key: tuple, future: Future) -> None:
+    with _SURFACE_LOCK:
+        _SURFACE_PENDING.pop(key, None)
+    if future.exception() is None:
+        SURFACE_CACHE.put(key, future.result())
+
+
+def result_cache_stats() -> dict:
+    return RESULT_CACHE.stats()
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+
+class RowView(Mapping):
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: ColumnTable, index: int) -> None:
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key: str):
+        table = self._table
+        typed = table._typed.get(key)
+        if typed is not None:
+            return typed[self._index].item()
+        return table._block[table._positions[key], self._index].item()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table._positions)
+
+    def __len__(self) -> int:
+        return len(self._table._positions)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class ColumnTable(Sequence):
+    __slots__ = ("_block", "_positions", "_typed", "_length")
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        block: np.ndarray,
+        typed: Mapping[str, np.ndarray] | None = None,
+    ) -> None:
+        block = np.asarray(block, dtype=float)
+        if block.ndim != 2 or block.shape[0] != len(names):
+            raise ValueError(
+                f"Column block of shape {block.shape} does not match {len(names)} columns."
+            )
+        positions = _positions(tuple(names))
+        typed = dict(typed or {})
+        for name, values in typed.items():
+            if name not in positions:
+                raise ValueError(f"Typed column '{name}' is not a table column.")
+            if len(values) != block.shape[1]:
+                raise ValueError(
+                    f"Column '{name}' has {len(values)} rows, expected {block.shape[1]}."
+                )
+            values.flags.writeable = False
+        block.flags.writeable = False
+        self._block = block
+        self._positions = positions
+        self._typed = typed
+        self._length = block.shape[1]
+
+    @classmethod
+    def from_records(
+        cls,
+        names: Sequence[str],
+        records: Sequence[Sequence[float]],
+        dtypes: Mapping[str, type] | None = None,
+    ) -> ColumnTable:
+        block = (
+            np.fromiter(chain.from_iterable(records), float, len(records) * len(names))
+            .reshape(len(records), len(names))
+            .T.copy()
+        )
+        positions = _positions(tuple(names))
+        typed = {
+            name: block[positions[name]].astype(dtype)
+            for name, dtype in (dtypes or {}).items()
+        }
+        return cls(names, block, typed)
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, np.ndarray]) -> ColumnTable:
+        arrays = {name: np.asarray(values) for name, values in columns.items()}
+        length = len(next(iter(arrays.values()))) if arrays else 0
+        block = np.empty((len(arrays), length))
+        for position, values in enumerate(arrays.values()):
+            block[position] = values
+        typed = {
+            name: values.copy()
+            for name, values in arrays.items()
+            if values.dtype != np.float64
+        }
+        return cls(tuple(arrays), block, typed)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, object]]) -> ColumnTable:
+        rows = list(rows)
+        if not rows:
+            return cls((), np.empty((0, 0)))
+        return cls.from_columns(
+            {name: np.array([row[name] for row in rows]) for name in rows[0]}
+        )
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self._positions)
+
+    @property
+    def nbytes(self) -> int:
+        return self._block.nbytes + sum(values.nbytes for values in self._typed.values())
+
+    def column(self, name: str) -> np.ndarray:
+        typed = self._typed.get(name)
+        if typed is not None:
+            return typed
+        return self._block[self._positions[name]]
+
+    def to_rows(self) -> List[dict]:
+        values = {name: self.column(name).tolist() for name in self._positions}
+        return [
+            {name: column[index] for name, column in values.items()}
+            for index in range(self._length)
+        ]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ColumnTable(
+                self.names,
+                self._block[:, index],
+                {name: values[index] for name, values in self._typed.items()},
+            )
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"Row index {index} out of range.")
+        return RowView(self, index)
+
+    def __iter__(self) -> Iterator[RowView]:
+        for index in range(self._length):
+            yield RowView(self, index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ColumnTable):
+            return self.names == other.names and all(
+                np.array_equal(self.column(name), other.column(name))
+                for name in self._positions
+            )
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(
+                row == other_row for row, other_row in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ColumnTable({self._length} rows: {', '.join(self._positions)})"
+
+
+@lru_cache(maxsize=None)
+def _positions(names: Tuple[str, ...]) -> Dict[str, int]:
+    return {name: position for position, name in enumerate(names)}
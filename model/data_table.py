@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from model.batch import evaluate_batch, pack_assumptions, resolve_path
+from model.sensitivity import _LINKED_FIELDS, SENSITIVITY_METRICS, _metric
+from state.assumptions import Assumptions
+
+MAX_GRID_CELLS = 10_000
+
+
+@dataclass(frozen=True)
+class GridAxis:
+    path: str
+    values: Tuple[float, ...]
+    relative: bool = False
+
+
+@dataclass(frozen=True)
+class DataTable:
+    rows: GridAxis
+    columns: GridAxis
+    metrics: Dict[str, np.ndarray]
+    errors: Dict[Tuple[int, int], str]
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.rows.values), len(self.columns.values)
+
+    def table(self, metric: str) -> np.ndarray:
+        if metric not in self.metrics:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {SENSITIVITY_METRICS}.")
+        return self.metrics[metric]
+
+
+def grid_axis(
+    path: str, start: float, stop: float, steps: int, relative: bool = False
+) -> GridAxis:
+    if steps < 1:
+        raise ValueError("A data table axis needs at least one step.")
+    return GridAxis(path, tuple(np.linspace(start, stop, steps).tolist()), relative)
+
+
+def run_data_table(assumptions: Assumptions, rows: GridAxis, columns: GridAxis) -> DataTable:
+    if rows.path == columns.path:
+        raise ValueError("Data table rows and columns must use different inputs.")
+    row_count, column_count = len(rows.values), len(columns.values)
+    if row_count == 0 or column_count == 0:
+        raise ValueError("Data table axes must have at least one value each.")
+    if row_count * column_count > MAX_GRID_CELLS:
+        raise ValueError(
+            f"Data table has {row_count * column_count} cells, the limit is {MAX_GRID_CELLS}."
+        )
+    base = pack_assumptions([assumptions])
+    size = row_count * column_count
+    inputs = {name: np.repeat(values, size, axis=0) for name, values in base.items()}
+    _set_axis(inputs, base, rows, np.repeat(rows.values, column_count), assumptions.scenario)
+    _set_axis(inputs, base, columns, np.tile(columns.values, row_count), assumptions.scenario)
+
+    result = evaluate_batch(inputs)
+    return DataTable(
+        rows=rows,
+        columns=columns,
+        metrics={
+            metric: _metric(result, metric).reshape(row_count, column_count)
+            for metric in SENSITIVITY_METRICS
+        },
+        errors={
+            divmod(index, column_count): message
+            for index, message in result.errors.items()
+        },
+    )
+
+
+def _set_axis(
+    inputs: Dict[str, np.ndarray],
+    base: Dict[str, np.ndarray],
+    axis: GridAxis,
+    values: Sequence[float],
+    scenario: str,
+) -> None:
+    name, year, path_scenario = resolve_path(axis.path)
+    if path_scenario is not None and path_scenario != scenario:
+        raise ValueError(
+            f"'{axis.path}' belongs to scenario '{path_scenario}', the case runs '{scenario}'."
+        )
+    target = inputs.get(name)
+    if target is None or target.dtype != np.float64:
+        raise ValueError(f"'{axis.path}' is not a numeric model input.")
+    values = np.asarray(values, dtype=float)
+    if target.ndim == 1:
+        updated = base[name] * values if axis.relative else values
+        for linked in _LINKED_FIELDS.get(name, ()):
+            inputs[linked] = inputs[linked] + (updated - base[name])
+        inputs[name] = updated
+    elif year is None:
+        inputs[name] = base[name] * values[:, None] if axis.relative else np.repeat(
+            values[:, None], target.shape[1], axis=1
+        )
+    elif not 0 <= year < target.shape[1]:
+        raise ValueError(f"'{axis.path}' is outside the {target.shape[1]}-year plan.")
+    else:
+        target[:, year] = base[name][0, year] * values if axis.relative else values
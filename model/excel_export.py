@@ -17,13 +17,7 @@ else:
 from model.run_model import ModelResult
 from state.assumptions import Assumptions
 
-YEAR_LABELS = [
-    "Transition Year (As-Is / Closing)",
-    "Business Plan Year 1",
-    "Business Plan Year 2",
-    "Business Plan Year 3",
-    "Business Plan Year 4",
-]
+TRANSITION_YEAR_LABEL = "Transition Year (As-Is / Closing)"
 
 
 class ExcelExportError(RuntimeError):
@@ -41,6 +35,7 @@ def export_ic_excel(
     workbook.remove(workbook.active)
 
     styles = _styles()
+    styles["years"] = assumptions.planning_years
 
     assumptions_map = _build_assumptions_sheet(
         workbook.create_sheet("Assumptions"),
@@ -147,14 +142,14 @@ def _build_assumptions_sheet(
     case_name: str,
     styles: Dict[str, object],
 ) -> Dict[str, List[str] | str]:
-    _set_column_widths(ws, [32, 12, 16, 16, 16, 16, 16])
+    _set_column_widths(ws, [32, 12] + [16] * styles["years"])
     ws.freeze_panes = "C6"
 
     _write_title(
         ws,
         f"IC Model Assumptions - {case_name}",
         1,
-        7,
+        _last_col(styles),
         styles,
     )
     ws.cell(row=2, column=1, value="Scenario").font = styles["label_bold"]
@@ -321,9 +316,9 @@ def _build_revenue_sheet(
     scenario: str,
     styles: Dict[str, object],
 ) -> Dict[str, List[str]]:
-    _set_column_widths(ws, [32, 12, 16, 16, 16, 16, 16])
+    _set_column_widths(ws, [32, 12] + [16] * styles["years"])
     ws.freeze_panes = "C6"
-    _write_title(ws, f"Revenue Model - {scenario}", 1, 7, styles)
+    _write_title(ws, f"Revenue Model - {scenario}", 1, _last_col(styles), styles)
 
     row = 4
     row = _write_header_row(ws, row, styles)
@@ -437,7 +432,7 @@ def _build_revenue_sheet(
         styles,
         lambda c: f"=C{row_map['modeled_group_revenue']}+C{row_map['modeled_external_revenue']}",
     )
-    row = _write_row_from_assumptions(ws, row, "Reference Revenue", "EUR", [assumptions_map["revenue.reference"]] * 5, styles, row_map, "reference_revenue")
+    row = _write_row_from_assumptions(ws, row, "Reference Revenue", "EUR", [assumptions_map["revenue.reference"]] * styles["years"], styles, row_map, "reference_revenue")
     row = _write_row_from_assumptions(ws, row, "Guarantee %", "%", assumptions_map["revenue.guarantee_pct"], styles, row_map, "guarantee_pct")
     row = _write_formula_row(
         ws,
@@ -481,12 +476,12 @@ def _build_revenue_sheet(
     )
 
     total_row = row_map["final_total_revenue"]
-    _apply_total_style(ws, total_row, styles, 7)
+    _apply_total_style(ws, total_row, styles, _last_col(styles))
 
     return {
-        "final_total_revenue": _row_cells("Revenue Model", row_map["final_total_revenue"]),
-        "modeled_group_revenue": _row_cells("Revenue Model", row_map["modeled_group_revenue"]),
-        "modeled_external_revenue": _row_cells("Revenue Model", row_map["modeled_external_revenue"]),
+        "final_total_revenue": _row_cells("Revenue Model", row_map["final_total_revenue"], styles["years"]),
+        "modeled_group_revenue": _row_cells("Revenue Model", row_map["modeled_group_revenue"], styles["years"]),
+        "modeled_external_revenue": _row_cells("Revenue Model", row_map["modeled_external_revenue"], styles["years"]),
     }
 
 
@@ -496,9 +491,9 @@ def _build_cost_sheet(
     revenue_map: Dict[str, List[str]],
     styles: Dict[str, object],
 ) -> Dict[str, List[str]]:
-    _set_column_widths(ws, [34, 12, 16, 16, 16, 16, 16])
+    _set_column_widths(ws, [34, 12] + [16] * styles["years"])
     ws.freeze_panes = "C6"
-    _write_title(ws, "Cost Model", 1, 7, styles)
+    _write_title(ws, "Cost Model", 1, _last_col(styles), styles)
 
     row = 4
     row = _write_header_row(ws, row, styles)
@@ -506,8 +501,8 @@ def _build_cost_sheet(
     row_map: Dict[str, int] = {}
 
     row = _write_section_label(ws, row, "Inflation", styles)
-    row = _write_row_from_assumptions(ws, row, "Apply Inflation", "", [assumptions_map["cost.inflation_apply"]] * 5, styles, row_map, "inflation_apply")
-    row = _write_row_from_assumptions(ws, row, "Inflation Rate (% p.a.)", "% p.a.", [assumptions_map["cost.inflation_rate"]] * 5, styles, row_map, "inflation_rate")
+    row = _write_row_from_assumptions(ws, row, "Apply Inflation", "", [assumptions_map["cost.inflation_apply"]] * styles["years"], styles, row_map, "inflation_apply")
+    row = _write_row_from_assumptions(ws, row, "Inflation Rate (% p.a.)", "% p.a.", [assumptions_map["cost.inflation_rate"]] * styles["years"], styles, row_map, "inflation_rate")
     row = _write_formula_row(
         ws,
         row,
@@ -565,7 +560,7 @@ def _build_cost_sheet(
         styles,
         lambda c: f"=C{row_map['consultant_cost']}+C{row_map['backoffice_cost']}+C{row_map['management_cost_inflated']}",
     )
-    _apply_total_style(ws, row_map["total_personnel"], styles, 7)
+    _apply_total_style(ws, row_map["total_personnel"], styles, _last_col(styles))
 
     row = _write_section_label(ws, row + 1, "Fixed Overhead", styles)
     row = _write_row_from_assumptions(ws, row, "Advisory", "EUR", assumptions_map["cost.advisory"], styles, row_map, "advisory")
@@ -656,12 +651,12 @@ def _build_cost_sheet(
         styles,
         lambda c: f"=C{row_map['total_personnel']}+C{row_map['operating_expenses']}",
     )
-    _apply_total_style(ws, row_map["operating_expenses"], styles, 7)
-    _apply_total_style(ws, row_map["total_operating_costs"], styles, 7)
+    _apply_total_style(ws, row_map["operating_expenses"], styles, _last_col(styles))
+    _apply_total_style(ws, row_map["total_operating_costs"], styles, _last_col(styles))
 
     return {
-        "total_personnel": _row_cells("Cost Model", row_map["total_personnel"]),
-        "operating_expenses": _row_cells("Cost Model", row_map["operating_expenses"]),
+        "total_personnel": _row_cells("Cost Model", row_map["total_personnel"], styles["years"]),
+        "operating_expenses": _row_cells("Cost Model", row_map["operating_expenses"], styles["years"]),
     }
 
 
@@ -672,9 +667,9 @@ def _build_cashflow_sheet(
     cost_map: Dict[str, List[str]],
     styles: Dict[str, object],
 ) -> Dict[str, List[str]]:
-    _set_column_widths(ws, [32, 12, 16, 16, 16, 16, 16])
+    _set_column_widths(ws, [32, 12] + [16] * styles["years"])
     ws.freeze_panes = "C6"
-    _write_title(ws, "Cashflow & Liquidity", 1, 7, styles)
+    _write_title(ws, "Cashflow & Liquidity", 1, _last_col(styles), styles)
 
     row = 4
     row = _write_header_row(ws, row, styles)
@@ -698,6 +693,13 @@ def _build_cashflow_sheet(
     interest_paid_row = ebitda_support_row + 10
     ebt_support_row = ebitda_support_row + 11
     taxes_due_row = ebitda_support_row + 12
+    sculpting_cfads = (
+        f"C{ebitda_support_row}"
+        f"-IF({assumptions_map['cashflow.tax_lag']}=0,C{taxes_due_row},"
+        f"IF({assumptions_map['cashflow.tax_lag']}=1,IF(COLUMN()=3,0,OFFSET(C{taxes_due_row},0,-1)),0))"
+        f"-IF(COLUMN()=3,C{wc_balance_row},C{wc_balance_row}-OFFSET(C{wc_balance_row},0,-1))"
+        f"-C{capex_support_row}"
+    )
 
     row = _write_formula_row(
         ws,
@@ -794,7 +796,10 @@ def _build_cashflow_sheet(
             f"=IF(UPPER({assumptions_map['financing.amort_type']})=\"BULLET\","
             f"IF({idx}={assumptions_map['financing.amort_period']}-1,C{opening_debt_row},0),"
             f"IF({idx}<{assumptions_map['financing.grace_period']},0,"
-            f"IF({idx}<{assumptions_map['financing.amort_period']},C{opening_debt_row}/{assumptions_map['financing.amort_period']},0)))"
+            f"IF({idx}<{assumptions_map['financing.amort_period']},"
+            f"IF(UPPER({assumptions_map['financing.amort_type']})=\"SCULPTED\","
+            f"MIN(MAX(({sculpting_cfads})/{assumptions_map['financing.minimum_dscr']}-C{interest_paid_row},0),C{opening_debt_row}),"
+            f"C{opening_debt_row}/{assumptions_map['financing.amort_period']}),0)))"
         ),
     )
     ws.row_dimensions[scheduled_repayment_row].hidden = True
@@ -1034,30 +1039,30 @@ def _build_cashflow_sheet(
         lambda c: f"=C{row_map['opening_cash']}+C{row_map['net_cashflow']}",
     )
 
-    _apply_total_style(ws, row_map["operating_cf"], styles, 7)
-    _apply_total_style(ws, row_map["free_cashflow"], styles, 7)
-    _apply_total_style(ws, row_map["net_cashflow"], styles, 7)
-    _apply_total_style(ws, row_map["closing_cash"], styles, 7)
+    _apply_total_style(ws, row_map["operating_cf"], styles, _last_col(styles))
+    _apply_total_style(ws, row_map["free_cashflow"], styles, _last_col(styles))
+    _apply_total_style(ws, row_map["net_cashflow"], styles, _last_col(styles))
+    _apply_total_style(ws, row_map["closing_cash"], styles, _last_col(styles))
 
     return {
-        "ebitda": _row_cells("Cashflow & Liquidity", row_map["ebitda_support"]),
-        "operating_cf": _row_cells("Cashflow & Liquidity", row_map["operating_cf"]),
-        "free_cashflow": _row_cells("Cashflow & Liquidity", row_map["free_cashflow"]),
-        "net_cashflow": _row_cells("Cashflow & Liquidity", row_map["net_cashflow"]),
-        "closing_cash": _row_cells("Cashflow & Liquidity", row_map["closing_cash"]),
-        "opening_cash": _row_cells("Cashflow & Liquidity", row_map["opening_cash"]),
-        "working_capital_balance": _row_cells("Cashflow & Liquidity", row_map["working_capital_balance"]),
-        "working_capital_change": _row_cells("Cashflow & Liquidity", row_map["working_capital_change"]),
-        "taxes_due": _row_cells("Cashflow & Liquidity", row_map["taxes_due"]),
-        "taxes_paid": _row_cells("Cashflow & Liquidity", row_map["taxes_paid"]),
-        "fixed_assets": _row_cells("Cashflow & Liquidity", row_map["fixed_assets"]),
-        "depreciation": _row_cells("Cashflow & Liquidity", row_map["depreciation"]),
-        "capex": _row_cells("Cashflow & Liquidity", row_map["capex"]),
-        "acquisition_outflow": _row_cells("Cashflow & Liquidity", row_map["acquisition_outflow"]),
-        "interest_paid": _row_cells("Cashflow & Liquidity", row_map["interest_paid"]),
-        "total_repayment": _row_cells("Cashflow & Liquidity", row_map["total_repayment"]),
-        "opening_debt": _row_cells("Cashflow & Liquidity", row_map["opening_debt"]),
-        "closing_debt": _row_cells("Cashflow & Liquidity", row_map["closing_debt"]),
+        "ebitda": _row_cells("Cashflow & Liquidity", row_map["ebitda_support"], styles["years"]),
+        "operating_cf": _row_cells("Cashflow & Liquidity", row_map["operating_cf"], styles["years"]),
+        "free_cashflow": _row_cells("Cashflow & Liquidity", row_map["free_cashflow"], styles["years"]),
+        "net_cashflow": _row_cells("Cashflow & Liquidity", row_map["net_cashflow"], styles["years"]),
+        "closing_cash": _row_cells("Cashflow & Liquidity", row_map["closing_cash"], styles["years"]),
+        "opening_cash": _row_cells("Cashflow & Liquidity", row_map["opening_cash"], styles["years"]),
+        "working_capital_balance": _row_cells("Cashflow & Liquidity", row_map["working_capital_balance"], styles["years"]),
+        "working_capital_change": _row_cells("Cashflow & Liquidity", row_map["working_capital_change"], styles["years"]),
+        "taxes_due": _row_cells("Cashflow & Liquidity", row_map["taxes_due"], styles["years"]),
+        "taxes_paid": _row_cells("Cashflow & Liquidity", row_map["taxes_paid"], styles["years"]),
+        "fixed_assets": _row_cells("Cashflow & Liquidity", row_map["fixed_assets"], styles["years"]),
+        "depreciation": _row_cells("Cashflow & Liquidity", row_map["depreciation"], styles["years"]),
+        "capex": _row_cells("Cashflow & Liquidity", row_map["capex"], styles["years"]),
+        "acquisition_outflow": _row_cells("Cashflow & Liquidity", row_map["acquisition_outflow"], styles["years"]),
+        "interest_paid": _row_cells("Cashflow & Liquidity", row_map["interest_paid"], styles["years"]),
+        "total_repayment": _row_cells("Cashflow & Liquidity", row_map["total_repayment"], styles["years"]),
+        "opening_debt": _row_cells("Cashflow & Liquidity", row_map["opening_debt"], styles["years"]),
+        "closing_debt": _row_cells("Cashflow & Liquidity", row_map["closing_debt"], styles["years"]),
     }
 
 
@@ -1067,9 +1072,9 @@ def _build_debt_sheet(
     cashflow_map: Dict[str, List[str]],
     styles: Dict[str, object],
 ) -> Dict[str, List[str]]:
-    _set_column_widths(ws, [32, 14, 16, 16, 16, 16, 16])
+    _set_column_widths(ws, [32, 14] + [16] * styles["years"])
     ws.freeze_panes = "C6"
-    _write_title(ws, "Financing & Debt", 1, 7, styles)
+    _write_title(ws, "Financing & Debt", 1, _last_col(styles), styles)
 
     row = 4
     row = _write_header_row(ws, row, styles)
@@ -1197,12 +1202,12 @@ def _build_debt_sheet(
         lambda c: f"=IF(C{row_map['dscr']}<C{row_map['minimum_dscr']},\"YES\",\"NO\")",
     )
 
-    _apply_total_style(ws, row_map["cfads"], styles, 7)
-    _apply_total_style(ws, row_map["debt_service"], styles, 7)
+    _apply_total_style(ws, row_map["cfads"], styles, _last_col(styles))
+    _apply_total_style(ws, row_map["debt_service"], styles, _last_col(styles))
 
     return {
-        "interest_expense": _row_cells("Financing & Debt", row_map["interest_expense"]),
-        "total_repayment": _row_cells("Financing & Debt", row_map["scheduled_repayment"]),
+        "interest_expense": _row_cells("Financing & Debt", row_map["interest_expense"], styles["years"]),
+        "total_repayment": _row_cells("Financing & Debt", row_map["scheduled_repayment"], styles["years"]),
         "opening_debt": cashflow_map["opening_debt"],
         "closing_debt": cashflow_map["closing_debt"],
     }
@@ -1217,9 +1222,9 @@ def _build_pnl_sheet(
     debt_map: Dict[str, List[str]],
     styles: Dict[str, object],
 ) -> Dict[str, List[str]]:
-    _set_column_widths(ws, [32, 12, 16, 16, 16, 16, 16])
+    _set_column_widths(ws, [32, 12] + [16] * styles["years"])
     ws.freeze_panes = "C6"
-    _write_title(ws, "Operating Model (P&L)", 1, 7, styles)
+    _write_title(ws, "Operating Model (P&L)", 1, _last_col(styles), styles)
 
     row = 4
     row = _write_header_row(ws, row, styles)
@@ -1392,14 +1397,14 @@ def _build_pnl_sheet(
     )
 
     for key in ["total_revenue", "personnel_costs", "operating_expenses", "ebitda", "ebit", "net_income"]:
-        _apply_total_style(ws, row_map[key], styles, 7)
+        _apply_total_style(ws, row_map[key], styles, _last_col(styles))
 
     return {
-        "ebitda": _row_cells("Operating Model (P&L)", row_map["ebitda"]),
-        "ebit": _row_cells("Operating Model (P&L)", row_map["ebit"]),
-        "taxes": _row_cells("Operating Model (P&L)", row_map["taxes"]),
-        "net_income": _row_cells("Operating Model (P&L)", row_map["net_income"]),
-        "depreciation": _row_cells("Operating Model (P&L)", row_map["depreciation"]),
+        "ebitda": _row_cells("Operating Model (P&L)", row_map["ebitda"], styles["years"]),
+        "ebit": _row_cells("Operating Model (P&L)", row_map["ebit"], styles["years"]),
+        "taxes": _row_cells("Operating Model (P&L)", row_map["taxes"], styles["years"]),
+        "net_income": _row_cells("Operating Model (P&L)", row_map["net_income"], styles["years"]),
+        "depreciation": _row_cells("Operating Model (P&L)", row_map["depreciation"], styles["years"]),
     }
 
 
@@ -1411,9 +1416,9 @@ def _build_balance_sheet(
     cashflow_map: Dict[str, List[str]],
     styles: Dict[str, object],
 ) -> Dict[str, List[str]]:
-    _set_column_widths(ws, [32, 12, 16, 16, 16, 16, 16])
+    _set_column_widths(ws, [32, 12] + [16] * styles["years"])
     ws.freeze_panes = "C6"
-    _write_title(ws, "Balance Sheet", 1, 7, styles)
+    _write_title(ws, "Balance Sheet", 1, _last_col(styles), styles)
 
     row = 4
     row = _write_header_row(ws, row, styles)
@@ -1607,13 +1612,13 @@ def _build_balance_sheet(
     )
 
     for key in ["total_assets", "total_liabilities", "equity_end", "total_liabilities_equity"]:
-        _apply_total_style(ws, row_map[key], styles, 7)
+        _apply_total_style(ws, row_map[key], styles, _last_col(styles))
 
     return {
-        "financial_debt": _row_cells("Balance Sheet", row_map["financial_debt"]),
-        "cash": _row_cells("Balance Sheet", row_map["cash"]),
-        "equity_end": _row_cells("Balance Sheet", row_map["equity_end"]),
-        "total_assets": _row_cells("Balance Sheet", row_map["total_assets"]),
+        "financial_debt": _row_cells("Balance Sheet", row_map["financial_debt"], styles["years"]),
+        "cash": _row_cells("Balance Sheet", row_map["cash"], styles["years"]),
+        "equity_end": _row_cells("Balance Sheet", row_map["equity_end"], styles["years"]),
+        "total_assets": _row_cells("Balance Sheet", row_map["total_assets"], styles["years"]),
     }
 
 
@@ -1624,9 +1629,9 @@ def _build_equity_sheet(
     balance_map: Dict[str, List[str]],
     styles: Dict[str, object],
 ) -> Dict[str, List[str]]:
-    _set_column_widths(ws, [36, 16, 16, 16, 16, 16, 16])
+    _set_column_widths(ws, [36, 16] + [16] * styles["years"])
     ws.freeze_panes = "C6"
-    _write_title(ws, "Equity Case", 1, 7, styles)
+    _write_title(ws, "Equity Case", 1, _last_col(styles), styles)
 
     row = 4
     row = _write_header_row(ws, row, styles)
@@ -1733,7 +1738,7 @@ def _build_equity_sheet(
         row_map,
         "final_ebit",
         styles,
-        lambda c: f"=INDEX({pnl_map['ebit'][0]}:{pnl_map['ebit'][-1]},5)",
+        lambda c: f"=INDEX({pnl_map['ebit'][0]}:{pnl_map['ebit'][-1]},{styles['years']})",
     )
     row = _write_formula_row(
         ws,
@@ -1753,7 +1758,7 @@ def _build_equity_sheet(
         row_map,
         "net_debt_exit",
         styles,
-        lambda c: f"=INDEX({balance_map['financial_debt'][0]}:{balance_map['financial_debt'][-1]},5)",
+        lambda c: f"=INDEX({balance_map['financial_debt'][0]}:{balance_map['financial_debt'][-1]},{styles['years']})",
     )
     row = _write_formula_row(
         ws,
@@ -1763,7 +1768,7 @@ def _build_equity_sheet(
         row_map,
         "excess_cash_exit",
         styles,
-        lambda c: f"=INDEX({balance_map['cash'][0]}:{balance_map['cash'][-1]},5)",
+        lambda c: f"=INDEX({balance_map['cash'][0]}:{balance_map['cash'][-1]},{styles['years']})",
     )
     row = _write_formula_row(
         ws,
@@ -1785,7 +1790,7 @@ def _build_equity_sheet(
         row_map,
         "equity_cashflow",
         styles,
-        lambda c, idx=None: f"=IF({idx}=0,-C{row_map['total_equity']},IF({idx}=4,C{row_map['exit_value']},0))",
+        lambda c, idx=None: f"=IF({idx}=0,-C{row_map['total_equity']},IF({idx}={styles['years'] - 1},C{row_map['exit_value']},0))",
     )
     row = _write_formula_row(
         ws,
@@ -1808,16 +1813,16 @@ def _build_equity_sheet(
         lambda c: f"=C{row_map['equity_cashflow']}*(C{row_map['management_share']}/100)",
     )
 
-    _apply_total_style(ws, row_map["exit_value"], styles, 7)
+    _apply_total_style(ws, row_map["exit_value"], styles, _last_col(styles))
 
     return {
-        "exit_value": _row_cells("Equity Case", row_map["exit_value"]),
-        "enterprise_value": _row_cells("Equity Case", row_map["enterprise_value"]),
-        "equity_cashflow": _row_cells("Equity Case", row_map["equity_cashflow"]),
-        "external_share": _row_cells("Equity Case", row_map["external_share"]),
-        "management_share": _row_cells("Equity Case", row_map["management_share"]),
-        "external_cashflow": _row_cells("Equity Case", row_map["external_cashflow"]),
-        "management_cashflow": _row_cells("Equity Case", row_map["management_cashflow"]),
+        "exit_value": _row_cells("Equity Case", row_map["exit_value"], styles["years"]),
+        "enterprise_value": _row_cells("Equity Case", row_map["enterprise_value"], styles["years"]),
+        "equity_cashflow": _row_cells("Equity Case", row_map["equity_cashflow"], styles["years"]),
+        "external_share": _row_cells("Equity Case", row_map["external_share"], styles["years"]),
+        "management_share": _row_cells("Equity Case", row_map["management_share"], styles["years"]),
+        "external_cashflow": _row_cells("Equity Case", row_map["external_cashflow"], styles["years"]),
+        "management_cashflow": _row_cells("Equity Case", row_map["management_cashflow"], styles["years"]),
     }
 
 
@@ -1830,9 +1835,9 @@ def _build_valuation_sheet(
     equity_map: Dict[str, List[str]],
     styles: Dict[str, object],
 ) -> None:
-    _set_column_widths(ws, [36, 16, 16, 16, 16, 16, 16])
+    _set_column_widths(ws, [36, 16] + [16] * styles["years"])
     ws.freeze_panes = "C6"
-    _write_title(ws, "Valuation & Purchase Price", 1, 7, styles)
+    _write_title(ws, "Valuation & Purchase Price", 1, _last_col(styles), styles)
 
     row = 4
     row = _write_header_row(ws, row, styles)
@@ -1937,7 +1942,7 @@ def _build_valuation_sheet(
         row_map,
         "dcf_pv_sum",
         styles,
-        lambda c, idx=None: f"=IF({idx}=4,SUM(C{row_map['pv_fcf']}:G{row_map['pv_fcf']}),\"\")",
+        lambda c, idx=None: f"=IF({idx}={styles['years'] - 1},SUM(C{row_map['pv_fcf']}:{_year_column(styles, -1)}{row_map['pv_fcf']}),\"\")",
     )
     row = _write_formula_row(
         ws,
@@ -1948,7 +1953,7 @@ def _build_valuation_sheet(
         "dcf_equity",
         styles,
         lambda c, idx=None: (
-            f"=IF({idx}=4,C{row_map['dcf_pv_sum']}-C{row_map['net_debt_close']}-C{row_map['pension_obligations']},\"\")"
+            f"=IF({idx}={styles['years'] - 1},C{row_map['dcf_pv_sum']}-C{row_map['net_debt_close']}-C{row_map['pension_obligations']},\"\")"
         ),
     )
 
@@ -1961,7 +1966,7 @@ def _build_valuation_sheet(
         row_map,
         "intrinsic_sum",
         styles,
-        lambda c, idx=None: f"=IF({idx}=4,SUM(C{row_map['free_cashflow_business']}:G{row_map['free_cashflow_business']}),\"\")",
+        lambda c, idx=None: f"=IF({idx}={styles['years'] - 1},SUM(C{row_map['free_cashflow_business']}:{_year_column(styles, -1)}{row_map['free_cashflow_business']}),\"\")",
     )
     row = _write_formula_row(
         ws,
@@ -1972,7 +1977,7 @@ def _build_valuation_sheet(
         "intrinsic_equity",
         styles,
         lambda c, idx=None: (
-            f"=IF({idx}=4,C{row_map['intrinsic_sum']}-C{row_map['net_debt_close']}-C{row_map['pension_obligations']},\"\")"
+            f"=IF({idx}={styles['years'] - 1},C{row_map['intrinsic_sum']}-C{row_map['net_debt_close']}-C{row_map['pension_obligations']},\"\")"
         ),
     )
 
@@ -1986,7 +1991,7 @@ def _build_valuation_sheet(
         "exit_equity_value",
         styles,
         lambda c, idx=None: (
-            f"=IF({idx}=4,{equity_map['exit_value'][idx]}-{assumptions_map['balance.pension_obligations']},\"\")"
+            f"=IF({idx}={styles['years'] - 1},{equity_map['exit_value'][idx]}-{assumptions_map['balance.pension_obligations']},\"\")"
         ),
     )
 
@@ -2064,11 +2069,11 @@ def _build_valuation_sheet(
         ),
     )
 
-    _apply_total_style(ws, row_map["multiple_equity"], styles, 7)
+    _apply_total_style(ws, row_map["multiple_equity"], styles, _last_col(styles))
     if "dcf_equity" in row_map:
-        _apply_total_style(ws, row_map["dcf_equity"], styles, 7)
+        _apply_total_style(ws, row_map["dcf_equity"], styles, _last_col(styles))
     if "intrinsic_equity" in row_map:
-        _apply_total_style(ws, row_map["intrinsic_equity"], styles, 7)
+        _apply_total_style(ws, row_map["intrinsic_equity"], styles, _last_col(styles))
 
 
 def _build_overview_sheet(
@@ -2079,10 +2084,11 @@ def _build_overview_sheet(
     revenue_map: Dict[str, List[str]],
     styles: Dict[str, object],
 ) -> None:
-    _set_column_widths(ws, [36, 18, 18, 18, 18, 18, 18])
+    _set_column_widths(ws, [36, 18] + [18] * styles["years"])
     ws.freeze_panes = "A6"
-    _write_title(ws, "Overview", 1, 7, styles)
+    _write_title(ws, "Overview", 1, _last_col(styles), styles)
 
+    final_year = styles["years"] - 1
     row = 4
     ws.cell(row=row, column=1, value="Deal Snapshot").font = styles["section"]
     row += 1
@@ -2107,19 +2113,19 @@ def _build_overview_sheet(
     ws.cell(row=row, column=1, value="Exit Multiple").font = styles["label"]
     ws.cell(row=row, column=2, value=f"={assumptions_map['valuation.multiple']}").number_format = '0.00"x"'
     row += 2
-    ws.cell(row=row, column=1, value="Headline Outcomes (Year 4)").font = styles["section"]
+    ws.cell(row=row, column=1, value=f"Headline Outcomes (Year {final_year})").font = styles["section"]
     row += 1
-    ws.cell(row=row, column=1, value="Revenue (Year 4)").font = styles["label"]
-    ws.cell(row=row, column=2, value=f"=INDEX({revenue_map['final_total_revenue'][0]}:{revenue_map['final_total_revenue'][-1]},5)").number_format = _currency_format()
+    ws.cell(row=row, column=1, value=f"Revenue (Year {final_year})").font = styles["label"]
+    ws.cell(row=row, column=2, value=f"=INDEX({revenue_map['final_total_revenue'][0]}:{revenue_map['final_total_revenue'][-1]},{styles['years']})").number_format = _currency_format()
     row += 1
-    ws.cell(row=row, column=1, value="EBITDA (Year 4)").font = styles["label"]
-    ws.cell(row=row, column=2, value=f"=INDEX({pnl_map['ebitda'][0]}:{pnl_map['ebitda'][-1]},5)").number_format = _currency_format()
+    ws.cell(row=row, column=1, value=f"EBITDA (Year {final_year})").font = styles["label"]
+    ws.cell(row=row, column=2, value=f"=INDEX({pnl_map['ebitda'][0]}:{pnl_map['ebitda'][-1]},{styles['years']})").number_format = _currency_format()
     row += 1
-    ws.cell(row=row, column=1, value="Net Income (Year 4)").font = styles["label"]
-    ws.cell(row=row, column=2, value=f"=INDEX({pnl_map['net_income'][0]}:{pnl_map['net_income'][-1]},5)").number_format = _currency_format()
+    ws.cell(row=row, column=1, value=f"Net Income (Year {final_year})").font = styles["label"]
+    ws.cell(row=row, column=2, value=f"=INDEX({pnl_map['net_income'][0]}:{pnl_map['net_income'][-1]},{styles['years']})").number_format = _currency_format()
     row += 1
     ws.cell(row=row, column=1, value="Equity Value at Exit").font = styles["label"]
-    ws.cell(row=row, column=2, value=f"=INDEX({equity_map['exit_value'][0]}:{equity_map['exit_value'][-1]},5)").number_format = _currency_format()
+    ws.cell(row=row, column=2, value=f"=INDEX({equity_map['exit_value'][0]}:{equity_map['exit_value'][-1]},{styles['years']})").number_format = _currency_format()
 
 
 def _write_title(ws, title: str, row: int, last_col: int, styles: Dict[str, object]) -> None:
@@ -2129,7 +2135,7 @@ def _write_title(ws, title: str, row: int, last_col: int, styles: Dict[str, obje
 
 
 def _write_header_row(ws, row: int, styles: Dict[str, object]) -> int:
-    headers = ["Line Item", "Unit"] + YEAR_LABELS
+    headers = ["Line Item", "Unit"] + _year_labels(styles["years"])
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=row, column=col, value=header)
         cell.font = styles["header"]
@@ -2145,7 +2151,7 @@ def _write_section_label(ws, row: int, title: str, styles: Dict[str, object]) ->
     cell = ws.cell(row=row, column=1, value=title)
     cell.font = styles["section"]
     cell.fill = styles["fill_section"]
-    ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=7)
+    ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=_last_col(styles))
     return row + 1
 
 
@@ -2221,7 +2227,7 @@ def _write_row_from_assumptions(
 ) -> int:
     ws.cell(row=row, column=1, value=label).font = styles["label"]
     ws.cell(row=row, column=2, value=unit).font = styles["label"]
-    for idx in range(5):
+    for idx in range(styles["years"]):
         col = 3 + idx
         cell = ws.cell(row=row, column=col)
         if isinstance(assumption_cells, list):
@@ -2249,7 +2255,7 @@ def _write_formula_row(
 ) -> int:
     ws.cell(row=row, column=1, value=label).font = styles["label"]
     ws.cell(row=row, column=2, value=unit).font = styles["label"]
-    for idx in range(5):
+    for idx in range(styles["years"]):
         col = 3 + idx
         cell = ws.cell(row=row, column=col)
         if formula_builder.__code__.co_argcount >= 2:
@@ -2275,10 +2281,24 @@ def _apply_total_style(ws, row: int, styles: Dict[str, object], last_col: int) -
             cell.number_format = _currency_format()
 
 
-def _row_cells(sheet_name: str, row: int) -> List[str]:
+def _year_labels(years: int) -> List[str]:
+    return [TRANSITION_YEAR_LABEL] + [
+        f"Business Plan Year {idx}" for idx in range(1, years)
+    ]
+
+
+def _last_col(styles: Dict[str, object]) -> int:
+    return 2 + styles["years"]
+
+
+def _year_column(styles: Dict[str, object], idx: int) -> str:
+    return get_column_letter(3 + range(styles["years"])[idx])
+
+
+def _row_cells(sheet_name: str, row: int, years: int) -> List[str]:
     return [
         _sheet_ref(sheet_name, f"{get_column_letter(3 + idx)}{row}")
-        for idx in range(5)
+        for idx in range(years)
     ]
 
 
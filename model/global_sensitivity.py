@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Dict, List, Mapping, Tuple
+
+import numpy as np
+
+from model.batch import evaluate_batch, pack_assumptions, resolve_path
+from model.sensitivity import _DERIVED_FIELDS, _INDEX_FIELDS, _LINKED_FIELDS, _metric
+from state.assumptions import Assumptions
+
+SOBOL_METRICS = ("irr", "min_dscr", "min_cash")
+DEFAULT_FACTORS = {
+    "utilization_rate_pct": (0.85, 1.1),
+    "group_day_rate_eur": (0.9, 1.1),
+    "external_day_rate_eur": (0.9, 1.1),
+    "consultant_fte": (0.9, 1.1),
+    "consultant_loaded_cost_eur": (0.95, 1.1),
+    "interest_rate_pct": (0.8, 1.2),
+}
+DEFAULT_SAMPLES = 10_000
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class SobolResult:
+    factors: Tuple[str, ...]
+    samples: int
+    evaluations: int
+    variance: Dict[str, float]
+    first_order: Dict[str, np.ndarray]
+    total_order: Dict[str, np.ndarray]
+    valid_samples: Dict[str, int]
+
+    def ranking(self, metric: str) -> List[Tuple[str, float, float]]:
+        if metric not in SOBOL_METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {SOBOL_METRICS}.")
+        total = np.nan_to_num(self.total_order[metric], nan=-np.inf)
+        return [
+            (
+                self.factors[index],
+                float(self.first_order[metric][index]),
+                float(self.total_order[metric][index]),
+            )
+            for index in np.argsort(-total, kind="stable")
+        ]
+
+
+def run_sobol(
+    assumptions: Assumptions,
+    factors: Mapping[str, Tuple[float, float]] | None = None,
+    samples: int = DEFAULT_SAMPLES,
+    seed: int = 0,
+    relative: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = None,
+) -> SobolResult:
+    if factors is None:
+        factors = DEFAULT_FACTORS
+    if not factors:
+        raise ValueError("Sobol analysis needs at least one factor.")
+    if samples < 2:
+        raise ValueError("Sobol analysis needs at least two samples.")
+    base = pack_assumptions([assumptions])
+    targets = tuple(_factor_target(base, path) for path in factors)
+    bounds = np.array([factors[path] for path in factors], dtype=float)
+    if (bounds[:, 1] < bounds[:, 0]).any():
+        raise ValueError("Every Sobol factor needs low <= high.")
+
+    # Saltelli design: two independent Latin hypercubes A and B plus, per factor,
+    # A with that column taken from B, so N * (k + 2) evaluations in total.
+    rng = np.random.default_rng(seed)
+    count = len(targets)
+    design = _latin_hypercube(rng, samples, 2 * count)
+    a = bounds[:, 0] + design[:, :count] * (bounds[:, 1] - bounds[:, 0])
+    b = bounds[:, 0] + design[:, count:] * (bounds[:, 1] - bounds[:, 0])
+    rows_per_chunk = max(1, chunk_size // (count + 2))
+    starts = range(0, samples, rows_per_chunk)
+    arguments = (
+        repeat(base),
+        repeat(targets),
+        repeat(relative),
+        [a[start : start + rows_per_chunk] for start in starts],
+        [b[start : start + rows_per_chunk] for start in starts],
+    )
+    if workers is not None and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_evaluate_chunk, *arguments))
+    else:
+        chunks = list(map(_evaluate_chunk, *arguments))
+
+    variance = {}
+    first_order = {}
+    total_order = {}
+    valid_samples = {}
+    for metric in SOBOL_METRICS:
+        outputs = np.concatenate([chunk[metric] for chunk in chunks])
+        outputs = outputs[np.isfinite(outputs).all(axis=1)]
+        y_a, y_b, y_ab = outputs[:, 0], outputs[:, 1], outputs[:, 2:]
+        total_variance = float(np.var(np.concatenate([y_a, y_b]))) if outputs.size else np.nan
+        valid_samples[metric] = int(outputs.shape[0])
+        variance[metric] = total_variance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            first_order[metric] = (
+                np.mean(y_b[:, None] * (y_ab - y_a[:, None]), axis=0) / total_variance
+            )
+            total_order[metric] = (
+                0.5 * np.mean((y_a[:, None] - y_ab) ** 2, axis=0) / total_variance
+            )
+    return SobolResult(
+        factors=tuple(factors),
+        samples=samples,
+        evaluations=samples * (count + 2),
+        variance=variance,
+        first_order=first_order,
+        total_order=total_order,
+        valid_samples=valid_samples,
+    )
+
+
+def _latin_hypercube(rng: np.random.Generator, samples: int, dimensions: int) -> np.ndarray:
+    strata = rng.permuted(np.tile(np.arange(samples), (dimensions, 1)), axis=1).T
+    return (strata + rng.random((samples, dimensions))) / samples
+
+
+def _factor_target(base: Dict[str, np.ndarray], path: str) -> Tuple[Tuple[str, ...], int | None]:
+    name, year, _ = resolve_path(path)
+    values = base.get(name)
+    if values is None or values.dtype != np.float64:
+        raise ValueError(f"Unknown or non-numeric Sobol factor '{path}'.")
+    if name in _INDEX_FIELDS or name in _DERIVED_FIELDS:
+        raise ValueError(f"Sobol factor '{path}' is a period index or derived input.")
+    if year is not None and (values.ndim != 2 or not 0 <= year < values.shape[1]):
+        raise ValueError(f"Sobol factor '{path}' has no year {year}.")
+    return (name,) + _LINKED_FIELDS.get(name, ()), year
+
+
+def _evaluate_chunk(
+    base: Dict[str, np.ndarray],
+    targets: Tuple[Tuple[Tuple[str, ...], int | None], ...],
+    relative: bool,
+    a: np.ndarray,
+    b: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    rows, count = a.shape
+    # Stack the design as [A; B; AB_1; ...; AB_k] and evaluate it in one batch.
+    design = np.concatenate([a, b] + [np.where(np.arange(count) == i, b, a) for i in range(count)])
+    size = design.shape[0]
+    inputs = {name: np.repeat(values, size, axis=0) for name, values in base.items()}
+    for index, (names, year) in enumerate(targets):
+        primary = inputs[names[0]] if year is None else inputs[names[0]][:, year]
+        factor = design[:, index] if primary.ndim == 1 else design[:, index, None]
+        change = primary * (factor - 1.0) if relative else factor
+        for name in names:
+            if year is None:
+                inputs[name] = inputs[name] + change
+            else:
+                inputs[name][:, year] += change
+    result = evaluate_batch(inputs)
+    return {
+        metric: _metric(result, metric).reshape(count + 2, rows).T for metric in SOBOL_METRICS
+    }
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from model.batch import evaluate_batch, pack_assumptions
+from model.sensitivity import _LINKED_FIELDS
+from state.assumptions import Assumptions
+
+GOAL_SEEK_TARGETS = {
+    "purchase_price": ("transaction_and_financing.purchase_price_eur", "max"),
+    "senior_debt": ("financing.senior_debt_amount_eur", "max"),
+    "equity_contribution": ("transaction_and_financing.equity_contribution_eur", "min"),
+}
+DEFAULT_TOLERANCE = 1_000.0
+DEFAULT_POINTS = 16
+MAX_EXPANSIONS = 20
+MAX_ITERATIONS = 50
+GOAL_SEEK_STATUSES = ("solved", "infeasible", "unbounded")
+
+
+@dataclass(frozen=True)
+class GoalSeekResult:
+    target: str
+    path: str
+    current: float
+    value: float | None
+    binding: str | None
+    evaluations: int
+    iterations: int
+    status: str = "solved"
+
+    @property
+    def headroom(self) -> float | None:
+        if self.value is None:
+            return None
+        if GOAL_SEEK_TARGETS[self.target][1] == "max":
+            return self.value - self.current
+        return self.current - self.value
+
+
+def goal_seek(
+    assumptions: Assumptions,
+    target: str = "purchase_price",
+    tolerance: float = DEFAULT_TOLERANCE,
+    points: int = DEFAULT_POINTS,
+) -> GoalSeekResult:
+    return goal_seek_many([assumptions], target, tolerance, points)[0]
+
+
+def goal_seek_many(
+    cases: Sequence[Assumptions],
+    target: str = "purchase_price",
+    tolerance: float = DEFAULT_TOLERANCE,
+    points: int = DEFAULT_POINTS,
+) -> List[GoalSeekResult]:
+    return _goal_seek_packed(pack_assumptions(cases), target, tolerance, points)
+
+
+class _Search:
+    __slots__ = (
+        "current",
+        "tolerance",
+        "points",
+        "direction",
+        "upper",
+        "expansions",
+        "refining",
+        "values",
+        "value",
+        "binding",
+        "evaluations",
+        "iterations",
+        "status",
+    )
+
+    def __init__(self, current: float, tolerance: float, points: int, direction: str) -> None:
+        self.current = current
+        self.tolerance = tolerance
+        self.points = points
+        self.direction = direction
+        self.upper = 2.0 * max(current, tolerance)
+        self.expansions = 0
+        self.refining = False
+        self.values = np.linspace(0.0, self.upper, points + 1)
+        self.value: float | None = None
+        self.binding: str | None = None
+        self.evaluations = 0
+        self.iterations = 0
+        self.status = "solved"
+
+    def update(self, feasible: np.ndarray, binding: List[str | None]) -> bool:
+        # Returns whether the search needs another grid evaluated.
+        self.evaluations += self.values.shape[0]
+        edge = _edge(feasible, self.direction)
+        if not self.refining:
+            if self.direction == "max" and edge is None:
+                # The grid starts at zero and every point breaches; a larger value cannot pass.
+                self.binding = binding[0]
+                self.status = "infeasible"
+                return False
+            if self.direction == "min" and edge == 0:
+                self.value = 0.0
+                return False
+            if edge is None or edge == self.points:
+                # Widen [0, upper] until the outermost feasible point has an infeasible neighbour.
+                self.expansions += 1
+                if self.expansions == MAX_EXPANSIONS:
+                    if self.direction == "min":
+                        self.binding = binding[-1]
+                        self.status = "infeasible"
+                    else:
+                        self.status = "unbounded"
+                    return False
+                self.upper *= 2.0
+                self.values = np.linspace(0.0, self.upper, self.points + 1)
+                return True
+            self.refining = True
+        elif edge is None:
+            # Feasibility is not monotone inside the bracket; keep the last edge found.
+            return False
+        if self.direction == "max":
+            low, high, self.binding = self.values[edge], self.values[edge + 1], binding[edge + 1]
+        else:
+            low, high, self.binding = self.values[edge - 1], self.values[edge], binding[edge - 1]
+        self.value = float(low if self.direction == "max" else high)
+        if high - low <= self.tolerance or self.iterations >= MAX_ITERATIONS:
+            return False
+        self.iterations += 1
+        self.values = np.linspace(low, high, self.points + 1)
+        return True
+
+
+def _goal_seek_packed(
+    base: Dict[str, np.ndarray], target: str, tolerance: float, points: int
+) -> List[GoalSeekResult]:
+    if target not in GOAL_SEEK_TARGETS:
+        raise ValueError(f"Unknown goal-seek target '{target}', expected one of {sorted(GOAL_SEEK_TARGETS)}.")
+    if tolerance <= 0:
+        raise ValueError("Goal-seek tolerance must be positive.")
+    if points < 2:
+        raise ValueError("Goal-seek needs at least two points per iteration.")
+    path, direction = GOAL_SEEK_TARGETS[target]
+    name = path.split(".")[-1]
+    searches = [_Search(float(current), tolerance, points, direction) for current in base[name]]
+    # Every unfinished case contributes its grid to one shared batch per round.
+    active = list(range(len(searches)))
+    while active:
+        rows = np.repeat(active, points + 1)
+        values = np.concatenate([searches[index].values for index in active])
+        feasible, binding = _evaluate(base, rows, name, values)
+        remaining = []
+        for offset, index in enumerate(active):
+            part = slice(offset * (points + 1), (offset + 1) * (points + 1))
+            if searches[index].update(feasible[part], binding[part]):
+                remaining.append(index)
+        active = remaining
+    return [
+        GoalSeekResult(
+            target,
+            path,
+            search.current,
+            search.value,
+            search.binding,
+            search.evaluations,
+            search.iterations,
+            search.status,
+        )
+        for search in searches
+    ]
+
+
+def _edge(feasible: np.ndarray, direction: str) -> int | None:
+    indices = np.flatnonzero(feasible)
+    if indices.size == 0:
+        return None
+    return int(indices[-1] if direction == "max" else indices[0])
+
+
+def _evaluate(
+    base: Dict[str, np.ndarray], rows: np.ndarray, name: str, values: np.ndarray
+) -> Tuple[np.ndarray, List[str | None]]:
+    inputs = {key: column[rows] for key, column in base.items()}
+    for linked in _LINKED_FIELDS.get(name, ()):
+        inputs[linked] = inputs[linked] + (values - base[name][rows])
+    inputs[name] = values
+    result = evaluate_batch(inputs)
+    serviced = result.column("debt", "debt_service") != 0
+    dscr_breach = (serviced & result.column("debt", "covenant_breach")).any(axis=1)
+    cash_breach = (
+        result.column("cashflow", "cash_balance")
+        < inputs["minimum_cash_balance_eur"][:, None]
+    ).any(axis=1)
+    binding = [
+        "model" if not valid else "min_dscr" if dscr else "min_cash" if cash else None
+        for valid, dscr, cash in zip(result.valid, dscr_breach, cash_breach)
+    ]
+    return np.array([limit is None for limit in binding]), binding
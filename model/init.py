@@ -1,3 +1,30 @@
+from model.autodiff import JacobianResult, run_jacobian
+from model.batch import BatchResult, run_model_batch
+from model.break_even import BreakEvenResult, solve_break_even
+from model.global_sensitivity import SobolResult, run_sobol
+from model.goal_seek import GoalSeekResult, goal_seek, goal_seek_many
+from model.periodic import PeriodicResult, run_model_periodic
 from model.run_model import ModelResult, run_model
+from model.scenarios import run_all_scenarios
+from model.simulation import SimulationResult, run_monte_carlo
 
-__all__ = ["ModelResult", "run_model"]
+__all__ = [
+    "BatchResult",
+    "BreakEvenResult",
+    "GoalSeekResult",
+    "JacobianResult",
+    "ModelResult",
+    "PeriodicResult",
+    "SimulationResult",
+    "SobolResult",
+    "goal_seek",
+    "goal_seek_many",
+    "run_all_scenarios",
+    "run_jacobian",
+    "run_model",
+    "run_model_batch",
+    "run_model_periodic",
+    "run_monte_carlo",
+    "run_sobol",
+    "solve_break_even",
+]
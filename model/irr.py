@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+IRR_TOLERANCE = 1e-12
+IRR_MAX_ITERATIONS = 100
+IRR_GUESS = 0.1
+_LOWER_RATE = -0.9
+_UPPER_RATE = 1.0
+_UPPER_RATE_LIMIT = 10.0
+
+
+def solve_irr(
+    cashflows: Sequence[float],
+    max_iterations: int = IRR_MAX_ITERATIONS,
+    tolerance: float = IRR_TOLERANCE,
+) -> float | None:
+    cashflows = [float(value) for value in cashflows]
+    low, high = _LOWER_RATE, _UPPER_RATE
+    npv_low = _npv(cashflows, low)[0]
+    npv_high = _npv(cashflows, high)[0]
+    while npv_low * npv_high > 0 and high < _UPPER_RATE_LIMIT:
+        high *= 2
+        npv_high = _npv(cashflows, high)[0]
+    if npv_low * npv_high > 0:
+        return None
+    if npv_low == 0:
+        return low
+    if npv_high == 0:
+        return high
+
+    rate = IRR_GUESS if low < IRR_GUESS < high else (low + high) / 2
+    for _ in range(max_iterations):
+        value, slope = _npv(cashflows, rate)
+        if value == 0:
+            return rate
+        if npv_low * value > 0:
+            low, npv_low = rate, value
+        else:
+            high = rate
+        step = value / slope if slope else float("inf")
+        candidate = rate - step
+        if not low < candidate < high:
+            candidate = (low + high) / 2
+        if abs(candidate - rate) <= tolerance * (1 + abs(rate)):
+            return candidate
+        rate = candidate
+    return None
+
+
+def irr_many(
+    cashflows: np.ndarray,
+    max_iterations: int = IRR_MAX_ITERATIONS,
+    tolerance: float = IRR_TOLERANCE,
+) -> np.ndarray:
+    cashflows = np.asarray(cashflows, dtype=float)
+    if cashflows.ndim != 2:
+        raise ValueError(
+            f"irr_many expects a 2-D array of cash flows, got shape {cashflows.shape}."
+        )
+    size = cashflows.shape[0]
+    low = np.full(size, _LOWER_RATE)
+    high = np.full(size, _UPPER_RATE)
+    npv_low = _npv_many(cashflows, low)[0]
+    npv_high = _npv_many(cashflows, high)[0]
+    expanding = (npv_low * npv_high > 0) & (high < _UPPER_RATE_LIMIT)
+    while expanding.any():
+        rows = np.flatnonzero(expanding)
+        high[rows] *= 2
+        npv_high[rows] = _npv_many(cashflows[rows], high[rows])[0]
+        expanding = (npv_low * npv_high > 0) & (high < _UPPER_RATE_LIMIT)
+
+    result = np.full(size, np.nan)
+    result[npv_low == 0] = low[npv_low == 0]
+    at_high = (npv_high == 0) & (npv_low != 0)
+    result[at_high] = high[at_high]
+    rows = np.flatnonzero((npv_low * npv_high < 0))
+    low, high, npv_low = low[rows], high[rows], npv_low[rows]
+    rate = np.where((low < IRR_GUESS) & (IRR_GUESS < high), IRR_GUESS, (low + high) / 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(max_iterations):
+            if rows.size == 0:
+                break
+            value, slope = _npv_many(cashflows[rows], rate)
+            exact = value == 0
+            same_side = npv_low * value > 0
+            low = np.where(same_side, rate, low)
+            npv_low = np.where(same_side, value, npv_low)
+            high = np.where(same_side, high, rate)
+            candidate = rate - value / slope
+            bisect = ~((low < candidate) & (candidate < high))
+            candidate = np.where(bisect, (low + high) / 2, candidate)
+            done = np.abs(candidate - rate) <= tolerance * (1 + np.abs(rate))
+            result[rows[exact]] = rate[exact]
+            settled = done & ~exact
+            result[rows[settled]] = candidate[settled]
+            keep = ~(done | exact)
+            rows, rate = rows[keep], candidate[keep]
+            low, high, npv_low = low[keep], high[keep], npv_low[keep]
+    return result
+
+
+def _npv(cashflows: Sequence[float], rate: float) -> Tuple[float, float]:
+    discount = 1 / (1 + rate)
+    value = 0.0
+    slope = 0.0
+    for cashflow in reversed(cashflows):
+        slope = slope * discount + value
+        value = value * discount + cashflow
+    return value, -slope * discount * discount
+
+
+def _npv_many(cashflows: np.ndarray, rate: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    discount = 1 / (1 + rate)
+    value = np.zeros(cashflows.shape[0])
+    slope = np.zeros(cashflows.shape[0])
+    for column in range(cashflows.shape[1] - 1, -1, -1):
+        slope = slope * discount + value
+        value = value * discount + cashflows[:, column]
+    return value, -slope * discount * discount
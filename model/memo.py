@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import is_dataclass
+from typing import Callable, Dict, Hashable
+
+from model.columnar import ColumnTable
+from model.run_model import ModelResult
+from state.assumptions import Assumptions
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_SCALAR_BYTES = 32
+
+_NODE_FINGERPRINTS: Dict[int, tuple[weakref.ref, str]] = {}
+
+
+def fingerprint_assumptions(assumptions: Assumptions) -> str:
+    return fingerprint(assumptions)
+
+
+def fingerprint(value: object) -> str:
+    key = id(value)
+    entry = _NODE_FINGERPRINTS.get(key)
+    if entry is not None and entry[0]() is value:
+        return entry[1]
+    parts = [type(value).__name__]
+    for item in vars(value).values():
+        parts.append(_leaf_repr(item))
+    digest = hashlib.blake2b(
+        "\x1f".join(parts).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    _NODE_FINGERPRINTS[key] = (
+        weakref.ref(value, lambda _, key=key: _NODE_FINGERPRINTS.pop(key, None)),
+        digest,
+    )
+    return digest
+
+
+def _leaf_repr(value: object) -> str:
+    if is_dataclass(value):
+        return fingerprint(value)
+    if isinstance(value, dict):
+        return "{" + ",".join(
+            f"{key!r}:{_leaf_repr(value[key])}" for key in sorted(value)
+        ) + "}"
+    if isinstance(value, list) and value and is_dataclass(value[0]):
+        return "[" + ",".join(fingerprint(item) for item in value) + "]"
+    return repr(value)
+
+
+class ResultCache:
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        sizeof: Callable[[object], int] | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or estimate_result_bytes
+        self._entries: OrderedDict[Hashable, tuple[object, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: object) -> None:
+        size = self._sizeof(value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def estimate_result_bytes(value: object) -> int:
+    if isinstance(value, ModelResult):
+        return sum(
+            estimate_result_bytes(getattr(value, name))
+            for name in ("revenue", "cost", "pnl", "debt", "cashflow", "balance_sheet", "equity")
+        )
+    if isinstance(value, ColumnTable):
+        return sys.getsizeof(value) + value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_result_bytes(item)
+            if isinstance(item, (dict, list, tuple, ColumnTable))
+            else _SCALAR_BYTES
+            for item in value.values()
+        )
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return sys.getsizeof(value)
+        return sys.getsizeof(value) + len(value) * estimate_result_bytes(value[0])
+    return _SCALAR_BYTES
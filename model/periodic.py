@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict
+
+import numpy as np
+
+from model.batch import (
+    BatchResult,
+    _apply_dscr,
+    _balance_sheet_kernel,
+    _cashflow_kernel,
+    _cost_kernel,
+    _investment_kernel,
+    _pnl_kernel,
+    _revenue_kernel,
+    _solve_debt,
+    pack_assumptions,
+)
+from model.columnar import ColumnTable
+from model.irr import solve_irr
+from model.run_model import ModelResult
+from state.assumptions import Assumptions
+
+PERIODICITIES = {"annual": 1, "quarterly": 4, "monthly": 12}
+PERIOD_COLUMNS = (
+    "year",
+    "period",
+    "revenue",
+    "operating_costs",
+    "ebitda",
+    "taxes_paid",
+    "working_capital_change",
+    "capex",
+    "cfads",
+    "opening_debt",
+    "debt_drawdown",
+    "interest_expense",
+    "scheduled_repayment",
+    "special_repayment",
+    "debt_service",
+    "closing_debt",
+    "dscr",
+    "ltm_dscr",
+    "covenant_breach",
+    "net_cashflow",
+    "opening_cash",
+    "cash_balance",
+)
+
+
+@dataclass(frozen=True)
+class PeriodicResult:
+    periodicity: str
+    periods: ColumnTable
+    annual: ModelResult
+
+    @property
+    def periods_per_year(self) -> int:
+        return PERIODICITIES[self.periodicity]
+
+    def column(self, name: str) -> np.ndarray:
+        return self.periods.column(name)
+
+
+def run_model_periodic(
+    assumptions: Assumptions, periodicity: str = "monthly"
+) -> PeriodicResult:
+    if periodicity not in PERIODICITIES:
+        raise ValueError(
+            f"Unknown periodicity '{periodicity}', expected one of {sorted(PERIODICITIES)}."
+        )
+    periods_per_year = PERIODICITIES[periodicity]
+    inputs = pack_assumptions([assumptions])
+    size, years = inputs["workdays_per_year"].shape
+    errors = np.full(size, None, dtype=object)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        revenue = _revenue_kernel(inputs, years)
+        cost = _cost_kernel(inputs, revenue["final_total"], years)
+        debt = _solve_debt(inputs, revenue, cost, years, errors)
+        periods = _period_debt(inputs, debt, periods_per_year)
+        cashflow = _cashflow_kernel(inputs, revenue, cost, debt, years, errors)
+        pnl = _pnl_kernel(inputs, revenue, cost, cashflow, debt)
+        _apply_dscr(inputs, debt, cashflow)
+        balance_sheet = _balance_sheet_kernel(inputs, pnl, cashflow, debt, years, errors)
+        equity = _investment_kernel(inputs, pnl, balance_sheet, years, _scalar_irr)
+        _period_cashflow(inputs, revenue, cost, cashflow, periods, periods_per_year)
+    if errors[0] is not None:
+        raise ValueError(errors[0])
+
+    annual = BatchResult(
+        size=size,
+        years=years,
+        tables={
+            "revenue": revenue,
+            "cost": cost,
+            "pnl": pnl,
+            "debt": debt,
+            "cashflow": cashflow,
+            "balance_sheet": balance_sheet,
+        },
+        equity=equity,
+        valid=np.ones(size, dtype=bool),
+    ).result(0)
+    return PeriodicResult(
+        periodicity=periodicity,
+        periods=ColumnTable.from_columns(
+            {name: periods[name][0] for name in PERIOD_COLUMNS}
+        ),
+        annual=annual,
+    )
+
+
+def roll_up(values: np.ndarray, periods_per_year: int, stock: bool = False) -> np.ndarray:
+    by_year = values.reshape(*values.shape[:-1], -1, periods_per_year)
+    if stock:
+        return by_year[..., -1]
+    return by_year.sum(axis=-1)
+
+
+def _scalar_irr(cashflows: np.ndarray) -> np.ndarray:
+    solved = (solve_irr(row) for row in cashflows.tolist())
+    return np.array([np.nan if irr is None else irr for irr in solved])
+
+
+def _spread(annual: np.ndarray, periods_per_year: int) -> np.ndarray:
+    return np.repeat(annual / periods_per_year, periods_per_year, axis=-1)
+
+
+def _at_year_start(annual: np.ndarray, periods_per_year: int) -> np.ndarray:
+    values = np.zeros(annual.shape[:-1] + (annual.shape[-1] * periods_per_year,))
+    values[..., ::periods_per_year] = annual
+    return values
+
+
+def _at_year_end(annual: np.ndarray, periods_per_year: int) -> np.ndarray:
+    values = np.zeros(annual.shape[:-1] + (annual.shape[-1] * periods_per_year,))
+    values[..., periods_per_year - 1 :: periods_per_year] = annual
+    return values
+
+
+def _trailing_sum(values: np.ndarray, window: int) -> np.ndarray:
+    total = np.cumsum(values, axis=-1)
+    total[..., window:] -= total[..., :-window].copy()
+    return total
+
+
+def _period_debt(
+    inputs: Dict[str, np.ndarray],
+    debt: Dict[str, np.ndarray],
+    periods_per_year: int,
+) -> Dict[str, np.ndarray]:
+    size, years = debt["opening_debt"].shape
+    scheduled_year = np.minimum(debt["scheduled_repayment"], debt["total_repayment"])
+    scheduled = _spread(scheduled_year, periods_per_year)
+    special = _at_year_end(debt["total_repayment"] - scheduled_year, periods_per_year)
+    repayment = (scheduled + special).reshape(size, years, periods_per_year)
+    repaid_before = np.cumsum(repayment, axis=2) - repayment
+    opening = (debt["opening_debt"][:, :, None] - repaid_before).reshape(size, -1)
+    closing = np.maximum(opening - repayment.reshape(size, -1), 0.0)
+    interest = opening * inputs["interest_rate_pct"][:, None] / periods_per_year
+
+    debt["interest_expense"] = roll_up(interest, periods_per_year)
+    debt["debt_service"] = debt["interest_expense"] + debt["total_repayment"]
+    return {
+        "year": np.repeat(np.arange(years), periods_per_year)[None, :].repeat(size, axis=0),
+        "period": np.arange(years * periods_per_year)[None, :].repeat(size, axis=0),
+        "opening_debt": opening,
+        "debt_drawdown": _at_year_start(debt["debt_drawdown"], periods_per_year),
+        "interest_expense": interest,
+        "scheduled_repayment": scheduled,
+        "special_repayment": special,
+        "debt_service": interest + scheduled + special,
+        "closing_debt": closing,
+    }
+
+
+def _period_cashflow(
+    inputs: Dict[str, np.ndarray],
+    revenue: Dict[str, np.ndarray],
+    cost: Dict[str, np.ndarray],
+    cashflow: Dict[str, np.ndarray],
+    periods: Dict[str, np.ndarray],
+    periods_per_year: int,
+) -> None:
+    periods["revenue"] = _spread(revenue["final_total"], periods_per_year)
+    periods["operating_costs"] = _spread(cost["total_operating_costs"], periods_per_year)
+    periods["ebitda"] = _spread(cashflow["ebitda"], periods_per_year)
+    periods["taxes_paid"] = _spread(cashflow["taxes_paid"], periods_per_year)
+    periods["working_capital_change"] = _spread(
+        cashflow["working_capital_change"], periods_per_year
+    )
+    periods["capex"] = _spread(cashflow["capex"], periods_per_year)
+    periods["cfads"] = _spread(
+        cashflow["operating_cf"] - cashflow["capex"], periods_per_year
+    )
+
+    debt_service = periods["debt_service"]
+    periods["dscr"] = np.where(debt_service != 0, periods["cfads"] / debt_service, 0.0)
+    ltm_service = _trailing_sum(debt_service, periods_per_year)
+    periods["ltm_dscr"] = np.where(
+        ltm_service != 0,
+        _trailing_sum(periods["cfads"], periods_per_year) / ltm_service,
+        0.0,
+    )
+    periods["covenant_breach"] = periods["ltm_dscr"] < inputs["minimum_dscr"][:, None]
+
+    closing_items = _at_year_start(
+        cashflow["acquisition_outflow"] + cashflow["equity_injection"], periods_per_year
+    )
+    periods["net_cashflow"] = (
+        periods["cfads"]
+        + closing_items
+        + periods["debt_drawdown"]
+        - debt_service
+    )
+    periods["cash_balance"] = inputs["opening_cash_balance_eur"][:, None] + np.cumsum(
+        periods["net_cashflow"], axis=1
+    )
+    periods["opening_cash"] = periods["cash_balance"] - periods["net_cashflow"]
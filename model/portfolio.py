@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from model.batch import BatchResult, evaluate_batch, pack_assumptions
+from model.goal_seek import DEFAULT_POINTS, DEFAULT_TOLERANCE, GoalSeekResult, _goal_seek_packed
+from model.memo import ResultCache
+from state.journal import read_case_bytes
+from state.schema import loads_assumptions
+
+LEADERBOARD_METRICS = {
+    "irr": True,
+    "exit_value": True,
+    "min_dscr": True,
+    "min_cash": True,
+    "peak_debt": False,
+    "price_headroom": True,
+}
+# Cases evaluated together in one batch (and one goal-seek grid per round).
+PORTFOLIO_BATCH_SIZE = 256
+# A batched case costs well under a millisecond, so a worker needs a few thousand
+# of them before process start-up and pickling the payloads pay off.
+MIN_CASES_PER_WORKER = 2_000
+
+
+@dataclass(frozen=True)
+class CaseSummary:
+    path: str
+    fingerprint: str
+    irr: float | None = None
+    exit_value: float | None = None
+    min_dscr: float | None = None
+    min_cash: float | None = None
+    peak_debt: float | None = None
+    price_headroom: float | None = None
+    error: str | None = None
+
+    @property
+    def name(self) -> str:
+        return Path(self.path).stem
+
+
+def iter_case_files(paths: Iterable[str | Path]) -> Iterator[Tuple[str, str, bytes]]:
+    for path in paths:
+        payload = read_case_bytes(path)
+        yield str(path), hashlib.blake2b(payload, digest_size=16).hexdigest(), payload
+
+
+def run_portfolio(
+    paths: Iterable[str | Path],
+    workers: int | None = None,
+    cache: ResultCache | None = None,
+) -> List[CaseSummary]:
+    order = []
+    summaries = {}
+    pending = []
+    for path in paths:
+        path = str(path)
+        order.append(path)
+        try:
+            payload = read_case_bytes(path)
+        except (OSError, ValueError) as exc:
+            summaries[path] = CaseSummary(path, "", error=str(exc))
+            continue
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        cached = cache.get((path, digest)) if cache is not None else None
+        if cached is not None:
+            summaries[path] = cached
+        else:
+            pending.append((path, digest, payload))
+    batches = [
+        pending[start : start + PORTFOLIO_BATCH_SIZE]
+        for start in range(0, len(pending), PORTFOLIO_BATCH_SIZE)
+    ]
+    workers = pool_workers(workers, len(pending), len(batches))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            evaluated = [summary for batch in pool.map(_evaluate_cases, batches) for summary in batch]
+    else:
+        evaluated = [summary for batch in map(_evaluate_cases, batches) for summary in batch]
+    for summary in evaluated:
+        summaries[summary.path] = summary
+        if cache is not None:
+            cache.put((summary.path, summary.fingerprint), summary)
+    return [summaries[path] for path in order]
+
+
+def pool_workers(workers: int | None, cases: int, batches: int) -> int:
+    if workers is None or workers <= 1:
+        return 1
+    return max(1, min(workers, os.cpu_count() or 1, batches, cases // MIN_CASES_PER_WORKER))
+
+
+def leaderboard(
+    summaries: Sequence[CaseSummary], metric: str = "irr", descending: bool | None = None
+) -> List[CaseSummary]:
+    if metric not in LEADERBOARD_METRICS:
+        raise ValueError(
+            f"Unknown leaderboard metric '{metric}', expected one of {sorted(LEADERBOARD_METRICS)}."
+        )
+    if descending is None:
+        descending = LEADERBOARD_METRICS[metric]
+    ranked = [summary for summary in summaries if getattr(summary, metric) is not None]
+    ranked.sort(key=lambda summary: getattr(summary, metric), reverse=descending)
+    return ranked + [summary for summary in summaries if getattr(summary, metric) is None]
+
+
+def _evaluate_cases(cases: Sequence[Tuple[str, str, bytes]]) -> List[CaseSummary]:
+    summaries: List[CaseSummary | None] = [None] * len(cases)
+    # Cases are packed one at a time so a bad file fails alone, then batched per horizon.
+    groups: Dict[int, List[Tuple[int, Dict[str, np.ndarray]]]] = {}
+    for index, (path, digest, payload) in enumerate(cases):
+        try:
+            assumptions = loads_assumptions(payload)
+            inputs = pack_assumptions([assumptions])
+        except (ValueError, TypeError, KeyError) as exc:
+            summaries[index] = CaseSummary(path, digest, error=str(exc))
+            continue
+        groups.setdefault(assumptions.planning_years, []).append((index, inputs))
+    for group in groups.values():
+        base = {
+            name: np.concatenate([inputs[name] for _, inputs in group]) for name in group[0][1]
+        }
+        result = evaluate_batch(base)
+        valid = np.flatnonzero(result.valid)
+        ceilings = _goal_seek_packed(
+            {name: column[valid] for name, column in base.items()},
+            "purchase_price",
+            DEFAULT_TOLERANCE,
+            DEFAULT_POINTS,
+        )
+        ceiling_by_row = dict(zip(valid.tolist(), ceilings))
+        for row, (index, _) in enumerate(group):
+            path, digest, _ = cases[index]
+            summaries[index] = _summarize(path, digest, result, row, ceiling_by_row.get(row))
+    return summaries
+
+
+def _summarize(
+    path: str, digest: str, result: BatchResult, row: int, ceiling: GoalSeekResult | None
+) -> CaseSummary:
+    if ceiling is None:
+        return CaseSummary(path, digest, error=result.errors[row])
+    dscr = result.column("debt", "dscr")[row]
+    serviced = dscr[result.column("debt", "debt_service")[row] != 0]
+    irr = float(result.irr[row])
+    return CaseSummary(
+        path=path,
+        fingerprint=digest,
+        irr=None if np.isnan(irr) else irr,
+        exit_value=float(result.exit_value[row]),
+        min_dscr=float(serviced.min()) if serviced.size else None,
+        min_cash=float(result.column("cashflow", "cash_balance")[row].min()),
+        peak_debt=float(
+            np.maximum(
+                result.column("debt", "opening_debt")[row], result.column("debt", "closing_debt")[row]
+            ).max()
+        ),
+        price_headroom=ceiling.headroom,
+    )
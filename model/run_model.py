@@ -1,23 +1,137 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
-
-from state.assumptions import Assumptions
+from typing import Dict, List, Mapping, Sequence
+
+import numpy as np
+
+from model.columnar import ColumnTable
+from model.irr import solve_irr
+from state.assumptions import MAX_PLANNING_YEARS, SCENARIO_YEAR_FIELDS, Assumptions
+
+Rows = Sequence[Mapping[str, float]]
+
+REVENUE_COMPONENT_COLUMNS = (
+    "consulting_fte",
+    "capacity_days",
+    "adjusted_capacity_days",
+    "group_share_pct",
+    "external_share_pct",
+    "modeled_group_revenue",
+    "modeled_external_revenue",
+    "modeled_total_revenue",
+    "guaranteed_floor",
+    "guaranteed_group_revenue",
+    "final_total",
+    "share_guaranteed",
+)
+COST_COLUMNS = (
+    "consultant_costs",
+    "backoffice_costs",
+    "management_costs",
+    "personnel_costs",
+    "overhead_and_variable_costs",
+    "total_operating_costs",
+)
+PNL_COLUMNS = (
+    "year",
+    "revenue",
+    "personnel_costs",
+    "overhead_and_variable_costs",
+    "ebitda",
+    "depreciation",
+    "ebit",
+    "interest_expense",
+    "ebt",
+    "taxes",
+    "net_income",
+)
+DEBT_COLUMNS = (
+    "year",
+    "opening_debt",
+    "debt_drawdown",
+    "scheduled_repayment",
+    "special_repayment",
+    "total_repayment",
+    "closing_debt",
+    "interest_expense",
+    "principal_payment",
+    "debt_service",
+    "outstanding_principal",
+    "dscr",
+    "cfads",
+    "minimum_dscr",
+    "covenant_breach",
+)
+CASHFLOW_COLUMNS = (
+    "year",
+    "ebitda",
+    "depreciation",
+    "taxes_paid",
+    "working_capital_change",
+    "working_capital_balance",
+    "operating_cf",
+    "capex",
+    "acquisition_outflow",
+    "free_cashflow",
+    "debt_drawdown",
+    "equity_injection",
+    "interest_paid",
+    "debt_repayment",
+    "investing_cf",
+    "financing_cf",
+    "net_cashflow",
+    "opening_cash",
+    "cash_balance",
+)
+BALANCE_SHEET_COLUMNS = (
+    "year",
+    "cash",
+    "fixed_assets",
+    "acquisition_intangible",
+    "working_capital",
+    "total_assets",
+    "financial_debt",
+    "tax_payable",
+    "total_liabilities",
+    "equity_start",
+    "net_income",
+    "dividends",
+    "equity_injection",
+    "equity_buyback",
+    "equity_end",
+    "total_liabilities_equity",
+    "balance_check",
+)
+_YEAR_DTYPE = {"year": int}
 
 
 @dataclass(frozen=True)
 class ModelResult:
-    revenue: Dict[str, List[float] | List[dict]]
-    cost: List[dict]
-    pnl: List[dict]
-    debt: List[dict]
-    cashflow: List[dict]
-    balance_sheet: List[dict]
+    revenue: Dict[str, List[float] | Rows]
+    cost: Rows
+    pnl: Rows
+    debt: Rows
+    cashflow: Rows
+    balance_sheet: Rows
     equity: dict
 
+    def column(self, table: str, name: str) -> np.ndarray:
+        if table == "revenue":
+            rows = self.revenue["components_by_year"]
+        else:
+            rows = getattr(self, table)
+        if isinstance(rows, ColumnTable):
+            return rows.column(name)
+        return np.array([row[name] for row in rows])
+
 
 def run_model(assumptions: Assumptions) -> ModelResult:
+    return run_model_fused(assumptions)
+
+
+def run_model_reference(assumptions: Assumptions) -> ModelResult:
+    _check_planning_horizon(assumptions)
     assumptions_state = _build_assumptions_state(assumptions)
     input_model = _InputModelAdapter(assumptions)
     scenario = assumptions.scenario
@@ -30,7 +144,9 @@ def run_model(assumptions: Assumptions) -> ModelResult:
     cost_totals_by_year = _build_cost_model_outputs(
         assumptions_state, revenue_final_by_year
     )
-    debt_schedule_pre = calculate_debt_schedule(input_model)
+    debt_schedule_pre = solve_debt_schedule(
+        input_model, revenue_final_by_year, cost_totals_by_year
+    )
     pnl_pre = calculate_pnl(
         input_model,
         depreciation_by_year=None,
@@ -69,6 +185,433 @@ def run_model(assumptions: Assumptions) -> ModelResult:
     )
 
 
+def run_model_fused(assumptions: Assumptions) -> ModelResult:
+    scenario_values = assumptions.revenue.scenarios.get(assumptions.scenario)
+    if scenario_values is None:
+        raise ValueError(f"Unknown scenario '{assumptions.scenario}'.")
+    _check_planning_horizon(assumptions)
+    years = assumptions.planning_years
+    cost_state = assumptions.cost
+    transaction = assumptions.transaction_and_financing
+    financing = assumptions.financing
+    cashflow_state = assumptions.cashflow
+
+    reference_value = _non_negative(scenario_values.reference_revenue_eur)
+    apply_inflation = bool(cost_state.inflation_apply)
+    inflation_rate = cost_state.inflation_rate_pct
+
+    initial_debt = financing.senior_debt_amount_eur
+    interest_rate = financing.interest_rate_pct
+    amort_type = financing.amortization_type
+    amort_period = financing.amortization_period_years
+    grace_period = financing.grace_period_years
+    special_year = financing.special_repayment_year
+    special_amount = financing.special_repayment_amount_eur
+    min_dscr = financing.minimum_dscr
+
+    tax_rate_pct = cashflow_state.tax_cash_rate_pct
+    tax_payment_lag_years = cashflow_state.tax_payment_lag_years
+    capex_pct_revenue = cashflow_state.capex_pct_revenue
+    working_capital_pct_revenue = cashflow_state.working_capital_pct_revenue
+    depreciation_rate = assumptions.balance_sheet.depreciation_rate_pct
+    equity_contribution = transaction.equity_contribution_eur
+    purchase_price = transaction.purchase_price_eur
+
+    revenue_final_by_year = []
+    component_records = []
+    cost_records = []
+    pnl_records = []
+    debt_records = []
+    cashflow_records = []
+    balance_sheet_records = []
+
+    debt_error = None
+    cashflow_error = None
+    balance_error = None
+
+    outstanding_principal = 0.0
+    cash_balance = cashflow_state.opening_cash_balance_eur
+    fixed_assets = 0.0
+    working_capital_balance = 0.0
+    previous_taxes_due = 0.0
+    equity_start = assumptions.balance_sheet.opening_equity_eur
+    tax_payable_balance = 0.0
+
+    for year_index in range(years):
+        personnel_row = cost_state.personnel_by_year[year_index]
+        fixed_row = cost_state.fixed_overhead_by_year[year_index]
+        variable_row = cost_state.variable_costs_by_year[year_index]
+
+        fte = _non_negative(personnel_row.consultant_fte)
+        group_share = scenario_values.group_capacity_share_pct[year_index]
+        external_share = scenario_values.external_capacity_share_pct[year_index]
+        total_share = group_share + external_share
+        if total_share > 0:
+            group_share = group_share / total_share
+            external_share = external_share / total_share
+        rate_factor = (1 + scenario_values.day_rate_growth_pct[year_index]) ** year_index
+        group_rate = scenario_values.group_day_rate_eur[year_index] * rate_factor
+        external_rate = scenario_values.external_day_rate_eur[year_index] * rate_factor
+        capacity_days = (
+            fte
+            * scenario_values.workdays_per_year[year_index]
+            * scenario_values.utilization_rate_pct[year_index]
+        )
+        adjusted_capacity_days = capacity_days * (
+            1 + scenario_values.revenue_growth_pct[year_index]
+        )
+        modeled_group_revenue = adjusted_capacity_days * group_share * group_rate
+        modeled_external_revenue = adjusted_capacity_days * external_share * external_rate
+        guaranteed_floor = reference_value * _clamp_pct(
+            scenario_values.guarantee_pct_by_year[year_index]
+        )
+        guaranteed_group_revenue = max(modeled_group_revenue, guaranteed_floor)
+        revenue = guaranteed_group_revenue + modeled_external_revenue
+        revenue_final_by_year.append(revenue)
+        component_records.append(
+            (
+                fte,
+                capacity_days,
+                adjusted_capacity_days,
+                group_share,
+                external_share,
+                modeled_group_revenue,
+                modeled_external_revenue,
+                modeled_group_revenue + modeled_external_revenue,
+                guaranteed_floor,
+                guaranteed_group_revenue,
+                revenue,
+                guaranteed_group_revenue / revenue if revenue else 0.0,
+            )
+        )
+
+        inflation_factor = (1 + inflation_rate) ** year_index if apply_inflation else 1.0
+        consultant_total = (
+            fte * _non_negative(personnel_row.consultant_loaded_cost_eur) * inflation_factor
+        )
+        backoffice_total = (
+            _non_negative(personnel_row.backoffice_fte)
+            * _non_negative(personnel_row.backoffice_loaded_cost_eur)
+            * inflation_factor
+        )
+        management_total = _non_negative(personnel_row.management_cost_eur) * inflation_factor
+        personnel_costs = consultant_total + backoffice_total + management_total
+        fixed_total = (
+            _non_negative(fixed_row.advisory_eur)
+            + _non_negative(fixed_row.legal_eur)
+            + _non_negative(fixed_row.it_software_eur)
+            + _non_negative(fixed_row.office_rent_eur)
+            + _non_negative(fixed_row.services_eur)
+            + _non_negative(fixed_row.other_services_eur)
+        ) * inflation_factor
+        variable_total = 0.0
+        for cost_type, raw_value in (
+            (variable_row.training_type, variable_row.training_value),
+            (variable_row.travel_type, variable_row.travel_value),
+            (variable_row.communication_type, variable_row.communication_value),
+        ):
+            value = _non_negative(raw_value)
+            if cost_type == "%":
+                variable_total += revenue * value
+            else:
+                variable_total += value * inflation_factor
+        overhead_costs = fixed_total + variable_total
+        cost_records.append(
+            (
+                consultant_total,
+                backoffice_total,
+                management_total,
+                personnel_costs,
+                overhead_costs,
+                personnel_costs + overhead_costs,
+            )
+        )
+
+        debt_drawdown = initial_debt if year_index == 0 else 0.0
+        opening_debt = outstanding_principal + debt_drawdown
+        interest_expense = opening_debt * interest_rate
+
+        ebitda = revenue - personnel_costs - overhead_costs
+        working_capital_current = revenue * working_capital_pct_revenue
+        working_capital_change = working_capital_current - working_capital_balance
+        working_capital_balance = working_capital_current
+        capex = revenue * capex_pct_revenue
+        depreciation = (fixed_assets + capex) * depreciation_rate
+        fixed_assets = max(fixed_assets + capex - depreciation, 0.0)
+        ebit = ebitda - depreciation
+        ebt = ebit - interest_expense
+        taxes = (ebt if ebt > 0 else 0) * tax_rate_pct
+        net_income = ebt - taxes
+        if tax_payment_lag_years == 0:
+            taxes_paid = taxes
+        elif tax_payment_lag_years == 1:
+            taxes_paid = previous_taxes_due
+        else:
+            taxes_paid = 0.0
+        previous_taxes_due = taxes
+
+        operating_cf = ebitda - taxes_paid - working_capital_change
+        cfads = operating_cf - capex
+
+        if amort_type == "Bullet":
+            scheduled_repayment = (
+                opening_debt if year_index == max(amort_period - 1, 0) else 0.0
+            )
+        elif year_index < grace_period or year_index >= amort_period:
+            scheduled_repayment = 0.0
+        elif amort_type == "Sculpted":
+            scheduled_repayment = _sculpted_repayment(
+                cfads, min_dscr, interest_expense, opening_debt
+            )
+        else:
+            scheduled_repayment = opening_debt / amort_period
+        special_repayment = special_amount if special_year == year_index else 0.0
+        total_repayment = min(opening_debt, scheduled_repayment + special_repayment)
+        debt_service = interest_expense + total_repayment
+        if debt_error is None:
+            debt_error = _debt_year_error(
+                amort_type,
+                amort_period,
+                grace_period,
+                year_index,
+                initial_debt,
+                opening_debt,
+                interest_expense,
+                scheduled_repayment,
+                debt_service,
+                min_dscr,
+            )
+        outstanding_principal = max(opening_debt - total_repayment, 0.0)
+
+        if year_index == 0:
+            equity_injection = equity_contribution
+            acquisition_outflow = -purchase_price
+            if debt_drawdown != financing.initial_debt_eur and cashflow_error is None:
+                cashflow_error = "Year 0 debt drawdown does not match initial debt amount."
+            financing_cf = (
+                debt_drawdown + equity_injection - interest_expense - total_repayment
+            )
+        else:
+            equity_injection = 0.0
+            acquisition_outflow = 0.0
+            financing_cf = -(interest_expense + total_repayment)
+        investing_cf = -capex + acquisition_outflow
+        free_cashflow = operating_cf + investing_cf
+        net_cashflow = free_cashflow + financing_cf
+        opening_cash = cash_balance
+        cash_balance += net_cashflow
+
+        dscr = cfads / debt_service if debt_service != 0 else 0
+
+        equity_end = equity_start + net_income + equity_injection
+        tax_payable_balance += taxes - taxes_paid
+        total_assets = cash_balance + fixed_assets + working_capital_balance + purchase_price
+        total_liabilities = outstanding_principal + tax_payable_balance
+        total_liabilities_equity = total_liabilities + equity_end
+        balance_check = total_assets - total_liabilities_equity
+        if abs(balance_check) > 1.0 and balance_error is None:
+            balance_error = (
+                f"Balance sheet out of balance in year {year_index}: {balance_check}"
+            )
+
+        pnl_records.append(
+            (
+                year_index,
+                revenue,
+                personnel_costs,
+                overhead_costs,
+                ebitda,
+                depreciation,
+                ebit,
+                interest_expense,
+                ebt,
+                taxes,
+                net_income,
+            )
+        )
+        debt_records.append(
+            (
+                year_index,
+                opening_debt,
+                debt_drawdown,
+                scheduled_repayment,
+                special_repayment,
+                total_repayment,
+                outstanding_principal,
+                interest_expense,
+                total_repayment,
+                debt_service,
+                outstanding_principal,
+                dscr,
+                cfads,
+                min_dscr,
+                dscr < min_dscr,
+            )
+        )
+        cashflow_records.append(
+            (
+                year_index,
+                ebitda,
+                depreciation,
+                taxes_paid,
+                working_capital_change,
+                working_capital_balance,
+                operating_cf,
+                capex,
+                acquisition_outflow,
+                free_cashflow,
+                debt_drawdown,
+                equity_injection,
+                interest_expense,
+                total_repayment,
+                investing_cf,
+                financing_cf,
+                net_cashflow,
+                opening_cash,
+                cash_balance,
+            )
+        )
+        balance_sheet_records.append(
+            (
+                year_index,
+                cash_balance,
+                fixed_assets,
+                purchase_price,
+                working_capital_balance,
+                total_assets,
+                outstanding_principal,
+                tax_payable_balance,
+                total_liabilities,
+                equity_start,
+                net_income,
+                0.0,
+                equity_injection,
+                0.0,
+                equity_end,
+                total_liabilities_equity,
+                balance_check,
+            )
+        )
+        equity_start = equity_end
+
+    for error in (debt_error, cashflow_error, balance_error):
+        if error is not None:
+            raise ValueError(error)
+
+    exit_multiple = assumptions.valuation.seller_multiple
+    exit_multiple = 0 if exit_multiple is None else exit_multiple
+    enterprise_value = ebit * exit_multiple
+    net_debt_exit = outstanding_principal
+    excess_cash = cash_balance
+    exit_value = enterprise_value - net_debt_exit + excess_cash
+    equity_cashflows = [-equity_contribution] + [0.0] * (years - 1) + [0.0 + exit_value]
+
+    return ModelResult(
+        revenue={
+            "revenue_final_by_year": revenue_final_by_year,
+            "components_by_year": ColumnTable.from_records(
+                REVENUE_COMPONENT_COLUMNS, component_records
+            ),
+        },
+        cost=ColumnTable.from_records(COST_COLUMNS, cost_records),
+        pnl=ColumnTable.from_records(PNL_COLUMNS, pnl_records, _YEAR_DTYPE),
+        debt=ColumnTable.from_records(
+            DEBT_COLUMNS, debt_records, {"year": int, "covenant_breach": bool}
+        ),
+        cashflow=ColumnTable.from_records(CASHFLOW_COLUMNS, cashflow_records, _YEAR_DTYPE),
+        balance_sheet=ColumnTable.from_records(
+            BALANCE_SHEET_COLUMNS, balance_sheet_records, _YEAR_DTYPE
+        ),
+        equity={
+            "initial_equity": equity_contribution,
+            "equity_cashflows": equity_cashflows,
+            "exit_value": exit_value,
+            "enterprise_value": enterprise_value,
+            "net_debt_exit": net_debt_exit,
+            "excess_cash_exit": excess_cash,
+            "irr": solve_irr(equity_cashflows),
+        },
+    )
+
+
+def _debt_year_error(
+    amort_type,
+    amort_period,
+    grace_period,
+    year_index,
+    initial_debt,
+    opening_debt,
+    interest_expense,
+    scheduled_repayment,
+    debt_service,
+    min_dscr,
+):
+    if amort_type == "Sculpted" and min_dscr <= 0:
+        return "Sculpted repayment requires a positive minimum DSCR."
+    if (
+        amort_type not in ("Bullet", "Sculpted")
+        and year_index >= grace_period
+        and opening_debt > 0
+        and amort_period
+        and abs(scheduled_repayment - opening_debt / amort_period) > 1e-6
+    ):
+        return "Scheduled repayment does not scale with senior debt amount."
+    if initial_debt > 0 and opening_debt > 0:
+        if interest_expense == 0:
+            return "Interest expense is zero with positive debt balance."
+        if scheduled_repayment == 0 and amort_type != "Sculpted":
+            return "Scheduled repayment is zero with positive debt balance."
+        if debt_service == 0:
+            return "Debt service is zero with positive debt balance."
+    return None
+
+
+def _sculpted_repayment(cfads, min_dscr, interest_expense, opening_debt):
+    if min_dscr <= 0:
+        return 0.0
+    return min(max(cfads / min_dscr - interest_expense, 0.0), opening_debt)
+
+
+def _sculpting_cfads(year_data, interest_expense, tax_rate, tax_lag, previous_taxes_due):
+    ebitda = year_data.get("ebitda", 0.0)
+    ebt = ebitda - year_data.get("depreciation", 0.0) - interest_expense
+    taxes_due = max(ebt, 0) * tax_rate
+    if tax_lag == 0:
+        taxes_paid = taxes_due
+    elif tax_lag == 1:
+        taxes_paid = previous_taxes_due
+    else:
+        taxes_paid = 0.0
+    cfads = (
+        ebitda
+        - taxes_paid
+        - year_data.get("working_capital_change", 0.0)
+        - year_data.get("capex", 0.0)
+    )
+    return cfads, taxes_due
+
+
+def _check_planning_horizon(assumptions: Assumptions) -> None:
+    years = assumptions.planning_years
+    if not isinstance(years, int) or not 1 <= years <= MAX_PLANNING_YEARS:
+        raise ValueError(
+            f"Planning horizon must be between 1 and {MAX_PLANNING_YEARS} years."
+        )
+    lists = {
+        f"{name}.{field}": getattr(scenario, field)
+        for name, scenario in assumptions.revenue.scenarios.items()
+        for field in SCENARIO_YEAR_FIELDS
+    }
+    lists["personnel_by_year"] = assumptions.cost.personnel_by_year
+    lists["fixed_overhead_by_year"] = assumptions.cost.fixed_overhead_by_year
+    lists["variable_costs_by_year"] = assumptions.cost.variable_costs_by_year
+    for name, values in lists.items():
+        if len(values) != years:
+            raise ValueError(
+                f"'{name}' has {len(values)} years, expected {years} for the planning horizon."
+            )
+
+
 def _build_assumptions_state(assumptions: Assumptions) -> dict:
     revenue_model = {
         "reference_revenue_eur": {},
@@ -151,7 +694,11 @@ def _build_assumptions_state(assumptions: Assumptions) -> dict:
             for row in cost_state.variable_costs_by_year
         ],
     }
-    return {"revenue_model": revenue_model, "cost_model": cost_model}
+    return {
+        "revenue_model": revenue_model,
+        "cost_model": cost_model,
+        "planning_years": assumptions.planning_years,
+    }
 
 
 class _Value:
@@ -161,6 +708,7 @@ class _Value:
 
 class _InputModelAdapter:
     def __init__(self, assumptions: Assumptions) -> None:
+        self.planning_years = assumptions.planning_years
         self.transaction_and_financing = {
             "purchase_price_eur": _Value(
                 assumptions.transaction_and_financing.purchase_price_eur
@@ -225,7 +773,7 @@ def _build_revenue_model_outputs(assumptions_state, scenario):
         revenue_state["reference_revenue_eur"].get(scenario, 0.0)
     )
 
-    for year_index in range(5):
+    for year_index in range(assumptions_state["planning_years"]):
         fte = _non_negative(
             cost_state["personnel"][year_index]["Consultant FTE"]
         )
@@ -297,11 +845,17 @@ def _build_revenue_model_outputs(assumptions_state, scenario):
 
 
 def _build_cost_model_outputs(assumptions_state, revenue_final_by_year):
+    return _apply_revenue_costs(_build_cost_base(assumptions_state), revenue_final_by_year)
+
+
+def _build_cost_base(assumptions_state):
+    # Everything in the cost model that does not scale with revenue, so it can
+    # be shared across revenue scenarios.
     cost_state = assumptions_state["cost_model"]
     apply_inflation = bool(cost_state["inflation"].get("apply", False))
     inflation_rate = cost_state["inflation"].get("rate_pct", 0.0)
-    cost_totals_by_year = []
-    for year_index in range(5):
+    cost_base_by_year = []
+    for year_index in range(assumptions_state["planning_years"]):
         personnel_row = cost_state["personnel"][year_index]
         fixed_row = cost_state["fixed_overhead"][year_index]
         variable_row = cost_state["variable_costs"][year_index]
@@ -334,25 +888,45 @@ def _build_cost_model_outputs(assumptions_state, revenue_final_by_year):
             ]
         ) * inflation_factor
 
-        revenue = revenue_final_by_year[year_index]
-        variable_total = 0.0
+        variable_terms = []
         for prefix in ["Training", "Travel", "Communication"]:
             cost_type = variable_row[f"{prefix} Type"]
             value = _non_negative(variable_row[f"{prefix} Value"])
             if cost_type == "%":
-                variable_total += revenue * value
+                variable_terms.append((True, value))
             else:
-                variable_total += value * inflation_factor
+                variable_terms.append((False, value * inflation_factor))
 
-        overhead_total = fixed_total + variable_total
-        cost_totals_by_year.append(
+        cost_base_by_year.append(
             {
                 "consultant_costs": consultant_total,
                 "backoffice_costs": backoffice_total,
                 "management_costs": management_total,
                 "personnel_costs": personnel_total,
+                "fixed_costs": fixed_total,
+                "variable_terms": variable_terms,
+            }
+        )
+    return cost_base_by_year
+
+
+def _apply_revenue_costs(cost_base_by_year, revenue_final_by_year):
+    cost_totals_by_year = []
+    for year_index, base in enumerate(cost_base_by_year):
+        revenue = revenue_final_by_year[year_index]
+        variable_total = 0.0
+        for share_of_revenue, value in base["variable_terms"]:
+            variable_total += revenue * value if share_of_revenue else value
+
+        overhead_total = base["fixed_costs"] + variable_total
+        cost_totals_by_year.append(
+            {
+                "consultant_costs": base["consultant_costs"],
+                "backoffice_costs": base["backoffice_costs"],
+                "management_costs": base["management_costs"],
+                "personnel_costs": base["personnel_costs"],
                 "overhead_and_variable_costs": overhead_total,
-                "total_operating_costs": personnel_total + overhead_total,
+                "total_operating_costs": base["personnel_costs"] + overhead_total,
             }
         )
     return cost_totals_by_year
@@ -365,7 +939,7 @@ def calculate_pnl(
     cost_totals_by_year=None,
     debt_schedule=None,
 ):
-    planning_horizon_years = 5
+    planning_horizon_years = input_model.planning_years
 
     cashflow_assumptions = getattr(input_model, "cashflow_assumptions", {})
     tax_rate_pct = cashflow_assumptions.get(
@@ -376,9 +950,13 @@ def calculate_pnl(
     pnl_by_year = []
 
     if not isinstance(revenue_final_by_year, list) or len(revenue_final_by_year) != planning_horizon_years:
-        raise ValueError("revenue_final_by_year must be a 5-year list.")
+        raise ValueError(
+            f"revenue_final_by_year must be a {planning_horizon_years}-year list."
+        )
     if not isinstance(cost_totals_by_year, list) or len(cost_totals_by_year) != planning_horizon_years:
-        raise ValueError("cost_totals_by_year must be a 5-year list.")
+        raise ValueError(
+            f"cost_totals_by_year must be a {planning_horizon_years}-year list."
+        )
 
     interest_by_year = {}
     if isinstance(debt_schedule, list):
@@ -589,11 +1167,25 @@ def calculate_debt_schedule(input_model, cashflow_result=None):
     special_year = financing_assumptions.get("special_repayment_year", None)
     special_amount = financing_assumptions.get("special_repayment_amount_eur", 0.0)
     min_dscr = financing_assumptions.get("minimum_dscr", 1.3)
+    if amort_type == "Sculpted" and min_dscr <= 0:
+        raise ValueError("Sculpted repayment requires a positive minimum DSCR.")
+    cashflow_assumptions = getattr(input_model, "cashflow_assumptions", {})
+    tax_rate = cashflow_assumptions.get(
+        "tax_cash_rate_pct",
+        input_model.tax_and_distributions["tax_rate_pct"].value,
+    )
+    tax_lag = cashflow_assumptions.get("tax_payment_lag_years", 0)
+    cashflow_by_year = (
+        {row["year"]: row for row in cashflow_result}
+        if cashflow_result is not None
+        else {}
+    )
 
     schedule = []
     outstanding_principal = 0.0
+    previous_taxes_due = 0.0
 
-    for i in range(5):
+    for i in range(input_model.planning_years):
         year = i
         debt_drawdown = initial_debt if i == 0 else 0.0
         opening_debt = outstanding_principal + debt_drawdown
@@ -603,6 +1195,20 @@ def calculate_debt_schedule(input_model, cashflow_result=None):
             scheduled_repayment = (
                 opening_debt if i == max(amort_period - 1, 0) else 0.0
             )
+        elif amort_type == "Sculpted":
+            scheduled_repayment = 0.0
+            if year in cashflow_by_year:
+                cfads, previous_taxes_due = _sculpting_cfads(
+                    cashflow_by_year[year],
+                    interest_expense,
+                    tax_rate,
+                    tax_lag,
+                    previous_taxes_due,
+                )
+                if grace_period <= i < amort_period:
+                    scheduled_repayment = _sculpted_repayment(
+                        cfads, min_dscr, interest_expense, opening_debt
+                    )
         else:
             scheduled_repayment = (
                 0.0
@@ -614,7 +1220,7 @@ def calculate_debt_schedule(input_model, cashflow_result=None):
                 )
             )
         if (
-            amort_type != "Bullet"
+            amort_type not in ("Bullet", "Sculpted")
             and i >= grace_period
             and opening_debt > 0
             and amort_period
@@ -637,7 +1243,7 @@ def calculate_debt_schedule(input_model, cashflow_result=None):
                 raise ValueError(
                     "Interest expense is zero with positive debt balance."
                 )
-            if scheduled_repayment == 0:
+            if scheduled_repayment == 0 and amort_type != "Sculpted":
                 raise ValueError(
                     "Scheduled repayment is zero with positive debt balance."
                 )
@@ -683,7 +1289,6 @@ def calculate_debt_schedule(input_model, cashflow_result=None):
         )
 
     if cashflow_result is not None:
-        cashflow_by_year = {row["year"]: row for row in cashflow_result}
         for row in schedule:
             year = row["year"]
             year_data = cashflow_by_year.get(year, {})
@@ -698,6 +1303,27 @@ def calculate_debt_schedule(input_model, cashflow_result=None):
     return schedule
 
 
+def solve_debt_schedule(input_model, revenue_final_by_year, cost_totals_by_year, schedule=None):
+    # Without sculpting the schedule ignores revenue and costs, so a schedule
+    # from calculate_debt_schedule(input_model) can be passed in and reused.
+    if schedule is None:
+        schedule = calculate_debt_schedule(input_model)
+    financing_assumptions = getattr(input_model, "financing_assumptions", {})
+    if financing_assumptions.get("amortization_type") != "Sculpted":
+        return schedule
+    # CFADS only depends on the schedule through the interest tax shield, which
+    # calculate_debt_schedule re-derives year by year, so one pass converges.
+    pnl_pre = calculate_pnl(
+        input_model,
+        depreciation_by_year=None,
+        revenue_final_by_year=revenue_final_by_year,
+        cost_totals_by_year=cost_totals_by_year,
+        debt_schedule=schedule,
+    )
+    cashflow = calculate_cashflow(input_model, pnl_pre, schedule)
+    return calculate_debt_schedule(input_model, cashflow)
+
+
 def calculate_balance_sheet(
     input_model, cashflow_result, debt_schedule, pnl_result=None
 ):
@@ -839,7 +1465,7 @@ def calculate_investment(
         else:
             equity_cashflows.append(dividend)
 
-    irr = _calculate_irr(equity_cashflows)
+    irr = solve_irr(equity_cashflows)
 
     return {
         "initial_equity": equity_amount,
@@ -850,36 +1476,3 @@ def calculate_investment(
         "excess_cash_exit": excess_cash,
         "irr": irr,
     }
-
-
-def _calculate_irr(cashflows, max_iterations=100):
-    def npv(rate):
-        return sum(cf / ((1 + rate) ** i) for i, cf in enumerate(cashflows))
-
-    low = -0.9
-    high = 1.0
-    npv_low = npv(low)
-    npv_high = npv(high)
-
-    while npv_low * npv_high > 0 and high < 10:
-        high *= 2
-        npv_high = npv(high)
-
-    if npv_low * npv_high > 0:
-        return 0.0
-
-    for _ in range(max_iterations):
-        mid = (low + high) / 2
-        npv_mid = npv(mid)
-
-        if abs(npv_mid) < 1e-8:
-            return mid
-
-        if npv_low * npv_mid < 0:
-            high = mid
-            npv_high = npv_mid
-        else:
-            low = mid
-            npv_low = npv_mid
-
-    return (low + high) / 2
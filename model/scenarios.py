@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Dict
+
+from model.run_model import ModelResult
+from model.stages import run_model_incremental
+from state.assumptions import Assumptions
+
+
+def scenario_variants(assumptions: Assumptions) -> Dict[str, Assumptions]:
+    return {
+        name: assumptions if name == assumptions.scenario else replace(assumptions, scenario=name)
+        for name in assumptions.revenue.scenarios
+    }
+
+
+def run_all_scenarios(assumptions: Assumptions) -> Dict[str, ModelResult]:
+    return {
+        name: run_model_incremental(variant)
+        for name, variant in scenario_variants(assumptions).items()
+    }
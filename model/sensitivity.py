@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from model.batch import BatchResult, evaluate_batch, pack_assumptions, resolve_path
+from state.assumptions import Assumptions
+
+SENSITIVITY_METRICS = ("irr", "min_dscr", "min_cash", "exit_value")
+DEFAULT_BUMP = 0.1
+_INDEX_FIELDS = {
+    "amortization_period_years",
+    "grace_period_years",
+    "special_repayment_year",
+    "tax_payment_lag_years",
+    "reference_year",
+    "valuation_start_year",
+}
+_LINKED_FIELDS = {
+    "senior_debt_amount_eur": ("initial_debt_eur",),
+    "opening_cash_balance_eur": ("opening_equity_eur",),
+}
+_DERIVED_FIELDS = {"initial_debt_eur", "opening_equity_eur"}
+_LABEL_WORDS = {"pct": "%", "eur": "", "fte": "FTE", "dscr": "DSCR", "it": "IT"}
+
+
+@dataclass(frozen=True)
+class SensitivityLeaf:
+    path: str
+    name: str
+    year: int | None
+    value: float
+
+    @property
+    def label(self) -> str:
+        words = [_LABEL_WORDS.get(word, word.capitalize()) for word in self.name.split("_")]
+        label = " ".join(word for word in words if word)
+        if self.year is None:
+            return label
+        return f"{label} (Year {self.year})"
+
+
+@dataclass(frozen=True)
+class TornadoRow:
+    leaf: SensitivityLeaf
+    low_input: float
+    high_input: float
+    low: float
+    high: float
+
+    @property
+    def swing(self) -> float:
+        return abs(self.high - self.low)
+
+
+@dataclass(frozen=True)
+class SensitivityResult:
+    leaves: Tuple[SensitivityLeaf, ...]
+    bump: float
+    relative: bool
+    base: Dict[str, float]
+    down: Dict[str, np.ndarray]
+    up: Dict[str, np.ndarray]
+
+    def swing(self, metric: str) -> np.ndarray:
+        return np.abs(self.up[metric] - self.down[metric])
+
+    def tornado(self, metric: str, top: int | None = None) -> List[TornadoRow]:
+        if metric not in SENSITIVITY_METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {SENSITIVITY_METRICS}.")
+        swing = np.nan_to_num(self.swing(metric), nan=-np.inf)
+        order = np.argsort(-swing, kind="stable")[:top]
+        return [
+            TornadoRow(
+                leaf=self.leaves[index],
+                low_input=_bumped(self.leaves[index].value, -self.bump, self.relative),
+                high_input=_bumped(self.leaves[index].value, self.bump, self.relative),
+                low=float(self.down[metric][index]),
+                high=float(self.up[metric][index]),
+            )
+            for index in order
+        ]
+
+
+def sensitivity_leaves(assumptions: Assumptions) -> Tuple[SensitivityLeaf, ...]:
+    inputs = pack_assumptions([assumptions])
+    leaves = []
+    for path, value in _numeric_leaves(assumptions, "", assumptions.scenario):
+        name, year, _ = resolve_path(path)
+        if name in _INDEX_FIELDS or name in _DERIVED_FIELDS:
+            continue
+        values = inputs.get(name)
+        if values is None or values.dtype != np.float64:
+            continue
+        if (values.ndim == 2) != (year is not None):
+            continue
+        leaves.append(SensitivityLeaf(path, name, year, value))
+    return tuple(leaves)
+
+
+def run_sensitivity(
+    assumptions: Assumptions,
+    bump: float = DEFAULT_BUMP,
+    relative: bool = True,
+    leaves: Tuple[SensitivityLeaf, ...] | None = None,
+) -> SensitivityResult:
+    if leaves is None:
+        leaves = sensitivity_leaves(assumptions)
+    base = pack_assumptions([assumptions])
+    size = 2 * len(leaves) + 1
+    inputs = {name: np.repeat(values, size, axis=0) for name, values in base.items()}
+    for index, leaf in enumerate(leaves):
+        for row, direction in ((2 * index + 1, -bump), (2 * index + 2, bump)):
+            change = _bumped(leaf.value, direction, relative) - leaf.value
+            for name in (leaf.name,) + _LINKED_FIELDS.get(leaf.name, ()):
+                if leaf.year is None:
+                    inputs[name][row] += change
+                else:
+                    inputs[name][row, leaf.year] += change
+
+    result = evaluate_batch(inputs)
+    metrics = {metric: _metric(result, metric) for metric in SENSITIVITY_METRICS}
+    if not result.valid[0]:
+        raise ValueError(result.errors[0])
+    return SensitivityResult(
+        leaves=leaves,
+        bump=bump,
+        relative=relative,
+        base={metric: float(values[0]) for metric, values in metrics.items()},
+        down={metric: values[1::2] for metric, values in metrics.items()},
+        up={metric: values[2::2] for metric, values in metrics.items()},
+    )
+
+
+def _numeric_leaves(value: object, path: str, scenario: str) -> Iterator[Tuple[str, float]]:
+    if is_dataclass(value):
+        for field in fields(value):
+            child = f"{path}.{field.name}" if path else field.name
+            yield from _numeric_leaves(getattr(value, field.name), child, scenario)
+    elif isinstance(value, dict):
+        if scenario in value:
+            yield from _numeric_leaves(value[scenario], f"{path}.{scenario}", scenario)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _numeric_leaves(item, f"{path}.{index}", scenario)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        yield path, float(value)
+
+
+def _bumped(value: float, bump: float, relative: bool) -> float:
+    return value * (1 + bump) if relative else value + bump
+
+
+def _metric(result: BatchResult, metric: str) -> np.ndarray:
+    values = np.asarray(getattr(result, metric), dtype=float)
+    return np.where(result.valid, values, np.nan)
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import os
+import warnings
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+from typing import Dict, Mapping, Tuple
+
+import numpy as np
+
+from model.batch import PERSONNEL_FIELDS, REVENUE_YEAR_FIELDS, evaluate_batch, pack_assumptions
+from state.assumptions import Assumptions
+
+SIMULATION_DRIVERS = REVENUE_YEAR_FIELDS + PERSONNEL_FIELDS
+DISTRIBUTION_PARAMETERS = {"normal": 2, "uniform": 2, "triangular": 3, "lognormal": 2}
+APPLY_MODES = ("scale", "shift", "level")
+DEFAULT_PATHS = 100_000
+DEFAULT_CHUNK_SIZE = 10_000
+DEFAULT_PERCENTILES = (5.0, 25.0, 50.0, 75.0, 95.0)
+# A path costs a few microseconds, so a worker needs tens of thousands of them
+# before the process start-up and result pickling are paid back.
+MIN_PATHS_PER_WORKER = 50_000
+TOTAL_LOSS_IRR = -1.0
+
+
+@dataclass(frozen=True)
+class Distribution:
+    kind: str
+    params: Tuple[float, ...]
+    apply: str = "scale"
+    per_year: bool = False
+
+    def __post_init__(self) -> None:
+        expected = DISTRIBUTION_PARAMETERS.get(self.kind)
+        if expected is None:
+            raise ValueError(
+                f"Unknown distribution '{self.kind}', expected one of {sorted(DISTRIBUTION_PARAMETERS)}."
+            )
+        if len(self.params) != expected:
+            raise ValueError(
+                f"Distribution '{self.kind}' takes {expected} parameters, got {len(self.params)}."
+            )
+        if self.apply not in APPLY_MODES:
+            raise ValueError(f"Unknown apply mode '{self.apply}', expected one of {APPLY_MODES}.")
+
+    def sample(self, rng: np.random.Generator, shape: Tuple[int, ...]) -> np.ndarray:
+        return getattr(rng, self.kind)(*self.params, size=shape)
+
+
+def normal(mean: float, std: float, apply: str = "scale", per_year: bool = False) -> Distribution:
+    return Distribution("normal", (mean, std), apply, per_year)
+
+
+def uniform(low: float, high: float, apply: str = "scale", per_year: bool = False) -> Distribution:
+    return Distribution("uniform", (low, high), apply, per_year)
+
+
+def triangular(
+    low: float, mode: float, high: float, apply: str = "scale", per_year: bool = False
+) -> Distribution:
+    return Distribution("triangular", (low, mode, high), apply, per_year)
+
+
+def lognormal(mean: float, sigma: float, apply: str = "scale", per_year: bool = False) -> Distribution:
+    return Distribution("lognormal", (mean, sigma), apply, per_year)
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    paths: int
+    percentiles: Tuple[float, ...]
+    cash_balance: np.ndarray
+    dscr: np.ndarray
+    exit_value: np.ndarray
+    irr: np.ndarray
+    no_irr_probability: float
+    breach_probability: float
+    breach_probability_by_year: np.ndarray
+    outcomes: Dict[str, np.ndarray]
+    failures: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def failed_paths(self) -> int:
+        return sum(self.failures.values())
+
+    def band(self, metric: str, percentile: float) -> np.ndarray | float:
+        if percentile not in self.percentiles:
+            raise ValueError(f"Percentile {percentile} was not computed, have {self.percentiles}.")
+        return getattr(self, metric)[self.percentiles.index(percentile)]
+
+
+def run_monte_carlo(
+    assumptions: Assumptions,
+    drivers: Mapping[str, Distribution],
+    paths: int = DEFAULT_PATHS,
+    seed: int = 0,
+    percentiles: Tuple[float, ...] = DEFAULT_PERCENTILES,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = None,
+) -> SimulationResult:
+    if paths < 1:
+        raise ValueError("Monte Carlo simulation requires at least one path.")
+    unknown = sorted(set(drivers) - set(SIMULATION_DRIVERS))
+    if unknown:
+        raise ValueError(f"Unknown simulation drivers {unknown}, expected any of {SIMULATION_DRIVERS}.")
+    base = pack_assumptions([assumptions])
+    sizes = [min(chunk_size, paths - start) for start in range(0, paths, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    arguments = (repeat(base), repeat(dict(drivers)), sizes, seeds)
+    workers = pool_workers(workers, paths, len(sizes))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_simulate_chunk, *arguments))
+    else:
+        chunks = list(map(_simulate_chunk, *arguments))
+
+    failures = Counter()
+    for chunk in chunks:
+        failures.update(chunk.pop("errors"))
+    outcomes = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+    valid = outcomes.pop("valid")
+    if not valid.any():
+        raise ValueError(f"Every simulated path failed: {failures.most_common(1)[0][0]}")
+    outcomes = {name: values[valid] for name, values in outcomes.items()}
+
+    breach_by_year = outcomes.pop("covenant_breach")
+    cash_balance = outcomes.pop("cash_balance")
+    dscr = outcomes.pop("dscr")
+    outcomes["min_cash"] = cash_balance.min(axis=1)
+    outcomes["min_dscr"] = np.fmin.reduce(dscr, axis=1)
+    outcomes["covenant_breach"] = breach_by_year.any(axis=1)
+    no_irr = outcomes.pop("no_irr")
+    irr = outcomes["irr"]
+    return SimulationResult(
+        paths=int(valid.sum()),
+        percentiles=tuple(percentiles),
+        cash_balance=np.percentile(cash_balance, percentiles, axis=0),
+        dscr=_nan_percentile(dscr, percentiles, axis=0),
+        exit_value=np.percentile(outcomes["exit_value"], percentiles),
+        irr=_nan_percentile(irr, percentiles),
+        no_irr_probability=float(no_irr.mean()),
+        breach_probability=float(outcomes["covenant_breach"].mean()),
+        breach_probability_by_year=breach_by_year.mean(axis=0),
+        outcomes=outcomes,
+        failures=dict(failures),
+    )
+
+
+def pool_workers(workers: int | None, paths: int, chunks: int) -> int:
+    if workers is None or workers <= 1:
+        return 1
+    return max(1, min(workers, os.cpu_count() or 1, chunks, paths // MIN_PATHS_PER_WORKER))
+
+
+def _simulate_chunk(
+    base: Dict[str, np.ndarray],
+    drivers: Dict[str, Distribution],
+    size: int,
+    seed: np.random.SeedSequence,
+) -> Dict[str, object]:
+    rng = np.random.default_rng(seed)
+    inputs = {name: np.repeat(values, size, axis=0) for name, values in base.items()}
+    for name in sorted(drivers):
+        distribution = drivers[name]
+        years = inputs[name].shape[1]
+        draws = distribution.sample(rng, (size, years if distribution.per_year else 1))
+        if distribution.apply == "scale":
+            inputs[name] = inputs[name] * draws
+        elif distribution.apply == "shift":
+            inputs[name] = inputs[name] + draws
+        else:
+            inputs[name] = np.broadcast_to(draws, inputs[name].shape).copy()
+    result = evaluate_batch(inputs)
+    # Years without debt service report a DSCR of 0; they are neither a breach
+    # nor part of the DSCR bands.
+    serviced = result.column("debt", "debt_service") != 0
+    return {
+        "valid": result.valid,
+        "cash_balance": result.column("cashflow", "cash_balance"),
+        "dscr": np.where(serviced, result.column("debt", "dscr"), np.nan),
+        "covenant_breach": serviced & result.column("debt", "covenant_breach"),
+        "exit_value": result.exit_value,
+        "irr": _irr_with_losses(result.irr, result.equity["equity_cashflows"]),
+        "no_irr": np.isnan(result.irr),
+        "errors": Counter(result.errors.values()),
+    }
+
+
+def _irr_with_losses(irr: np.ndarray, cashflows: np.ndarray) -> np.ndarray:
+    # Paths that never earn back the equity have no IRR in the solver's bracket.
+    # Dropping them would lift the downside bands, so they count as a total loss.
+    # The rare paths above the bracket stay NaN and are left out of the bands.
+    return np.where(np.isnan(irr) & (cashflows.sum(axis=1) < 0), TOTAL_LOSS_IRR, irr)
+
+
+def _nan_percentile(values: np.ndarray, percentiles: Tuple[float, ...], axis: int | None = None) -> np.ndarray:
+    # All-NaN columns (no serviced year, no IRR) give NaN bands without a warning.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanpercentile(values, percentiles, axis=axis)
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple
+
+from model.columnar import ColumnTable
+from model.memo import ResultCache, fingerprint
+from model.run_model import (
+    ModelResult,
+    _InputModelAdapter,
+    _build_assumptions_state,
+    _check_planning_horizon,
+    _apply_revenue_costs,
+    _build_cost_base,
+    _build_revenue_model_outputs,
+    calculate_balance_sheet,
+    calculate_cashflow,
+    calculate_debt_schedule,
+    calculate_investment,
+    calculate_pnl,
+    solve_debt_schedule,
+)
+from state.assumptions import Assumptions
+
+STAGE_CACHE_ENTRIES = 64
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    reads: Tuple[Callable[[Assumptions], object], ...]
+    depends_on: Tuple[str, ...]
+    compute: Callable[..., object]
+
+
+class _StageContext:
+    def __init__(self, assumptions: Assumptions) -> None:
+        self.assumptions = assumptions
+        self._input_model = None
+        self._state = None
+
+    @property
+    def input_model(self) -> _InputModelAdapter:
+        if self._input_model is None:
+            self._input_model = _InputModelAdapter(self.assumptions)
+        return self._input_model
+
+    @property
+    def state(self) -> dict:
+        if self._state is None:
+            self._state = _build_assumptions_state(self.assumptions)
+        return self._state
+
+
+def _active_scenario(assumptions: Assumptions):
+    return assumptions.revenue.scenarios[assumptions.scenario]
+
+
+def _personnel(assumptions: Assumptions):
+    return assumptions.cost.personnel_by_year
+
+
+def _planning_years(assumptions: Assumptions):
+    return assumptions.planning_years
+
+
+def _revenue_stage(context: _StageContext):
+    return _build_revenue_model_outputs(context.state, context.assumptions.scenario)
+
+
+def _cost_base_stage(context: _StageContext):
+    return _build_cost_base(context.state)
+
+
+def _cost_stage(context: _StageContext, revenue, cost_base):
+    return _apply_revenue_costs(cost_base, revenue[0])
+
+
+def _debt_schedule_stage(context: _StageContext):
+    return calculate_debt_schedule(context.input_model)
+
+
+def _debt_stage(context: _StageContext, revenue, cost, debt_schedule):
+    return solve_debt_schedule(context.input_model, revenue[0], cost, debt_schedule)
+
+
+def _cashflow_stage(context: _StageContext, revenue, cost, debt):
+    pnl_pre = calculate_pnl(
+        context.input_model,
+        depreciation_by_year=None,
+        revenue_final_by_year=revenue[0],
+        cost_totals_by_year=cost,
+        debt_schedule=debt,
+    )
+    return calculate_cashflow(context.input_model, pnl_pre, debt)
+
+
+def _pnl_stage(context: _StageContext, revenue, cost, cashflow, debt):
+    return calculate_pnl(
+        context.input_model,
+        depreciation_by_year={
+            row["year"]: row.get("depreciation", 0.0) for row in cashflow
+        },
+        revenue_final_by_year=revenue[0],
+        cost_totals_by_year=cost,
+        debt_schedule=debt,
+    )
+
+
+def _coverage_stage(context: _StageContext, cashflow):
+    return calculate_debt_schedule(context.input_model, cashflow)
+
+
+def _balance_sheet_stage(context: _StageContext, cashflow, coverage, pnl):
+    return calculate_balance_sheet(context.input_model, cashflow, coverage, pnl)
+
+
+def _investment_stage(context: _StageContext, cashflow, pnl, balance_sheet):
+    return calculate_investment(context.input_model, cashflow, pnl, balance_sheet)
+
+
+_DEBT_READS = (
+    _planning_years,
+    lambda a: a.financing,
+    lambda a: a.cashflow,
+    lambda a: a.balance_sheet,
+    lambda a: a.transaction_and_financing,
+)
+
+# Cost base and the unsculpted debt schedule do not read the revenue scenario,
+# so every scenario of a case shares them.
+STAGES: Tuple[Stage, ...] = (
+    Stage(
+        "revenue", (_planning_years, _active_scenario, _personnel), (), _revenue_stage
+    ),
+    Stage("cost_base", (_planning_years, lambda a: a.cost), (), _cost_base_stage),
+    Stage("cost", (), ("revenue", "cost_base"), _cost_stage),
+    Stage("debt_schedule", _DEBT_READS, (), _debt_schedule_stage),
+    Stage("debt", _DEBT_READS, ("revenue", "cost", "debt_schedule"), _debt_stage),
+    Stage(
+        "cashflow",
+        (
+            lambda a: a.cashflow,
+            lambda a: a.balance_sheet,
+            lambda a: a.transaction_and_financing,
+            lambda a: a.financing,
+        ),
+        ("revenue", "cost", "debt"),
+        _cashflow_stage,
+    ),
+    Stage("pnl", (lambda a: a.cashflow,), ("revenue", "cost", "cashflow", "debt"), _pnl_stage),
+    Stage("coverage", (lambda a: a.financing,), ("cashflow",), _coverage_stage),
+    Stage(
+        "balance_sheet",
+        (lambda a: a.balance_sheet, lambda a: a.transaction_and_financing),
+        ("cashflow", "coverage", "pnl"),
+        _balance_sheet_stage,
+    ),
+    Stage(
+        "investment",
+        (lambda a: a.transaction_and_financing, lambda a: a.valuation),
+        ("cashflow", "pnl", "balance_sheet"),
+        _investment_stage,
+    ),
+)
+
+
+class StageGraph:
+    def __init__(
+        self, stages: Tuple[Stage, ...] = STAGES, max_entries: int = STAGE_CACHE_ENTRIES
+    ) -> None:
+        known: set[str] = set()
+        for stage in stages:
+            missing = [name for name in stage.depends_on if name not in known]
+            if missing:
+                raise ValueError(
+                    f"Stage '{stage.name}' depends on unknown or later stages: {missing}."
+                )
+            known.add(stage.name)
+        self.stages = stages
+        self.caches: Dict[str, ResultCache] = {
+            stage.name: ResultCache(max_entries=max_entries, sizeof=_unsized)
+            for stage in stages
+        }
+
+    def run(self, assumptions: Assumptions) -> Dict[str, object]:
+        if assumptions.scenario not in assumptions.revenue.scenarios:
+            raise ValueError(f"Unknown scenario '{assumptions.scenario}'.")
+        _check_planning_horizon(assumptions)
+        context = _StageContext(assumptions)
+        keys: Dict[str, tuple] = {}
+        outputs: Dict[str, object] = {}
+        for stage in self.stages:
+            key = (
+                tuple(_input_fingerprint(read(assumptions)) for read in stage.reads),
+                tuple(keys[name] for name in stage.depends_on),
+            )
+            keys[stage.name] = key
+            outputs[stage.name] = self.caches[stage.name].get_or_compute(
+                key,
+                lambda stage=stage: stage.compute(
+                    context, *(outputs[name] for name in stage.depends_on)
+                ),
+            )
+        return outputs
+
+    def stats(self) -> Dict[str, dict]:
+        return {name: cache.stats() for name, cache in self.caches.items()}
+
+    def clear(self) -> None:
+        for cache in self.caches.values():
+            cache.clear()
+
+
+def _unsized(value: object) -> int:
+    return 0
+
+
+def _input_fingerprint(value: object):
+    if isinstance(value, list):
+        return tuple(fingerprint(item) for item in value)
+    if isinstance(value, int):
+        return value
+    return fingerprint(value)
+
+
+STAGE_GRAPH = StageGraph()
+
+
+def run_model_incremental(assumptions: Assumptions) -> ModelResult:
+    outputs = STAGE_GRAPH.run(assumptions)
+    revenue_final_by_year, revenue_components = outputs["revenue"]
+    return ModelResult(
+        revenue={
+            "revenue_final_by_year": revenue_final_by_year,
+            "components_by_year": ColumnTable.from_rows(revenue_components),
+        },
+        cost=ColumnTable.from_rows(outputs["cost"]),
+        pnl=ColumnTable.from_rows(outputs["pnl"]),
+        debt=ColumnTable.from_rows(outputs["coverage"]),
+        cashflow=ColumnTable.from_rows(outputs["cashflow"]),
+        balance_sheet=ColumnTable.from_rows(outputs["balance_sheet"]),
+        equity=outputs["investment"],
+    )
+
+
+def stage_stats() -> Dict[str, dict]:
+    return STAGE_GRAPH.stats()
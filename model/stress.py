@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from model.batch import FIXED_OVERHEAD_FIELDS, BatchResult, evaluate_batch, pack_assumptions
+from model.columnar import ColumnTable
+from model.run_model import ModelResult
+from state.assumptions import Assumptions
+
+STRESSED_COST_FIELDS = (
+    ("consultant_loaded_cost_eur", "backoffice_loaded_cost_eur", "management_cost_eur")
+    + FIXED_OVERHEAD_FIELDS
+    + ("training_value", "travel_value", "communication_value")
+)
+MAX_COST_INFLATION_PCT = 150
+DEFAULT_POINTS = 8
+BREACH_LABELS = ("model", "min_dscr", "min_cash")
+SURFACE_REVENUE_COLUMNS = (
+    "consulting_fte",
+    "capacity_days",
+    "adjusted_capacity_days",
+    "modeled_group_revenue",
+    "modeled_external_revenue",
+    "guaranteed_floor",
+    "final_total",
+)
+SURFACE_COST_COLUMNS = ("consultant_costs", "backoffice_costs", "management_costs", "personnel_costs")
+
+
+@dataclass(frozen=True)
+class StressFrontier:
+    utilization_deltas_pp: np.ndarray
+    pricing_stresses_pct: np.ndarray
+    max_cost_inflation_pct: int
+    breach_cost_inflation_pct: np.ndarray
+    breach_year: np.ndarray
+    binding: np.ndarray
+    evaluations: int
+
+    def distance(
+        self, utilization_delta_pp: int, pricing_stress_pct: int, cost_inflation_pct: int
+    ) -> float:
+        row = np.flatnonzero(self.utilization_deltas_pp == utilization_delta_pp)
+        column = np.flatnonzero(self.pricing_stresses_pct == pricing_stress_pct)
+        if row.size == 0 or column.size == 0:
+            raise ValueError(
+                f"Stress point ({utilization_delta_pp}, {pricing_stress_pct}) is outside the frontier grid."
+            )
+        return float(self.breach_cost_inflation_pct[row[0], column[0]] - cost_inflation_pct)
+
+
+@dataclass(frozen=True)
+class StressSurface:
+    utilization_deltas_pp: range
+    pricing_stresses_pct: range
+    cost_inflation_pct: range
+    tax_rate: float
+    revenue: Dict[str, np.ndarray]
+    cost: Dict[str, np.ndarray]
+    interest_expense: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            sum(values.nbytes for values in self.revenue.values())
+            + sum(values.nbytes for values in self.cost.values())
+            + self.interest_expense.nbytes
+        )
+
+    def operating_result(
+        self, utilization_delta_pp: int, pricing_stress_pct: int, cost_inflation_pct: int
+    ) -> ModelResult | None:
+        try:
+            row = self.utilization_deltas_pp.index(utilization_delta_pp)
+            column = self.pricing_stresses_pct.index(pricing_stress_pct)
+            layer = self.cost_inflation_pct.index(cost_inflation_pct)
+        except ValueError:
+            return None
+        # Stressed costs scale with (1 + cost inflation) and never feed back into
+        # revenue, so only interest needs the full lattice (and only when sculpted).
+        revenue = {name: values[row, column] for name, values in self.revenue.items()}
+        cost = {name: values[layer] for name, values in self.cost.items()}
+        overhead = revenue.pop("overhead_and_variable_costs") * (1 + cost_inflation_pct / 100)
+        depreciation = revenue.pop("depreciation")
+        interest = self.interest_expense[
+            tuple(
+                0 if size == 1 else index
+                for size, index in zip(self.interest_expense.shape[:3], (row, column, layer))
+            )
+        ].copy()
+        ebitda = revenue["final_total"] - cost["personnel_costs"] - overhead
+        ebit = ebitda - depreciation
+        ebt = ebit - interest
+        taxes = np.where(ebt > 0, ebt, 0.0) * self.tax_rate
+        cost["overhead_and_variable_costs"] = overhead
+        cost["total_operating_costs"] = cost["personnel_costs"] + overhead
+        empty = ColumnTable.from_rows([])
+        return ModelResult(
+            revenue={
+                "revenue_final_by_year": revenue["final_total"].tolist(),
+                "components_by_year": ColumnTable.from_columns(revenue),
+            },
+            cost=ColumnTable.from_columns(cost),
+            pnl=ColumnTable.from_columns(
+                {
+                    "year": np.arange(ebitda.size),
+                    "revenue": revenue["final_total"],
+                    "personnel_costs": cost["personnel_costs"],
+                    "overhead_and_variable_costs": overhead,
+                    "ebitda": ebitda,
+                    "depreciation": depreciation,
+                    "ebit": ebit,
+                    "interest_expense": interest,
+                    "ebt": ebt,
+                    "taxes": taxes,
+                    "net_income": ebt - taxes,
+                }
+            ),
+            debt=empty,
+            cashflow=empty,
+            balance_sheet=empty,
+            equity={},
+        )
+
+
+def apply_stress(
+    inputs: Dict[str, np.ndarray],
+    utilization_delta_pp: np.ndarray,
+    pricing_stress_pct: np.ndarray,
+    cost_inflation_pct: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    stressed = dict(inputs)
+    pricing_factor = (1 + np.asarray(pricing_stress_pct, dtype=float) / 100)[:, None]
+    cost_factor = (1 + np.asarray(cost_inflation_pct, dtype=float) / 100)[:, None]
+    stressed["utilization_rate_pct"] = np.clip(
+        inputs["utilization_rate_pct"]
+        + (np.asarray(utilization_delta_pp, dtype=float) / 100)[:, None],
+        0.0,
+        1.0,
+    )
+    for name in ("group_day_rate_eur", "external_day_rate_eur"):
+        stressed[name] = inputs[name] * pricing_factor
+    for name in STRESSED_COST_FIELDS:
+        stressed[name] = inputs[name] * cost_factor
+    return stressed
+
+
+def stress_frontier(
+    assumptions: Assumptions,
+    utilization_deltas_pp: Sequence[int],
+    pricing_stresses_pct: Sequence[int],
+    max_cost_inflation_pct: int = MAX_COST_INFLATION_PCT,
+    points: int = DEFAULT_POINTS,
+) -> StressFrontier:
+    if points < 1:
+        raise ValueError("Stress frontier needs at least one point per iteration.")
+    if max_cost_inflation_pct < 0:
+        raise ValueError("Maximum cost inflation must not be negative.")
+    utilization = np.asarray(utilization_deltas_pp, dtype=int)
+    pricing = np.asarray(pricing_stresses_pct, dtype=int)
+    grid_utilization = np.repeat(utilization, pricing.size)
+    grid_pricing = np.tile(pricing, utilization.size)
+    count = grid_utilization.size
+    base = pack_assumptions([assumptions])
+    evaluations = 0
+
+    def evaluate(problems: np.ndarray, cost: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        nonlocal evaluations
+        evaluations += problems.size
+        inputs = {name: np.repeat(values, problems.size, axis=0) for name, values in base.items()}
+        return _breach(
+            evaluate_batch(
+                apply_stress(inputs, grid_utilization[problems], grid_pricing[problems], cost)
+            )
+        )
+
+    # Cost inflation is searched in whole percent, like the overlay slider:
+    # low is the highest value known to hold, high the lowest known to breach.
+    everything = np.arange(count)
+    unbounded = max_cost_inflation_pct + 1
+    ends = np.concatenate([np.zeros(count, dtype=int), np.full(count, max_cost_inflation_pct)])
+    year, binding = evaluate(np.concatenate([everything, everything]), ends)
+    at_zero = year[:count] >= 0
+    at_max = year[count:] >= 0
+    low = np.where(at_zero, -1, 0)
+    high = np.where(at_zero, 0, np.where(at_max, max_cost_inflation_pct, unbounded))
+    breach_year = np.where(at_zero, year[:count], year[count:])
+    breach_binding = np.where(at_zero, binding[:count], binding[count:])
+    steps = np.linspace(0.0, 1.0, points + 2)[1:-1]
+
+    while True:
+        active = np.flatnonzero((high < unbounded) & (high - low > 1))
+        if active.size == 0:
+            break
+        candidates = np.rint(low[active, None] + (high - low)[active, None] * steps).astype(int)
+        year, binding = evaluate(np.repeat(active, points), candidates.ravel())
+        breached = year.reshape(candidates.shape) >= 0
+        rows = np.arange(active.size)
+        hit = breached.any(axis=1)
+        first = breached.argmax(axis=1)
+        last_safe = np.where(hit, first - 1, points - 1)
+        low[active] = np.where(last_safe >= 0, candidates[rows, np.maximum(last_safe, 0)], low[active])
+        high[active] = np.where(hit, candidates[rows, first], high[active])
+        flat = rows * points + first
+        breach_year[active] = np.where(hit, year[flat], breach_year[active])
+        breach_binding[active] = np.where(hit, binding[flat], breach_binding[active])
+
+    shape = (utilization.size, pricing.size)
+    bounded = high < unbounded
+    return StressFrontier(
+        utilization_deltas_pp=utilization,
+        pricing_stresses_pct=pricing,
+        max_cost_inflation_pct=max_cost_inflation_pct,
+        breach_cost_inflation_pct=np.where(bounded, high, np.nan).reshape(shape),
+        breach_year=np.where(bounded, breach_year, -1).reshape(shape),
+        binding=np.where(bounded, breach_binding, -1).reshape(shape),
+        evaluations=evaluations,
+    )
+
+
+def _breach(result: BatchResult) -> Tuple[np.ndarray, np.ndarray]:
+    serviced = result.column("debt", "debt_service") != 0
+    dscr_breach = serviced & result.column("debt", "covenant_breach")
+    cash_breach = result.column("cashflow", "cash_balance") < 0
+    breach = dscr_breach | cash_breach
+    year = np.where(breach.any(axis=1), breach.argmax(axis=1), -1)
+    binding = np.where(
+        year < 0, -1, np.where(dscr_breach[np.arange(year.size), np.maximum(year, 0)], 1, 2)
+    )
+    return np.where(result.valid, year, 0), np.where(result.valid, binding, 0)
+
+
+def stress_surface(
+    assumptions: Assumptions,
+    utilization_deltas_pp: range,
+    pricing_stresses_pct: range,
+    cost_inflation_pct: range,
+) -> StressSurface:
+    if cost_inflation_pct.start != 0 or cost_inflation_pct.step != 1:
+        raise ValueError("Stress surface cost inflation must run from 0% in whole percent.")
+    base = pack_assumptions([assumptions])
+    shape = (len(utilization_deltas_pp), len(pricing_stresses_pct))
+    count = shape[0] * shape[1]
+    utilization = np.repeat(np.asarray(utilization_deltas_pp), shape[1])
+    pricing = np.tile(np.asarray(pricing_stresses_pct), shape[0])
+    inputs = {name: np.repeat(values, count, axis=0) for name, values in base.items()}
+    years = base["workdays_per_year"].shape[1]
+
+    revenue = {}
+    cost = {name: np.empty((len(cost_inflation_pct), years)) for name in SURFACE_COST_COLUMNS}
+    interest = None
+    # One batch per cost layer keeps memory at a single (utilization x pricing) plane.
+    for layer, inflation in enumerate(cost_inflation_pct):
+        result = evaluate_batch(
+            apply_stress(inputs, utilization, pricing, np.full(count, inflation))
+        )
+        if layer == 0:
+            revenue = {
+                name: result.column("revenue", name).reshape(shape + (years,)).copy()
+                for name in SURFACE_REVENUE_COLUMNS
+            }
+            for name in ("overhead_and_variable_costs", "depreciation"):
+                revenue[name] = result.column("pnl", name).reshape(shape + (years,)).copy()
+            first_interest = result.column("pnl", "interest_expense").reshape(shape + (years,))
+        for name in SURFACE_COST_COLUMNS:
+            cost[name][layer] = result.column("cost", name)[0]
+        layer_interest = result.column("pnl", "interest_expense").reshape(shape + (years,))
+        if interest is None and not np.array_equal(layer_interest, first_interest):
+            interest = np.empty(shape + (len(cost_inflation_pct), years))
+            interest[:, :, :layer] = first_interest[:, :, None, :]
+        if interest is not None:
+            interest[:, :, layer] = layer_interest
+    if interest is None:
+        interest = first_interest[:, :, None, :].copy()
+        if (interest == interest[:1, :1]).all():
+            interest = interest[:1, :1].copy()
+    return StressSurface(
+        utilization_deltas_pp=utilization_deltas_pp,
+        pricing_stresses_pct=pricing_stresses_pct,
+        cost_inflation_pct=cost_inflation_pct,
+        tax_rate=float(base["tax_cash_rate_pct"][0]),
+        revenue=revenue,
+        cost=cost,
+        interest_expense=interest,
+    )
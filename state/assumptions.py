@@ -1,10 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Dict, List
 
 PLANNING_YEARS = 5
+MAX_PLANNING_YEARS = 40
 SCENARIOS = ("Base", "Best", "Worst")
+SCENARIO_YEAR_FIELDS = (
+    "workdays_per_year",
+    "utilization_rate_pct",
+    "group_day_rate_eur",
+    "external_day_rate_eur",
+    "day_rate_growth_pct",
+    "revenue_growth_pct",
+    "group_capacity_share_pct",
+    "external_capacity_share_pct",
+    "guarantee_pct_by_year",
+)
 
 
 @dataclass(frozen=True)
@@ -136,51 +148,117 @@ class Assumptions:
     tax_and_distributions: TaxAssumptions
     valuation: ValuationAssumptions
     equity: EquityAssumptions
+    planning_years: int = PLANNING_YEARS
+
+
+def _year_list(value: float, years: int = PLANNING_YEARS) -> List[float]:
+    return [float(value) for _ in range(years)]
+
+
+def _resize(values: list, years: int) -> list:
+    if len(values) >= years:
+        return list(values[:years])
+    return list(values) + [values[-1]] * (years - len(values))
+
+
+def _shift_year(year: int, previous_last: int, last_year: int) -> int:
+    if year == previous_last:
+        return last_year
+    return min(year, last_year)
+
+
+def with_planning_years(assumptions: Assumptions, years: int) -> Assumptions:
+    years = int(years)
+    if not 1 <= years <= MAX_PLANNING_YEARS:
+        raise ValueError(
+            f"Planning horizon must be between 1 and {MAX_PLANNING_YEARS} years."
+        )
+    scenarios = {
+        name: replace(
+            scenario,
+            **{
+                field: _resize(getattr(scenario, field), years)
+                for field in SCENARIO_YEAR_FIELDS
+            },
+        )
+        for name, scenario in assumptions.revenue.scenarios.items()
+    }
+    cost = replace(
+        assumptions.cost,
+        personnel_by_year=_resize(assumptions.cost.personnel_by_year, years),
+        fixed_overhead_by_year=_resize(assumptions.cost.fixed_overhead_by_year, years),
+        variable_costs_by_year=_resize(assumptions.cost.variable_costs_by_year, years),
+    )
+    previous_last = assumptions.planning_years - 1
+    last_year = years - 1
+    valuation = replace(
+        assumptions.valuation,
+        reference_year=_shift_year(
+            assumptions.valuation.reference_year, previous_last, last_year
+        ),
+        valuation_start_year=min(assumptions.valuation.valuation_start_year, last_year),
+    )
+    equity = replace(
+        assumptions.equity,
+        exit_year=_shift_year(assumptions.equity.exit_year, previous_last, last_year),
+    )
+    financing = assumptions.financing
+    if financing.amortization_period_years == assumptions.planning_years:
+        financing = replace(financing, amortization_period_years=years)
+    return replace(
+        assumptions,
+        revenue=RevenueAssumptions(scenarios=scenarios),
+        cost=cost,
+        financing=financing,
+        valuation=valuation,
+        equity=equity,
+        planning_years=years,
+    )
 
 
-def _year_list(value: float) -> List[float]:
-    return [float(value) for _ in range(PLANNING_YEARS)]
-
-
-def default_assumptions() -> Assumptions:
+def default_assumptions(planning_years: int = PLANNING_YEARS) -> Assumptions:
+    if not 1 <= planning_years <= MAX_PLANNING_YEARS:
+        raise ValueError(
+            f"Planning horizon must be between 1 and {MAX_PLANNING_YEARS} years."
+        )
     base_revenue = RevenueScenarioAssumptions(
-        workdays_per_year=_year_list(220.0),
-        utilization_rate_pct=_year_list(0.7),
-        group_day_rate_eur=_year_list(900.0),
-        external_day_rate_eur=_year_list(1100.0),
-        day_rate_growth_pct=_year_list(0.02),
-        revenue_growth_pct=_year_list(0.0),
-        group_capacity_share_pct=_year_list(0.7),
-        external_capacity_share_pct=_year_list(0.3),
+        workdays_per_year=_year_list(220.0, planning_years),
+        utilization_rate_pct=_year_list(0.7, planning_years),
+        group_day_rate_eur=_year_list(900.0, planning_years),
+        external_day_rate_eur=_year_list(1100.0, planning_years),
+        day_rate_growth_pct=_year_list(0.02, planning_years),
+        revenue_growth_pct=_year_list(0.0, planning_years),
+        group_capacity_share_pct=_year_list(0.7, planning_years),
+        external_capacity_share_pct=_year_list(0.3, planning_years),
         reference_revenue_eur=2_500_000.0,
-        guarantee_pct_by_year=_year_list(0.0),
+        guarantee_pct_by_year=_year_list(0.0, planning_years),
     )
     revenue = RevenueAssumptions(
         scenarios={
             "Base": base_revenue,
             "Best": RevenueScenarioAssumptions(
-                workdays_per_year=_year_list(225.0),
-                utilization_rate_pct=_year_list(0.75),
-                group_day_rate_eur=_year_list(950.0),
-                external_day_rate_eur=_year_list(1200.0),
-                day_rate_growth_pct=_year_list(0.03),
-                revenue_growth_pct=_year_list(0.0),
-                group_capacity_share_pct=_year_list(0.65),
-                external_capacity_share_pct=_year_list(0.35),
+                workdays_per_year=_year_list(225.0, planning_years),
+                utilization_rate_pct=_year_list(0.75, planning_years),
+                group_day_rate_eur=_year_list(950.0, planning_years),
+                external_day_rate_eur=_year_list(1200.0, planning_years),
+                day_rate_growth_pct=_year_list(0.03, planning_years),
+                revenue_growth_pct=_year_list(0.0, planning_years),
+                group_capacity_share_pct=_year_list(0.65, planning_years),
+                external_capacity_share_pct=_year_list(0.35, planning_years),
                 reference_revenue_eur=2_500_000.0,
-                guarantee_pct_by_year=_year_list(0.0),
+                guarantee_pct_by_year=_year_list(0.0, planning_years),
             ),
             "Worst": RevenueScenarioAssumptions(
-                workdays_per_year=_year_list(210.0),
-                utilization_rate_pct=_year_list(0.6),
-                group_day_rate_eur=_year_list(850.0),
-                external_day_rate_eur=_year_list(1000.0),
-                day_rate_growth_pct=_year_list(0.01),
-                revenue_growth_pct=_year_list(0.0),
-                group_capacity_share_pct=_year_list(0.75),
-                external_capacity_share_pct=_year_list(0.25),
+                workdays_per_year=_year_list(210.0, planning_years),
+                utilization_rate_pct=_year_list(0.6, planning_years),
+                group_day_rate_eur=_year_list(850.0, planning_years),
+                external_day_rate_eur=_year_list(1000.0, planning_years),
+                day_rate_growth_pct=_year_list(0.01, planning_years),
+                revenue_growth_pct=_year_list(0.0, planning_years),
+                group_capacity_share_pct=_year_list(0.75, planning_years),
+                external_capacity_share_pct=_year_list(0.25, planning_years),
                 reference_revenue_eur=2_500_000.0,
-                guarantee_pct_by_year=_year_list(0.0),
+                guarantee_pct_by_year=_year_list(0.0, planning_years),
             ),
         }
     )
@@ -196,7 +274,7 @@ def default_assumptions() -> Assumptions:
                 backoffice_loaded_cost_eur=65_000.0,
                 management_cost_eur=150_000.0,
             )
-            for _ in range(PLANNING_YEARS)
+            for _ in range(planning_years)
         ],
         fixed_overhead_by_year=[
             FixedOverheadYearAssumptions(
@@ -207,7 +285,7 @@ def default_assumptions() -> Assumptions:
                 services_eur=5_000.0,
                 other_services_eur=0.0,
             )
-            for _ in range(PLANNING_YEARS)
+            for _ in range(planning_years)
         ],
         variable_costs_by_year=[
             VariableCostYearAssumptions(
@@ -218,7 +296,7 @@ def default_assumptions() -> Assumptions:
                 communication_type="EUR",
                 communication_value=0.0,
             )
-            for _ in range(PLANNING_YEARS)
+            for _ in range(planning_years)
         ],
     )
 
@@ -233,7 +311,7 @@ def default_assumptions() -> Assumptions:
         initial_debt_eur=3_000_000.0,
         interest_rate_pct=0.06,
         amortization_type="Linear",
-        amortization_period_years=5,
+        amortization_period_years=planning_years,
         grace_period_years=0,
         special_repayment_year=None,
         special_repayment_amount_eur=0.0,
@@ -260,14 +338,14 @@ def default_assumptions() -> Assumptions:
     valuation = ValuationAssumptions(
         seller_multiple=6.0,
         market_multiple=6.0,
-        reference_year=4,
+        reference_year=planning_years - 1,
         discount_rate_pct=0.10,
         valuation_start_year=0,
         transaction_costs_pct=0.0,
     )
 
     equity = EquityAssumptions(
-        exit_year=4,
+        exit_year=planning_years - 1,
         exit_mechanism="Management buys out investor",
         investor_participation="Pro-rata",
         management_participation="Pro-rata",
@@ -284,4 +362,5 @@ def default_assumptions() -> Assumptions:
         tax_and_distributions=tax_and_distributions,
         valuation=valuation,
         equity=equity,
+        planning_years=planning_years,
     )
@@ -1,16 +1,59 @@
 from __future__ import annotations
 
+import os
+import threading
+from dataclasses import asdict
 from pathlib import Path
 
 from state.assumptions import Assumptions
-from state.persistence import load_assumptions, save_assumptions
+from state.catalog import CaseCatalog
+from state.history import CaseHistory
+from state.journal import case_journal, overlay_ancestors, read_case_data
+from state.schema import build_assumptions_with_warnings
 
-CASES_DIR = Path("data/cases")
+DATA_DIR = Path("data")
+CASES_DIR = DATA_DIR / "cases"
+CATALOG_PATH = DATA_DIR / ".catalog.sqlite3"
+HISTORY_PATH = DATA_DIR / ".history.sqlite3"
+
+_CATALOG: CaseCatalog | None = None
+_HISTORY: CaseHistory | None = None
+_STORES_LOCK = threading.Lock()
+
+
+def case_catalog() -> CaseCatalog:
+    global _CATALOG
+    with _STORES_LOCK:
+        if _CATALOG is None:
+            CASES_DIR.mkdir(parents=True, exist_ok=True)
+            _CATALOG = CaseCatalog(CATALOG_PATH, (DATA_DIR, CASES_DIR))
+        return _CATALOG
+
+
+def case_history() -> CaseHistory:
+    global _HISTORY
+    with _STORES_LOCK:
+        if _HISTORY is None:
+            DATA_DIR.mkdir(parents=True, exist_ok=True)
+            _HISTORY = CaseHistory(HISTORY_PATH)
+        return _HISTORY
 
 
 def list_cases() -> list[str]:
-    CASES_DIR.mkdir(parents=True, exist_ok=True)
-    return sorted([path.stem for path in CASES_DIR.glob("*.json")])
+    catalog = case_catalog()
+    catalog.refresh()
+    return catalog.names(directory=CASES_DIR)
+
+
+def discover_case_paths() -> list[str]:
+    catalog = case_catalog()
+    catalog.refresh()
+    base_case = str(DATA_DIR / "base_case.json")
+    paths = catalog.paths(directory=DATA_DIR)
+    paths = [path for path in paths if path == base_case] + [
+        path for path in paths if path != base_case
+    ]
+    return paths + catalog.paths(directory=CASES_DIR)
 
 
 def case_path(case_name: str) -> Path:
@@ -19,11 +62,49 @@ def case_path(case_name: str) -> Path:
 
 
 def load_case(path: str | Path) -> Assumptions:
-    return load_assumptions(path)
+    return load_case_with_warnings(path)[0]
+
+
+def load_case_with_warnings(path: str | Path) -> tuple[Assumptions, list[str]]:
+    return build_assumptions_with_warnings(case_journal(path).reload())
+
+
+def record_case(
+    assumptions: Assumptions, path: str | Path, original: dict | None = None
+) -> None:
+    case_journal(path).record(asdict(assumptions), original)
 
 
-def save_case(assumptions: Assumptions, path: str | Path) -> None:
-    save_assumptions(assumptions, path)
+def save_case(
+    assumptions: Assumptions,
+    path: str | Path,
+    original: dict | None = None,
+    source: str | Path | None = None,
+    overlay_of: str | Path | None = None,
+) -> str:
+    data = asdict(assumptions)
+    journal = case_journal(path)
+    if overlay_of is not None:
+        lineage = [os.path.abspath(overlay_of)] + [
+            os.path.abspath(parent) for parent in overlay_ancestors(overlay_of)
+        ]
+        if os.path.abspath(path) in lineage:
+            raise ValueError(f"Case '{path}' cannot be an overlay of itself or of a case derived from it.")
+        journal.compact(data, parent=overlay_of)
+    elif original is None:
+        journal.compact(data)
+    else:
+        journal.record(data, original)
+        journal.compact()
+    case_catalog().refresh_path(path)
+    history = case_history()
+    if source is not None:
+        # A copy starts as a delta against the case it was saved from.
+        parent = history.head(source)
+        if parent is None and Path(source).exists():
+            parent = history.commit(source, read_case_data(source), "Imported")
+        return history.commit(path, data, f"Saved as copy of {Path(source).stem}", parent)
+    return history.commit(path, data, "Saved")
 
 
 def _sanitize_case_name(name: str) -> str:
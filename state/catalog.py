@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from state.journal import JOURNAL_SUFFIX, case_parent, read_case_bytes
+
+POLL_SECONDS = 2.0
+_SCHEMA_VERSION = 3
+KPI_COLUMNS = ("irr", "exit_value", "min_dscr", "min_cash", "peak_debt", "price_headroom")
+ORDER_COLUMNS = ("name", "mtime_ns", "size", "scenario") + KPI_COLUMNS
+_NULLABLE_ORDER_COLUMNS = ("scenario",) + KPI_COLUMNS
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS cases (
+    path TEXT PRIMARY KEY,
+    directory TEXT NOT NULL,
+    name TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    scenario TEXT,
+    parent TEXT,
+    kpi_fingerprint TEXT,
+    {", ".join(f"{column} REAL" for column in KPI_COLUMNS)},
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS cases_directory_name ON cases (directory, name, path);
+CREATE INDEX IF NOT EXISTS cases_name ON cases (name);
+CREATE INDEX IF NOT EXISTS cases_parent ON cases (parent);
+{"".join(
+    f"CREATE INDEX IF NOT EXISTS cases_{column} ON cases (directory, {column}, name) "
+    f"WHERE {column} IS NOT NULL;"
+    for column in _NULLABLE_ORDER_COLUMNS
+)}
+"""
+_FIELDS = (
+    "path",
+    "directory",
+    "name",
+    "mtime_ns",
+    "size",
+    "fingerprint",
+    "scenario",
+    "parent",
+    "kpi_fingerprint",
+) + KPI_COLUMNS + ("error",)
+
+# A new fingerprint drops the cached KPIs; an unchanged one (e.g. a touch) keeps them.
+_UPSERT = (
+    "INSERT INTO cases (path, directory, name, mtime_ns, size, fingerprint, scenario, parent) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (path) DO UPDATE SET mtime_ns = excluded.mtime_ns, size = excluded.size, "
+    "fingerprint = excluded.fingerprint, scenario = excluded.scenario, parent = excluded.parent, "
+    + ", ".join(
+        f"{column} = CASE WHEN excluded.fingerprint = cases.fingerprint THEN cases.{column} END"
+        for column in ("kpi_fingerprint",) + KPI_COLUMNS + ("error",)
+    )
+)
+# A case that cannot be resolved keeps its row; the error stands in for its KPIs.
+_UPSERT_FAILED = (
+    "INSERT INTO cases (path, directory, name, mtime_ns, size, fingerprint, parent, "
+    "kpi_fingerprint, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (path) DO UPDATE SET mtime_ns = excluded.mtime_ns, size = excluded.size, "
+    "fingerprint = excluded.fingerprint, scenario = NULL, parent = excluded.parent, "
+    "kpi_fingerprint = excluded.kpi_fingerprint, "
+    + ", ".join(f"{column} = NULL" for column in KPI_COLUMNS)
+    + ", error = excluded.error"
+)
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    path: str
+    directory: str
+    name: str
+    mtime_ns: int
+    size: int
+    fingerprint: str
+    scenario: str | None = None
+    parent: str | None = None
+    kpi_fingerprint: str | None = None
+    irr: float | None = None
+    exit_value: float | None = None
+    min_dscr: float | None = None
+    min_cash: float | None = None
+    peak_debt: float | None = None
+    price_headroom: float | None = None
+    error: str | None = None
+
+    @property
+    def has_kpis(self) -> bool:
+        return self.kpi_fingerprint == self.fingerprint
+
+
+class CaseCatalog:
+    def __init__(self, database: str | Path, roots: Sequence[str | Path]) -> None:
+        self.roots = tuple(Path(root) for root in roots)
+        self._lock = threading.Lock()
+        self._polled = float("-inf")
+        self._known: Dict[str, Tuple[int, int]] | None = None
+        self._connection = sqlite3.connect(str(database), check_same_thread=False)
+        if self._connection.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            # The catalog only caches what is on disk, so an older layout is rebuilt.
+            self._connection.executescript("DROP TABLE IF EXISTS cases;")
+            self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._connection.executescript(_SCHEMA)
+
+    def refresh(self, force: bool = False) -> int:
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._polled < POLL_SECONDS:
+                return 0
+            self._polled = now
+            stats = self._scan()
+            known = self._known_stats()
+            changed = {path: stat for path, stat in stats.items() if known.get(path) != stat}
+            removed = [path for path in known if path not in stats]
+            return self._apply(changed, removed)
+
+    def refresh_path(self, path: str | Path) -> None:
+        stat = _case_stat(Path(path))
+        with self._lock:
+            if stat is None:
+                self._apply({}, [str(path)])
+            else:
+                self._apply({str(path): stat}, [])
+
+    def cases(
+        self,
+        directory: str | Path | None = None,
+        scenario: str | None = None,
+        search: str | None = None,
+        order_by: str = "name",
+        descending: bool = False,
+        limit: int | None = None,
+    ) -> List[CatalogEntry]:
+        rows = self._select(_FIELDS, directory, scenario, search, order_by, descending, limit)
+        return [CatalogEntry(*row) for row in rows]
+
+    def paths(
+        self,
+        directory: str | Path | None = None,
+        scenario: str | None = None,
+        search: str | None = None,
+        order_by: str = "name",
+        descending: bool = False,
+        limit: int | None = None,
+    ) -> List[str]:
+        rows = self._select(("path",), directory, scenario, search, order_by, descending, limit)
+        return [path for (path,) in rows]
+
+    def names(
+        self,
+        directory: str | Path | None = None,
+        scenario: str | None = None,
+        search: str | None = None,
+        order_by: str = "name",
+        descending: bool = False,
+        limit: int | None = None,
+    ) -> List[str]:
+        rows = self._select(("name",), directory, scenario, search, order_by, descending, limit)
+        return [name for (name,) in rows]
+
+    def entries(self, paths: Iterable[str]) -> Dict[str, CatalogEntry]:
+        paths = list(paths)
+        entries = {}
+        with self._lock:
+            for start in range(0, len(paths), 500):
+                chunk = paths[start : start + 500]
+                query = (
+                    f"SELECT {', '.join(_FIELDS)} FROM cases "
+                    f"WHERE path IN ({', '.join('?' * len(chunk))})"
+                )
+                for row in self._connection.execute(query, chunk):
+                    entries[row[0]] = CatalogEntry(*row)
+        return entries
+
+    def store_kpis(self, path: str, fingerprint: str, kpis: Mapping[str, object]) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"UPDATE cases SET kpi_fingerprint = ?, "
+                f"{', '.join(f'{column} = ?' for column in KPI_COLUMNS)}, error = ? "
+                "WHERE path = ? AND fingerprint = ?",
+                [fingerprint]
+                + [kpis.get(column) for column in KPI_COLUMNS]
+                + [kpis.get("error"), path, fingerprint],
+            )
+
+    def _select(
+        self,
+        columns: Sequence[str],
+        directory: str | Path | None,
+        scenario: str | None,
+        search: str | None,
+        order_by: str,
+        descending: bool,
+        limit: int | None,
+    ) -> List[tuple]:
+        if order_by not in ORDER_COLUMNS:
+            raise ValueError(f"Unknown catalog order '{order_by}', expected one of {ORDER_COLUMNS}.")
+        clauses = []
+        parameters: list = []
+        if directory is not None:
+            clauses.append("directory = ?")
+            parameters.append(str(Path(directory)))
+        if scenario is not None:
+            clauses.append("scenario = ?")
+            parameters.append(scenario)
+        if search:
+            clauses.append("name LIKE ? ESCAPE '\\'")
+            escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            parameters.append(f"%{escaped}%")
+        query = f"SELECT {', '.join(columns)} FROM cases"
+        direction = "DESC" if descending else "ASC"
+        if order_by == "name":
+            return self._query(query, clauses, parameters, f"name {direction}", limit)
+        if order_by not in _NULLABLE_ORDER_COLUMNS:
+            return self._query(
+                query, clauses, parameters, f"{order_by} {direction}, name ASC", limit
+            )
+        # NULLs sort last in either direction; two queries keep each one on its index
+        # instead of sorting the table by an "IS NULL" expression.
+        rows = self._query(
+            query,
+            clauses + [f"{order_by} IS NOT NULL"],
+            parameters,
+            f"{order_by} {direction}, name {direction}",
+            limit,
+        )
+        if limit is None or len(rows) < limit:
+            rows += self._query(
+                query,
+                clauses + [f"{order_by} IS NULL"],
+                parameters,
+                "name ASC",
+                None if limit is None else limit - len(rows),
+            )
+        return rows
+
+    def _query(
+        self, query: str, clauses: List[str], parameters: list, order: str, limit: int | None
+    ) -> List[tuple]:
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += f" ORDER BY {order}"
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters = parameters + [limit]
+        with self._lock:
+            return self._connection.execute(query, parameters).fetchall()
+
+    def _known_stats(self) -> Dict[str, Tuple[int, int]]:
+        if self._known is None:
+            self._known = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in self._connection.execute(
+                    "SELECT path, mtime_ns, size FROM cases"
+                )
+            }
+        return self._known
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        stats: Dict[str, Tuple[int, int]] = {}
+        journals: Dict[str, Tuple[int, int]] = {}
+        for root in self.roots:
+            if not root.is_dir():
+                continue
+            with os.scandir(str(root)) as listing:
+                for item in listing:
+                    if item.name.endswith(".json") and item.is_file():
+                        stat = item.stat()
+                        stats[item.path] = (stat.st_mtime_ns, stat.st_size)
+                    elif item.name.endswith(".json" + JOURNAL_SUFFIX):
+                        stat = item.stat()
+                        journals[item.path[: -len(JOURNAL_SUFFIX)]] = (
+                            stat.st_mtime_ns,
+                            stat.st_size,
+                        )
+        for path, (mtime_ns, size) in journals.items():
+            if path in stats:
+                stats[path] = (max(stats[path][0], mtime_ns), stats[path][1] + size)
+        return stats
+
+    def _apply(self, changed: Dict[str, Tuple[int, int]], removed: List[str]) -> int:
+        # Overlays resolve through their parents, so a changed or removed parent
+        # re-fingerprints every case derived from it.
+        dirty = set(changed) | set(removed)
+        frontier = list(dirty)
+        while frontier:
+            chunk, frontier = frontier[:500], frontier[500:]
+            for path, mtime_ns, size in self._connection.execute(
+                f"SELECT path, mtime_ns, size FROM cases "
+                f"WHERE parent IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ):
+                if path not in dirty:
+                    dirty.add(path)
+                    frontier.append(path)
+                    changed.setdefault(path, (mtime_ns, size))
+        with self._connection:
+            self._upsert(list(changed.items()))
+            self._connection.executemany(
+                "DELETE FROM cases WHERE path = ?", [(path,) for path in removed]
+            )
+        known = self._known_stats()
+        known.update(changed)
+        for path in removed:
+            known.pop(path, None)
+        return len(changed) + len(removed)
+
+    def _upsert(self, changed: List[Tuple[str, Tuple[int, int]]]) -> None:
+        rows = []
+        failed = []
+        for path, (mtime_ns, size) in changed:
+            location = (path, str(Path(path).parent), Path(path).stem, mtime_ns, size)
+            try:
+                payload = read_case_bytes(path)
+            except (OSError, ValueError, TypeError, KeyError, IndexError) as exc:
+                # Unreadable now, or an overlay whose parent is missing, cyclic or
+                # no longer has what it overrides; listed with the reason.
+                message = str(exc) or type(exc).__name__
+                digest = hashlib.blake2b(message.encode("utf-8"), digest_size=16).hexdigest()
+                failed.append(location + (digest, case_parent(path), digest, message))
+                continue
+            try:
+                scenario = json.loads(payload).get("scenario")
+            except (ValueError, AttributeError):
+                scenario = None
+            rows.append(
+                location
+                + (
+                    hashlib.blake2b(payload, digest_size=16).hexdigest(),
+                    scenario if isinstance(scenario, str) else None,
+                    case_parent(path),
+                )
+            )
+        self._connection.executemany(_UPSERT, rows)
+        self._connection.executemany(_UPSERT_FAILED, failed)
+
+
+def _case_stat(path: Path) -> Tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    journal = path.with_name(path.name + JOURNAL_SUFFIX)
+    try:
+        journal_stat = journal.stat()
+    except OSError:
+        return stat.st_mtime_ns, stat.st_size
+    return max(stat.st_mtime_ns, journal_stat.st_mtime_ns), stat.st_size + journal_stat.st_size
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Tuple
+
+from state.assumptions import Assumptions
+from state.journal import apply_changes, diff_case_data
+from state.schema import _path, build_assumptions
+
+KEYFRAME_INTERVAL = 50
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    version TEXT PRIMARY KEY,
+    parent TEXT,
+    depth INTEGER NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL,
+    version TEXT NOT NULL REFERENCES objects (version),
+    time REAL NOT NULL,
+    message TEXT NOT NULL,
+    changes INTEGER
+);
+CREATE INDEX IF NOT EXISTS history_path ON history (path, id);
+"""
+_CHAIN = """
+WITH RECURSIVE chain (version, parent, depth, payload) AS (
+    SELECT version, parent, depth, payload FROM objects WHERE version = ?
+    UNION ALL
+    SELECT objects.version, objects.parent, objects.depth, objects.payload
+    FROM objects JOIN chain ON objects.version = chain.parent
+    WHERE chain.depth > 0
+)
+SELECT depth, payload FROM chain ORDER BY depth
+"""
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    path: str
+    version: str
+    time: float
+    message: str
+    changes: int | None = None
+
+
+@dataclass(frozen=True)
+class CaseChange:
+    path: str
+    old: object = None
+    new: object = None
+
+
+def version_key(data: dict) -> str:
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class CaseHistory:
+    def __init__(self, database: str | Path) -> None:
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(database), check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    def head(self, path: str | Path) -> str | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT version FROM history WHERE path = ? ORDER BY id DESC LIMIT 1",
+                (str(path),),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def commit(
+        self, path: str | Path, data: dict, message: str = "", parent: str | None = None
+    ) -> str:
+        version = version_key(data)
+        head = self.head(path)
+        if version == head:
+            return version
+        parent = head if parent is None else parent
+        base = None if parent is None else self.checkout(parent)
+        changes = None if base is None else diff_case_data(base, data)
+        with self._lock, self._connection:
+            known = self._connection.execute(
+                "SELECT 1 FROM objects WHERE version = ?", (version,)
+            ).fetchone()
+            if known is None:
+                self._store(version, parent, data, changes)
+            self._connection.execute(
+                "INSERT INTO history (path, version, time, message, changes) VALUES (?, ?, ?, ?, ?)",
+                (str(path), version, time.time(), message, None if changes is None else len(changes)),
+            )
+        return version
+
+    def log(self, path: str | Path, limit: int | None = None) -> List[HistoryEntry]:
+        query = "SELECT path, version, time, message, changes FROM history WHERE path = ? ORDER BY id DESC"
+        parameters: list = [str(path)]
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(limit)
+        with self._lock:
+            rows = self._connection.execute(query, parameters).fetchall()
+        return [HistoryEntry(*row) for row in rows]
+
+    def checkout(self, version: str) -> dict:
+        with self._lock:
+            rows = self._connection.execute(_CHAIN, (version,)).fetchall()
+        if not rows or rows[0][0] != 0:
+            raise ValueError(f"Unknown case version '{version}'.")
+        data = json.loads(zlib.decompress(rows[0][1]))
+        for _, payload in rows[1:]:
+            data = apply_changes(data, json.loads(zlib.decompress(payload)))
+        return data
+
+    def diff(self, old_version: str, new_version: str) -> List[CaseChange]:
+        return diff_assumptions(
+            build_assumptions(self.checkout(old_version)),
+            build_assumptions(self.checkout(new_version)),
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            objects, deltas, payload_bytes = self._connection.execute(
+                "SELECT COUNT(*), SUM(depth > 0), COALESCE(SUM(LENGTH(payload)), 0) FROM objects"
+            ).fetchone()
+            versions = self._connection.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+        return {
+            "objects": objects,
+            "deltas": deltas or 0,
+            "versions": versions,
+            "payload_bytes": payload_bytes,
+        }
+
+    def _store(
+        self, version: str, parent: str | None, data: dict, changes: list | None
+    ) -> None:
+        depth = 0
+        if parent is not None:
+            depth = self._connection.execute(
+                "SELECT depth FROM objects WHERE version = ?", (parent,)
+            ).fetchone()[0] + 1
+        snapshot = zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        delta = None
+        if changes is not None and depth <= KEYFRAME_INTERVAL:
+            delta = zlib.compress(json.dumps(changes, separators=(",", ":")).encode("utf-8"))
+        # A keyframe bounds the chain replayed on checkout; it is also used
+        # whenever the delta would not be smaller than the snapshot.
+        if delta is None or len(delta) >= len(snapshot):
+            self._connection.execute(
+                "INSERT INTO objects (version, parent, depth, payload) VALUES (?, NULL, 0, ?)",
+                (version, snapshot),
+            )
+        else:
+            self._connection.execute(
+                "INSERT INTO objects (version, parent, depth, payload) VALUES (?, ?, ?, ?)",
+                (version, parent, depth, delta),
+            )
+
+
+def diff_assumptions(old: Assumptions, new: Assumptions) -> List[CaseChange]:
+    changes: List[CaseChange] = []
+    _diff(old, new, (), changes)
+    return changes
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(field.name for field in fields(cls))
+
+
+def _diff(old: object, new: object, where: tuple, changes: List[CaseChange]) -> None:
+    if old is new:
+        return
+    if old is _MISSING or new is _MISSING:
+        for path, value in _leaves(new if old is _MISSING else old, where):
+            changes.append(
+                CaseChange(path, None, value) if old is _MISSING else CaseChange(path, value, None)
+            )
+    elif is_dataclass(old) and type(old) is type(new):
+        for name in _field_names(type(old)):
+            _diff(getattr(old, name), getattr(new, name), (where, name), changes)
+    elif isinstance(old, dict) and isinstance(new, dict):
+        for key, value in old.items():
+            _diff(value, new.get(key, _MISSING), (where, key), changes)
+        for key, value in new.items():
+            if key not in old:
+                _diff(_MISSING, value, (where, key), changes)
+    elif isinstance(old, list) and isinstance(new, list):
+        for index in range(max(len(old), len(new))):
+            _diff(
+                old[index] if index < len(old) else _MISSING,
+                new[index] if index < len(new) else _MISSING,
+                (where, index),
+                changes,
+            )
+    elif old != new:
+        changes.append(CaseChange(_path(where), old, new))
+
+
+def _leaves(value: object, where: tuple) -> List[Tuple[str, object]]:
+    if is_dataclass(value):
+        items = [(name, getattr(value, name)) for name in _field_names(type(value))]
+    elif isinstance(value, dict):
+        items = list(value.items())
+    elif isinstance(value, list):
+        items = list(enumerate(value))
+    else:
+        return [(_path(where), value)]
+    return [leaf for key, item in items for leaf in _leaves(item, (where, key))]
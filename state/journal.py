@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from state.persistence import _write_json_atomic
+from state.schema import _path, build_assumptions
+
+DEBOUNCE_SECONDS = 1.0
+COMPACT_AFTER_ENTRIES = 200
+JOURNAL_SUFFIX = ".journal"
+OVERLAY_PARENT = "parent"
+OVERLAY_OVERRIDES = "overrides"
+RESOLVED_CACHE_ENTRIES = 1024
+
+Change = Tuple[List[str | int], object]
+
+
+def journal_path(path: str | Path) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + JOURNAL_SUFFIX)
+
+
+def diff_case_data(old: object, new: object, prefix: List[str | int] | None = None) -> List[Change]:
+    prefix = [] if prefix is None else prefix
+    if old == new and type(old) is type(new):
+        return []
+    if isinstance(old, dict) and isinstance(new, dict) and old.keys() <= new.keys():
+        # Added keys are set like any other leaf; a removed key replaces the whole dict.
+        changes = []
+        for key in new:
+            if key in old:
+                changes += diff_case_data(old[key], new[key], prefix + [key])
+            else:
+                changes.append((prefix + [key], new[key]))
+        return changes
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        changes = []
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            changes += diff_case_data(old_item, new_item, prefix + [index])
+        return changes
+    return [(prefix, new)]
+
+
+def apply_changes(data: dict, changes: List[Change]) -> dict:
+    for keys, value in changes:
+        if not keys:
+            data = value
+            continue
+        if not _applies(data, keys):
+            raise ValueError(f"Change to '{change_path(keys)}' does not apply: the path no longer exists.")
+        target = data
+        for key in keys[:-1]:
+            target = target[key]
+        target[keys[-1]] = value
+    return data
+
+
+def change_path(keys: List[str | int]) -> str:
+    where: tuple = ()
+    for key in keys:
+        where = (where, key)
+    return _path(where)
+
+
+def _applies(data: object, keys: List[str | int]) -> bool:
+    # The parent of the leaf must exist; a dict may gain the leaf, a list may not.
+    if not _resolves(data, keys[:-1]):
+        return False
+    for key in keys[:-1]:
+        data = data[key]
+    if isinstance(data, dict):
+        return True
+    return isinstance(data, list) and type(keys[-1]) is int and 0 <= keys[-1] < len(data)
+
+
+def _resolves(data: object, keys: List[str | int]) -> bool:
+    for key in keys:
+        if isinstance(data, dict) and key in data:
+            data = data[key]
+        elif isinstance(data, list) and type(key) is int and 0 <= key < len(data):
+            data = data[key]
+        else:
+            return False
+    return True
+
+
+def replay_journal(data: dict, payload: bytes, base: str | None = None) -> dict:
+    for line in payload.splitlines():
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            # A torn final line from a crash mid-append; everything before it is intact.
+            break
+        if base is not None and entry.get("base", base) != base:
+            # Recorded against an older snapshot: a compaction wrote the new
+            # snapshot but crashed before removing the journal.
+            continue
+        data = apply_changes(data, entry["changes"])
+    return data
+
+
+def snapshot_digest(payload: bytes) -> str:
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def is_overlay(data: object) -> bool:
+    return isinstance(data, dict) and OVERLAY_PARENT in data and OVERLAY_OVERRIDES in data
+
+
+def overlay_document(parent: str | Path, parent_data: dict, data: dict) -> dict:
+    changes = diff_case_data(_normalized(parent_data), data)
+    return {
+        OVERLAY_PARENT: os.path.normpath(parent),
+        OVERLAY_OVERRIDES: [[keys, value] for keys, value in changes],
+    }
+
+
+def _normalized(data: dict) -> dict:
+    # Overrides address the full schema, so a sparse parent file is filled with
+    # defaults before they are applied or diffed against it.
+    return asdict(build_assumptions(data))
+
+
+def case_parent(path: str | Path) -> str | None:
+    try:
+        data = json.loads(Path(path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not is_overlay(data) or not isinstance(data[OVERLAY_PARENT], str):
+        return None
+    return os.path.normpath(data[OVERLAY_PARENT])
+
+
+def overlay_ancestors(path: str | Path) -> List[str]:
+    ancestors: List[str] = []
+    parent = case_parent(path)
+    while parent is not None:
+        if parent in ancestors:
+            raise ValueError(f"Overlay case '{path}' inherits from itself.")
+        ancestors.append(parent)
+        parent = case_parent(parent)
+    return ancestors
+
+
+def read_case_data(path: str | Path) -> dict:
+    return json.loads(read_case_bytes(path))
+
+
+def read_case_bytes(path: str | Path) -> bytes:
+    return _resolve(path, ())[1]
+
+
+# Resolved overlays and their parents, keyed by absolute path. An entry is
+# valid while its own file, its journal and its parent's signature are unchanged.
+_RESOLVED: OrderedDict[str, Tuple[tuple, str | None, tuple | None, bytes]] = OrderedDict()
+# Parents filled with defaults, keyed the same way and checked against the parent signature.
+_NORMALIZED: OrderedDict[str, Tuple[tuple, bytes]] = OrderedDict()
+_RESOLVED_LOCK = threading.Lock()
+
+
+def _normalized_parent(parent: str, signature: tuple, payload: bytes) -> dict:
+    key = os.path.abspath(parent)
+    with _RESOLVED_LOCK:
+        cached = _NORMALIZED.get(key)
+    if cached is None or cached[0] != signature:
+        cached = (signature, json.dumps(_normalized(json.loads(payload))).encode("utf-8"))
+        with _RESOLVED_LOCK:
+            _NORMALIZED[key] = cached
+            _NORMALIZED.move_to_end(key)
+            while len(_NORMALIZED) > RESOLVED_CACHE_ENTRIES:
+                _NORMALIZED.popitem(last=False)
+    return json.loads(cached[1])
+
+
+def _apply_overrides(path: str | Path, parent: str, data: dict, overrides: object) -> dict:
+    if not isinstance(overrides, list) or not all(
+        isinstance(change, list)
+        and len(change) == 2
+        and isinstance(change[0], list)
+        and all(type(key) in (str, int) for key in change[0])
+        for change in overrides
+    ):
+        raise ValueError(f"Overlay case '{path}' has malformed overrides.")
+    # Overrides written against an older parent may address entries it has since
+    # dropped (a shorter horizon, a removed scenario); those are reported, not applied.
+    stale = []
+    for keys, value in overrides:
+        if keys and not _applies(data, keys):
+            stale.append(f"'{change_path(keys)}'")
+        elif not stale:
+            data = apply_changes(data, [(keys, value)])
+    if stale:
+        more = f" and {len(stale) - 5} more" if len(stale) > 5 else ""
+        raise ValueError(
+            f"Overlay case '{path}' overrides {', '.join(stale[:5])}{more}, "
+            f"which its parent '{parent}' no longer has."
+        )
+    return data
+
+
+def _stat_signature(path: Path) -> Tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _resolve(path: str | Path, children: Tuple[str, ...]) -> Tuple[tuple, bytes]:
+    key = os.path.abspath(path)
+    if key in children:
+        raise ValueError(f"Overlay case '{path}' inherits from itself.")
+    own = (_stat_signature(Path(path)), _stat_signature(journal_path(path)))
+    with _RESOLVED_LOCK:
+        cached = _RESOLVED.get(key)
+    if cached is not None and cached[0] == own:
+        if cached[1] is None:
+            return (own,), cached[3]
+        if os.path.exists(cached[1]):
+            parent_signature = _resolve(cached[1], children + (key,))[0]
+            if parent_signature == cached[2]:
+                return (own, parent_signature), cached[3]
+
+    payload = Path(path).read_bytes()
+    base = snapshot_digest(payload) if own[1] is not None else None
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        if own[1] is not None or children:
+            raise
+        # A malformed file is still fingerprinted; loading it reports the error.
+        return (own,), payload
+    parent = parent_signature = None
+    if is_overlay(data):
+        parent = data[OVERLAY_PARENT]
+        if not isinstance(parent, str):
+            raise ValueError(f"Overlay case '{path}' must name its parent as a path.")
+        if not os.path.exists(parent):
+            raise ValueError(f"Overlay case '{path}' inherits from '{parent}', which does not exist.")
+        parent_signature, parent_payload = _resolve(parent, children + (key,))
+        data = _apply_overrides(
+            path,
+            parent,
+            _normalized_parent(parent, parent_signature, parent_payload),
+            data[OVERLAY_OVERRIDES],
+        )
+    journal = journal_path(path)
+    if own[1] is not None:
+        data = replay_journal(data, journal.read_bytes(), base)
+    if parent is not None or own[1] is not None:
+        payload = json.dumps(data).encode("utf-8")
+    # Plain files are cheaper to re-read than to cache unless overlays build on them.
+    if parent is not None or children:
+        with _RESOLVED_LOCK:
+            _RESOLVED[key] = (own, parent, parent_signature, payload)
+            _RESOLVED.move_to_end(key)
+            while len(_RESOLVED) > RESOLVED_CACHE_ENTRIES:
+                _RESOLVED.popitem(last=False)
+    signature = (own,) if parent is None else (own, parent_signature)
+    return signature, payload
+
+
+class CaseJournal:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.journal = journal_path(path)
+        self._lock = threading.RLock()
+        self._data: dict | None = None
+        self._parent: str | None = None
+        # Digest of the snapshot file; every journal line names the snapshot it applies to.
+        self._base: str | None = None
+        self._pending: Dict[tuple, object] = {}
+        self._entries = 0
+        self._last_flush = 0.0
+        self._timer: threading.Timer | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def reload(self) -> dict:
+        with self._lock:
+            self.flush()
+            self._data = None
+            return json.loads(json.dumps(self._current()))
+
+    def record(self, data: dict, original: dict | None = None) -> int:
+        with self._lock:
+            current = self._current()
+            changes = diff_case_data(current if original is None else original, data)
+            if not changes:
+                return 0
+            if not all(_resolves(current, keys) for keys, _ in changes):
+                # The file changed shape under this session; fall back to its full view.
+                changes = diff_case_data(current, data)
+            changes = json.loads(json.dumps(changes))
+            self._data = apply_changes(current, changes)
+            for keys, value in changes:
+                # Coalesce repeated edits; re-inserting keeps replay order correct.
+                self._pending.pop(tuple(keys), None)
+                self._pending[tuple(keys)] = value
+            wait = self._last_flush + DEBOUNCE_SECONDS - time.monotonic()
+            if wait <= 0:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(wait, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+            return len(changes)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._cancel_timer()
+            if not self._pending:
+                return
+            changes = [[list(keys), value] for keys, value in self._pending.items()]
+            line = json.dumps({"time": time.time(), "base": self._base, "changes": changes}) + "\n"
+            with open(self.journal, "a", encoding="utf-8") as handle:
+                handle.write(line)
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._pending = {}
+            self._entries += 1
+            self._last_flush = time.monotonic()
+            if self._entries >= COMPACT_AFTER_ENTRIES:
+                self.compact()
+
+    def compact(self, data: dict | None = None, parent: str | Path | None = None) -> None:
+        with self._lock:
+            self._cancel_timer()
+            # Pending changes are already folded into the current data.
+            if data is None:
+                self._data = self._current()
+            else:
+                # A full snapshot replaces the file, including whether it is an overlay.
+                self._data = json.loads(json.dumps(data))
+                self._parent = None if parent is None else os.path.normpath(parent)
+            self._pending = {}
+            document = self._data
+            if self._parent is not None:
+                document = overlay_document(self._parent, read_case_data(self._parent), self._data)
+            # If we crash before the journal is removed, its lines name the old
+            # snapshot and are skipped when the new one is loaded.
+            _write_json_atomic(document, self.path)
+            self._base = snapshot_digest(self.path.read_bytes())
+            self.journal.unlink(missing_ok=True)
+            self._entries = 0
+
+    def _current(self) -> dict:
+        if self._data is None:
+            self._entries = self._repair()
+            self._base = snapshot_digest(self.path.read_bytes())
+            self._data = read_case_data(self.path)
+            self._parent = case_parent(self.path)
+        return self._data
+
+    def _repair(self) -> int:
+        if not self.journal.exists():
+            return 0
+        payload = self.journal.read_bytes()
+        if payload and not payload.endswith(b"\n"):
+            # Drop a torn tail so later appends start on a fresh line.
+            payload = payload[: payload.rfind(b"\n") + 1]
+            with open(self.journal, "r+b") as handle:
+                handle.truncate(len(payload))
+        return len(payload.splitlines())
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+_JOURNALS: Dict[str, CaseJournal] = {}
+_JOURNALS_LOCK = threading.Lock()
+
+
+def case_journal(path: str | Path) -> CaseJournal:
+    key = os.path.abspath(path)
+    with _JOURNALS_LOCK:
+        journal = _JOURNALS.get(key)
+        if journal is None:
+            journal = _JOURNALS[key] = CaseJournal(path)
+        return journal
+
+
+def flush_journals() -> None:
+    with _JOURNALS_LOCK:
+        journals = list(_JOURNALS.values())
+    for journal in journals:
+        journal.flush()
+
+
+atexit.register(flush_journals)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
 from dataclasses import asdict
 from pathlib import Path
 
@@ -19,24 +21,24 @@ from state.assumptions import (
     ValuationAssumptions,
     VariableCostYearAssumptions,
     EquityAssumptions,
+    PLANNING_YEARS,
     default_assumptions,
 )
+from state.schema import loads_assumptions
 
 
 def save_assumptions(assumptions: Assumptions, path: str | Path) -> None:
-    data = asdict(assumptions)
-    target = Path(path)
-    target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(json.dumps(data, indent=2, sort_keys=False), encoding="utf-8")
+    _write_json_atomic(asdict(assumptions), path)
 
 
 def load_assumptions(path: str | Path) -> Assumptions:
-    data = json.loads(Path(path).read_text(encoding="utf-8"))
-    return _assumptions_from_dict(data)
+    return loads_assumptions(Path(path).read_bytes())
 
 
-def _assumptions_from_dict(data: dict) -> Assumptions:
-    defaults = default_assumptions()
+def build_assumptions_reference(data: dict) -> Assumptions:
+    # The original per-section merge loader, kept to check and time the schema builder.
+    planning_years = int(data.get("planning_years", PLANNING_YEARS))
+    defaults = default_assumptions(planning_years)
 
     scenario_data = data.get("revenue", {}).get("scenarios", {})
     base_default = defaults.revenue.scenarios.get("Base")
@@ -155,7 +157,37 @@ def _assumptions_from_dict(data: dict) -> Assumptions:
         tax_and_distributions=tax_and_distributions,
         valuation=valuation,
         equity=equity,
+        planning_years=planning_years,
+    )
+
+
+def _write_json_atomic(data: dict, path: str | Path) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    handle = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=target.parent, prefix=f"{target.name}.", suffix=".tmp", delete=False
     )
+    try:
+        with handle:
+            handle.write(json.dumps(data, indent=2, sort_keys=False))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.chmod(handle.name, target.stat().st_mode & 0o777 if target.exists() else 0o644)
+        os.replace(handle.name, target)
+    except BaseException:
+        Path(handle.name).unlink(missing_ok=True)
+        raise
+    _fsync_directory(target.parent)
+
+
+def _fsync_directory(directory: Path) -> None:
+    if os.name != "posix":
+        return
+    descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
 
 
 def _merge_dict(defaults: dict, overrides: dict | None) -> dict:
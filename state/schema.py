@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+import json
+import math
+import operator
+import typing
+from dataclasses import fields, is_dataclass, replace
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple
+
+from state.assumptions import MAX_PLANNING_YEARS, PLANNING_YEARS, Assumptions, default_assumptions
+
+_SECTION, _ROWS, _YEARS, _MAPPING = range(4)
+_MAX_REPORTED_ISSUES = 10
+
+# Accepted exact types (the fast path), a fallback predicate, a label for reports and
+# a conversion for values that are mistyped but still readable (raises if they are not).
+Check = Tuple[frozenset, Callable[[object], bool], str, Callable[[object], object]]
+
+
+class _Schema:
+    __slots__ = ("cls", "scalars", "compound", "names", "groups")
+
+    def __init__(
+        self, cls: type, scalars: Dict[str, Check], compound: Dict[str, Tuple[int, object]]
+    ) -> None:
+        self.cls = cls
+        self.scalars = scalars
+        self.compound = compound
+        self.names = frozenset(scalars) | frozenset(compound)
+        # Scalars sharing a check are type-tested together in one C-level pass.
+        grouped: Dict[Check, List[str]] = {}
+        for name, check in scalars.items():
+            grouped.setdefault(check, []).append(name)
+        self.groups = tuple(
+            (check, _getter(names), tuple(names)) for check, names in grouped.items()
+        )
+
+
+def _getter(names: List[str]) -> Callable[[dict], tuple]:
+    if len(names) == 1:
+        name = names[0]
+        return lambda values: (values[name],)
+    return operator.itemgetter(*names)
+
+
+class _Issues:
+    __slots__ = ("errors", "warnings")
+
+    def __init__(self) -> None:
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+
+
+class _Template:
+    __slots__ = ("scalars", "compound")
+
+    def __init__(self, scalars: dict, compound: dict) -> None:
+        self.scalars = scalars
+        self.compound = compound
+
+
+def _never(value: object) -> bool:
+    return False
+
+
+def _integral_float(value: object) -> bool:
+    return isinstance(value, float) and value.is_integer()
+
+
+_NUMBER_TYPES = frozenset((int, float))
+
+
+def _to_number(value: object) -> float:
+    if type(value) is bool:
+        return float(value)
+    if type(value) is not str:
+        raise TypeError(value)
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(value)
+    return number
+
+
+def _to_integer(value: object) -> int:
+    number = _to_number(value)
+    if not number.is_integer():
+        raise ValueError(value)
+    return int(number)
+
+
+def _to_string(value: object) -> str:
+    if type(value) not in _NUMBER_TYPES:
+        raise TypeError(value)
+    return str(value)
+
+
+def _to_bool(value: object) -> bool:
+    if isinstance(value, str) and value.strip().lower() in ("true", "false"):
+        return value.strip().lower() == "true"
+    if type(value) in _NUMBER_TYPES and value in (0, 1):
+        return bool(value)
+    raise ValueError(value)
+
+
+_CHECKS: Dict[object, Check] = {
+    float: (_NUMBER_TYPES, _never, "a number", _to_number),
+    int: (frozenset((int,)), _integral_float, "an integer", _to_integer),
+    str: (frozenset((str,)), _never, "a string", _to_string),
+    bool: (frozenset((bool,)), _never, "true or false", _to_bool),
+}
+
+
+def _scalar_check(hint: object) -> Check:
+    if hint in _CHECKS:
+        return _CHECKS[hint]
+    members = [member for member in typing.get_args(hint) if member is not type(None)]
+    if len(members) == 1 and len(typing.get_args(hint)) == 2 and members[0] in _CHECKS:
+        types, fallback, label, convert = _CHECKS[members[0]]
+        return types | {type(None)}, fallback, f"{label} or null", convert
+    raise TypeError(f"Unsupported case field type {hint!r}.")
+
+
+def _accepts(check: Check, value: object) -> bool:
+    return type(value) in check[0] or check[1](value)
+
+
+def _coerce(check: Check, value: object, where: tuple, issues: _Issues) -> object:
+    try:
+        converted = check[3](value)
+    except (TypeError, ValueError, OverflowError):
+        issues.errors.append(f"{_path(where)}: expected {check[2]}, got {_describe(value)}")
+        return value
+    issues.warnings.append(
+        f"{_path(where)}: expected {check[2]}, got {_describe(value)}; read as {converted!r}"
+    )
+    return converted
+
+
+@lru_cache(maxsize=None)
+def _compile(cls: type) -> _Schema:
+    hints = typing.get_type_hints(cls)
+    scalars: Dict[str, Check] = {}
+    compound: Dict[str, Tuple[int, object]] = {}
+    for field in fields(cls):
+        hint = hints[field.name]
+        origin, args = typing.get_origin(hint), typing.get_args(hint)
+        if is_dataclass(hint):
+            compound[field.name] = (_SECTION, _compile(hint))
+        elif origin is list and is_dataclass(args[0]):
+            compound[field.name] = (_ROWS, _compile(args[0]))
+        elif origin is list:
+            compound[field.name] = (_YEARS, _scalar_check(args[0]))
+        elif origin is dict:
+            compound[field.name] = (_MAPPING, _compile(args[1]))
+        else:
+            scalars[field.name] = _scalar_check(hint)
+    return _Schema(cls, scalars, compound)
+
+
+def _template_for(schema: _Schema, instance: object) -> _Template:
+    compound = {}
+    for name, (kind, inner) in schema.compound.items():
+        value = getattr(instance, name)
+        if kind == _SECTION:
+            compound[name] = _template_for(inner, value)
+        elif kind == _ROWS:
+            compound[name] = [_template_for(inner, row) for row in value]
+        elif kind == _MAPPING:
+            compound[name] = {key: _template_for(inner, item) for key, item in value.items()}
+        else:
+            compound[name] = list(value)
+    return _Template({name: getattr(instance, name) for name in schema.scalars}, compound)
+
+
+@lru_cache(maxsize=MAX_PLANNING_YEARS)
+def _template(planning_years: int) -> _Template:
+    return _template_for(_compile(Assumptions), default_assumptions(planning_years))
+
+
+def _construct(cls: type, values: dict) -> object:
+    # The values are complete, so skip the frozen __init__ and its per-field
+    # object.__setattr__ calls.
+    instance = object.__new__(cls)
+    instance.__dict__.update(values)
+    return instance
+
+
+def _path(where: tuple) -> str:
+    # Paths are built as cheap (parent, key) pairs and only formatted for reports.
+    keys = []
+    while where:
+        where, key = where
+        keys.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return "".join(reversed(keys)).lstrip(".")
+
+
+def _type_name(value: object) -> str:
+    return "null" if value is None else type(value).__name__
+
+
+def _describe(value: object) -> str:
+    if isinstance(value, (str, bool, int, float)):
+        return f"{_type_name(value)} {json.dumps(value)[:40]}"
+    return _type_name(value)
+
+
+def _values(
+    schema: _Schema, template: _Template, data: object, where: tuple, issues: _Issues
+) -> dict:
+    values = dict(template.scalars)
+    if data is not None and type(data) is not dict:
+        issues.errors.append(f"{_path(where)}: expected an object, got {_type_name(data)}")
+        data = None
+    if data:
+        # Compound entries are overwritten by their builders below.
+        values.update(data)
+        if not data.keys() <= schema.names:
+            for key in data.keys() - schema.names:
+                issues.warnings.append(f"{_path((where, key))}: unknown field, ignored")
+                del values[key]
+        for check, getter, names in schema.groups:
+            if not check[0].issuperset(map(type, getter(values))):
+                for name in names:
+                    if not _accepts(check, values[name]):
+                        values[name] = _coerce(check, values[name], (where, name), issues)
+    for name, (kind, inner) in schema.compound.items():
+        override = data.get(name) if data else None
+        values[name] = _BUILDERS[kind](
+            inner, template.compound[name], override, (where, name), issues
+        )
+    return values
+
+
+def _build_section(
+    schema: _Schema, template: _Template, data: object, where: tuple, issues: _Issues
+) -> object:
+    return _construct(schema.cls, _values(schema, template, data, where, issues))
+
+
+def _build_rows(
+    schema: _Schema, templates: List[_Template], data: object, where: tuple, issues: _Issues
+) -> list:
+    if data is not None and not isinstance(data, list):
+        issues.errors.append(f"{_path(where)}: expected a list, got {_type_name(data)}")
+        data = None
+    data = data or []
+    return [
+        _build_section(
+            schema, template, data[index] if index < len(data) else None, (where, index), issues
+        )
+        for index, template in enumerate(templates)
+    ]
+
+
+def _build_years(
+    check: Check, defaults: list, data: object, where: tuple, issues: _Issues
+) -> list:
+    if data is None:
+        return list(defaults)
+    if not isinstance(data, list):
+        issues.errors.append(f"{_path(where)}: expected a list, got {_type_name(data)}")
+        return list(defaults)
+    if not check[0].issuperset(map(type, data)):
+        # Converted on a copy; the caller's data is left as it was parsed.
+        data = list(data)
+        for index, value in enumerate(data):
+            if not _accepts(check, value):
+                data[index] = _coerce(check, value, (where, index), issues)
+    # Longer lists are cut to the horizon; shorter ones keep the default tail.
+    if len(data) >= len(defaults):
+        return data[: len(defaults)]
+    return data + defaults[len(data) :]
+
+
+def _build_mapping(
+    schema: _Schema, templates: Dict[str, _Template], data: object, where: tuple, issues: _Issues
+) -> dict:
+    if data is not None and not isinstance(data, dict):
+        issues.errors.append(f"{_path(where)}: expected an object, got {_type_name(data)}")
+        data = None
+    data = data or {}
+    built = {
+        name: _build_section(schema, template, data.get(name), (where, name), issues)
+        for name, template in templates.items()
+    }
+    # Extra entries (custom scenarios) start from the Base defaults.
+    fallback = templates.get("Base") or next(iter(templates.values()))
+    for name, payload in data.items():
+        if name not in built:
+            built[name] = _build_section(schema, fallback, payload, (where, name), issues)
+    return built
+
+
+_BUILDERS = {
+    _SECTION: _build_section,
+    _ROWS: _build_rows,
+    _YEARS: _build_years,
+    _MAPPING: _build_mapping,
+}
+
+
+def _build_assumptions(data: object, issues: _Issues) -> Assumptions:
+    if not isinstance(data, dict):
+        raise ValueError(f"Case data must be a JSON object, got {_type_name(data)}.")
+    planning_years = data.get("planning_years", PLANNING_YEARS)
+    if type(planning_years) is not int:
+        check = _CHECKS[int]
+        if _accepts(check, planning_years):
+            planning_years = int(planning_years)
+        else:
+            planning_years = _coerce(check, planning_years, ((), "planning_years"), issues)
+        if type(planning_years) is not int:
+            planning_years = PLANNING_YEARS
+        data = dict(data, planning_years=planning_years)
+    if not 1 <= planning_years <= MAX_PLANNING_YEARS:
+        issues.errors.append(f"planning_years: expected 1 to {MAX_PLANNING_YEARS}, got {planning_years}")
+        planning_years = PLANNING_YEARS
+        data = dict(data, planning_years=planning_years)
+    template = _template(planning_years)
+    values = _values(_compile(Assumptions), template, data, (), issues)
+    values["planning_years"] = planning_years
+    cashflow, balance_sheet = values["cashflow"], values["balance_sheet"]
+    if balance_sheet.opening_equity_eur != cashflow.opening_cash_balance_eur:
+        values["cashflow"] = replace(
+            cashflow, opening_cash_balance_eur=balance_sheet.opening_equity_eur
+        )
+    if values["scenario"] not in values["revenue"].scenarios:
+        values["scenario"] = template.scalars["scenario"]
+    return _construct(Assumptions, values)
+
+
+def build_assumptions(data: dict) -> Assumptions:
+    return build_assumptions_with_warnings(data)[0]
+
+
+def build_assumptions_with_warnings(data: dict) -> Tuple[Assumptions, List[str]]:
+    issues = _Issues()
+    assumptions = _build_assumptions(data, issues)
+    if issues.errors:
+        shown = "; ".join(issues.errors[:_MAX_REPORTED_ISSUES])
+        more = len(issues.errors) - _MAX_REPORTED_ISSUES
+        raise ValueError(
+            f"Invalid case data: {shown}" + (f"; and {more} more." if more > 0 else ".")
+        )
+    return assumptions, issues.warnings
+
+
+def case_issues(data: dict) -> List[str]:
+    issues = _Issues()
+    _build_assumptions(data, issues)
+    return issues.errors + issues.warnings
+
+
+def loads_assumptions(payload: str | bytes) -> Assumptions:
+    return build_assumptions(json.loads(payload))
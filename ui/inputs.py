@@ -23,8 +23,10 @@ from state.assumptions import (
     VariableCostYearAssumptions,
 )
 
-YEARS = build_year_labels(5)
+FIRST_YEAR = build_year_labels(1)[0]
+_NON_YEAR_COLUMNS = {"Parameter", "Unit", "Notes", "Value"}
 MILLION = 1_000_000.0
+REPAYMENT_PROFILES = ["Linear", "Sculpted"]
 
 
 def render_revenue_inputs(assumptions: Assumptions) -> Assumptions:
@@ -64,8 +66,7 @@ def render_revenue_inputs(assumptions: Assumptions) -> Assumptions:
             ("External Capacity Share (Input)", normalized_external),
             ("Group Capacity Share (Calculated)", normalized_group),
         ],
-        years=len(outputs.YEAR_LABELS),
-        year_labels=outputs.YEAR_LABELS,
+        year_labels=build_year_labels(assumptions.planning_years),
     )
 
     st.markdown("### Pricing Assumptions")
@@ -80,7 +81,7 @@ def render_revenue_inputs(assumptions: Assumptions) -> Assumptions:
     st.markdown("### Group Revenue Floor")
     reference_table = _year_table(
         [
-            ("Reference Revenue", "m€", [_to_meur(current.reference_revenue_eur) for _ in range(5)], ""),
+            ("Reference Revenue", "m€", [_to_meur(current.reference_revenue_eur) for _ in range(assumptions.planning_years)], ""),
         ]
     )
     reference_table = _edit_table(reference_table, key="revenue.reference")
@@ -97,7 +98,7 @@ def render_revenue_inputs(assumptions: Assumptions) -> Assumptions:
         group_day_rate_eur=_row_years_numeric(rate_table, "Group Day Rate"),
         external_day_rate_eur=_row_years_numeric(rate_table, "External Day Rate"),
         day_rate_growth_pct=_row_years_numeric(drivers_table, "Day Rate Growth (% p.a.)"),
-        revenue_growth_pct=[0.0 for _ in range(5)],
+        revenue_growth_pct=[0.0 for _ in range(assumptions.planning_years)],
         group_capacity_share_pct=group_share_values,
         external_capacity_share_pct=external_share_values,
         reference_revenue_eur=_to_float(_row_years_numeric(reference_table, "Reference Revenue")[0]),
@@ -115,6 +116,7 @@ def render_revenue_inputs(assumptions: Assumptions) -> Assumptions:
         tax_and_distributions=assumptions.tax_and_distributions,
         valuation=assumptions.valuation,
         equity=assumptions.equity,
+        planning_years=assumptions.planning_years,
     )
 
 
@@ -205,7 +207,7 @@ def render_cost_inputs(assumptions: Assumptions) -> Assumptions:
             backoffice_loaded_cost_eur=_row_years_numeric(backoffice_table, "Backoffice Loaded Cost")[i],
             management_cost_eur=_row_years_numeric(management_table, "Management Cost")[i],
         )
-        for i in range(5)
+        for i in range(assumptions.planning_years)
     ]
     fixed_overhead_by_year = [
         FixedOverheadYearAssumptions(
@@ -216,7 +218,7 @@ def render_cost_inputs(assumptions: Assumptions) -> Assumptions:
             services_eur=_row_years_numeric(fixed_overhead_table, "Services")[i],
             other_services_eur=_row_years_numeric(fixed_overhead_table, "Other Services")[i],
         )
-        for i in range(5)
+        for i in range(assumptions.planning_years)
     ]
     training_types = _row_years_text(variable_type_table, "Training")
     travel_types = _row_years_text(variable_type_table, "Travel")
@@ -233,7 +235,7 @@ def render_cost_inputs(assumptions: Assumptions) -> Assumptions:
             communication_type=communication_types[i],
             communication_value=_normalize_variable_value(communication_values[i], communication_types[i]),
         )
-        for i in range(5)
+        for i in range(assumptions.planning_years)
     ]
     inflation_apply = (
         str(_row_value(inflation_table, "Apply Inflation")).strip().lower()
@@ -262,6 +264,7 @@ def render_cost_inputs(assumptions: Assumptions) -> Assumptions:
         tax_and_distributions=assumptions.tax_and_distributions,
         valuation=assumptions.valuation,
         equity=assumptions.equity,
+        planning_years=assumptions.planning_years,
     )
 
 
@@ -292,11 +295,12 @@ def render_financing_assumptions(assumptions: Assumptions) -> Assumptions:
         transaction_table = _edit_table(transaction_table, key="financing.transaction")
 
         st.markdown("#### Loan Terms")
-        special_year_options = ["None"] + YEARS
+        years = build_year_labels(assumptions.planning_years)
+        special_year_options = ["None"] + years
         special_year_value = (
-            YEARS[financing.special_repayment_year]
+            years[financing.special_repayment_year]
             if financing.special_repayment_year is not None
-            and 0 <= financing.special_repayment_year < len(YEARS)
+            and 0 <= financing.special_repayment_year < len(years)
             else "None"
         )
         special_year = st.selectbox(
@@ -323,7 +327,7 @@ def render_financing_assumptions(assumptions: Assumptions) -> Assumptions:
         if "financing_table" in locals()
         else financing.initial_debt_eur,
         interest_rate_pct=_to_float(_row_value(quick_table, "Interest Rate")),
-        amortization_type="Linear",
+        amortization_type=financing.amortization_type,
         amortization_period_years=int(
             _to_float(_row_value(quick_table, "Repayment Period (Years)") or 0)
         ),
@@ -332,7 +336,7 @@ def render_financing_assumptions(assumptions: Assumptions) -> Assumptions:
         )
         if "financing_table" in locals()
         else financing.grace_period_years,
-        special_repayment_year=_parse_year_option(special_year)
+        special_repayment_year=_parse_year_option(special_year, years)
         if "financing_table" in locals()
         else financing.special_repayment_year,
         special_repayment_amount_eur=_from_meur(
@@ -382,6 +386,7 @@ def render_financing_assumptions(assumptions: Assumptions) -> Assumptions:
         tax_and_distributions=assumptions.tax_and_distributions,
         valuation=assumptions.valuation,
         equity=assumptions.equity,
+        planning_years=assumptions.planning_years,
     )
 
 
@@ -412,7 +417,7 @@ def render_revenue_quick_inputs(assumptions: Assumptions) -> Assumptions:
         group_day_rate_eur=_row_years_numeric(quick_table, "Group Day Rate"),
         external_day_rate_eur=_row_years_numeric(quick_table, "External Day Rate"),
         day_rate_growth_pct=current.day_rate_growth_pct,
-        revenue_growth_pct=[0.0 for _ in range(5)],
+        revenue_growth_pct=[0.0 for _ in range(assumptions.planning_years)],
         group_capacity_share_pct=current.group_capacity_share_pct,
         external_capacity_share_pct=current.external_capacity_share_pct,
         reference_revenue_eur=_from_meur(_row_value(reference_table, "Reference Revenue")),
@@ -430,6 +435,7 @@ def render_revenue_quick_inputs(assumptions: Assumptions) -> Assumptions:
         tax_and_distributions=assumptions.tax_and_distributions,
         valuation=assumptions.valuation,
         equity=assumptions.equity,
+        planning_years=assumptions.planning_years,
     )
 
 
@@ -454,7 +460,7 @@ def render_cost_quick_inputs(assumptions: Assumptions) -> Assumptions:
             backoffice_loaded_cost_eur=_row_years_numeric(quick_table, "Backoffice Cost (All-in)")[i],
             management_cost_eur=_row_years_numeric(quick_table, "Management Cost")[i],
         )
-        for i in range(5)
+        for i in range(assumptions.planning_years)
     ]
 
     return Assumptions(
@@ -474,6 +480,7 @@ def render_cost_quick_inputs(assumptions: Assumptions) -> Assumptions:
         tax_and_distributions=assumptions.tax_and_distributions,
         valuation=assumptions.valuation,
         equity=assumptions.equity,
+        planning_years=assumptions.planning_years,
     )
 
 
@@ -495,7 +502,7 @@ def render_financing_quick_inputs(assumptions: Assumptions) -> Assumptions:
         senior_debt_amount_eur=_from_meur(_row_value(table, "Senior Loan Amount")),
         initial_debt_eur=_from_meur(_row_value(table, "Opening Loan Balance")),
         interest_rate_pct=_to_float(_row_value(table, "Interest Rate")),
-        amortization_type="Linear",
+        amortization_type=finance.amortization_type,
         amortization_period_years=int(
             _to_float(_row_value(table, "Repayment Period (Years)") or 0)
         ),
@@ -534,6 +541,7 @@ def render_financing_quick_inputs(assumptions: Assumptions) -> Assumptions:
         tax_and_distributions=assumptions.tax_and_distributions,
         valuation=assumptions.valuation,
         equity=assumptions.equity,
+        planning_years=assumptions.planning_years,
     )
 
 
@@ -568,6 +576,7 @@ def render_valuation_quick_inputs(assumptions: Assumptions) -> Assumptions:
             transaction_costs_pct=assumptions.valuation.transaction_costs_pct,
         ),
         equity=assumptions.equity,
+        planning_years=assumptions.planning_years,
     )
 
 
@@ -624,11 +633,12 @@ def render_balance_sheet_key_assumptions(assumptions: Assumptions, key_prefix: s
 
 def render_financing_key_assumptions(assumptions: Assumptions, key_prefix: str) -> Assumptions:
     financing = assumptions.financing
-    year_options = ["None"] + YEARS
+    years = build_year_labels(assumptions.planning_years)
+    year_options = ["None"] + years
     special_year_value = (
-        YEARS[financing.special_repayment_year]
+        years[financing.special_repayment_year]
         if financing.special_repayment_year is not None
-        and 0 <= financing.special_repayment_year < len(YEARS)
+        and 0 <= financing.special_repayment_year < len(years)
         else "None"
     )
     special_year = st.selectbox(
@@ -637,6 +647,14 @@ def render_financing_key_assumptions(assumptions: Assumptions, key_prefix: str)
         index=year_options.index(special_year_value),
         key=f"{key_prefix}.special_repayment_year",
     )
+    repayment_options = _options_with_current(REPAYMENT_PROFILES, financing.amortization_type)
+    amortization_type = st.selectbox(
+        "Repayment Profile",
+        repayment_options,
+        index=repayment_options.index(financing.amortization_type),
+        key=f"{key_prefix}.amortization_type",
+        help="Sculpted sizes each year's repayment so DSCR equals the minimum DSCR.",
+    )
     table = _value_table(
         [
             ("Debt Amount", "m€", _to_meur(financing.senior_debt_amount_eur), ""),
@@ -660,10 +678,10 @@ def render_financing_key_assumptions(assumptions: Assumptions, key_prefix: str)
         senior_debt_amount_eur=_from_meur(_row_value(table, "Debt Amount")),
         initial_debt_eur=_from_meur(_row_value(table, "Opening Loan Balance")),
         interest_rate_pct=_to_float(_row_value(table, "Interest Rate")),
-        amortization_type="Linear",
+        amortization_type=amortization_type,
         amortization_period_years=int(_to_float(_row_value(table, "Repayment Period (Years)"))),
         grace_period_years=int(_to_float(_row_value(table, "Interest-Only Period (Years)"))),
-        special_repayment_year=_parse_year_option(special_year),
+        special_repayment_year=_parse_year_option(special_year, years),
         special_repayment_amount_eur=_from_meur(_row_value(table, "One-Time Repayment Amount")),
         minimum_dscr=_to_float(_row_value(table, "Minimum DSCR")),
     )
@@ -719,11 +737,11 @@ def render_valuation_key_assumptions(assumptions: Assumptions, key_prefix: str)
 def render_equity_key_assumptions(assumptions: Assumptions, key_prefix: str) -> Assumptions:
     equity = assumptions.equity
     transaction = assumptions.transaction_and_financing
-    exit_year_options = YEARS
+    exit_year_options = build_year_labels(assumptions.planning_years)
     exit_year_label = (
-        YEARS[equity.exit_year]
-        if 0 <= equity.exit_year < len(YEARS)
-        else YEARS[0]
+        exit_year_options[equity.exit_year]
+        if 0 <= equity.exit_year < len(exit_year_options)
+        else exit_year_options[0]
     )
     exit_year = st.selectbox(
         "Exit Year",
@@ -780,7 +798,7 @@ def render_equity_key_assumptions(assumptions: Assumptions, key_prefix: str) ->
         senior_term_loan_start_eur=transaction.senior_term_loan_start_eur,
     )
     updated_equity = EquityAssumptions(
-        exit_year=_parse_year_option(exit_year),
+        exit_year=_parse_year_option(exit_year, exit_year_options),
         exit_mechanism=exit_mechanism,
         investor_participation=investor_participation,
         management_participation=management_participation,
@@ -807,7 +825,7 @@ def _year_table(rows: List[tuple]) -> List[dict]:
     table = []
     for name, unit, values, _notes in rows:
         row = {"Parameter": name, "Unit": unit}
-        for idx, year in enumerate(YEARS):
+        for idx, year in enumerate(build_year_labels(len(values))):
             row[year] = _display_value(values[idx], unit)
         table.append(row)
     return table
@@ -849,7 +867,7 @@ def _row_years_numeric(table: List[dict], name: str) -> List[float]:
     for row in table:
         if row.get("Parameter") == name:
             unit = str(row.get("Unit", "")).strip()
-            values = [_to_float(row.get(year, 0.0)) for year in YEARS]
+            values = [_to_float(row.get(year, 0.0)) for year in _year_columns(row)]
             if _is_percent_unit(unit):
                 return [value / 100 for value in values]
             if unit.startswith("k€"):
@@ -857,20 +875,24 @@ def _row_years_numeric(table: List[dict], name: str) -> List[float]:
             if unit == "m€":
                 return [value * MILLION for value in values]
             return values
-    return [0.0 for _ in YEARS]
+    return []
 
 
 def _row_years_text(table: List[dict], name: str) -> List[str]:
     for row in table:
         if row.get("Parameter") == name:
-            return [str(row.get(year, "") or "") for year in YEARS]
-    return ["" for _ in YEARS]
+            return [str(row.get(year, "") or "") for year in _year_columns(row)]
+    return []
+
+
+def _year_columns(row: dict) -> List[str]:
+    return [key for key in row if key not in _NON_YEAR_COLUMNS]
 
 
 def _row_value(table: List[dict], name: str):
     for row in table:
         if row.get("Parameter") == name:
-            value = row.get("Value", row.get(YEARS[0], 0.0))
+            value = row.get("Value", row.get(FIRST_YEAR, 0.0))
             unit = str(row.get("Unit", "")).strip()
             if isinstance(value, str) and _looks_like_text(value):
                 return value
@@ -883,7 +905,7 @@ def _row_value(table: List[dict], name: str):
 def _require_value(table: List[dict], name: str) -> None:
     for row in table:
         if row.get("Parameter") == name:
-            value = row.get("Value", row.get(YEARS[0], None))
+            value = row.get("Value", row.get(FIRST_YEAR, None))
             if value is None or str(value).strip() == "":
                 st.error(f"Missing required assumption: {name}.")
                 st.stop()
@@ -1004,11 +1026,11 @@ def _options_with_current(options: List[str], current: str) -> List[str]:
     return [current] + options
 
 
-def _parse_year_option(value: str) -> int | None:
+def _parse_year_option(value: str, years: List[str]) -> int | None:
     if value == "None":
         return None
-    if value in YEARS:
-        return YEARS.index(value)
+    if value in years:
+        return years.index(value)
     return None
 
 
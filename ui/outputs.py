@@ -17,9 +17,6 @@ def build_year_labels(years: int) -> List[str]:
     return [_year_label(i) for i in range(years)]
 
 
-YEAR_LABELS = build_year_labels(5)
-
-
 def render_overview(result: ModelResult, assumptions: Assumptions) -> None:
     st.markdown("### A. Deal Snapshot (What are we buying and how is it funded?)")
 
@@ -113,6 +110,7 @@ def render_driver_summary(current: Assumptions, base: Assumptions) -> None:
 
 
 def render_operating_model(result: ModelResult, assumptions: Assumptions) -> None:
+    years = len(result.pnl)
     revenue = [row["revenue"] for row in result.pnl]
     personnel_costs = [row["personnel_costs"] for row in result.pnl]
     overhead_costs = [row["overhead_and_variable_costs"] for row in result.pnl]
@@ -122,9 +120,7 @@ def render_operating_model(result: ModelResult, assumptions: Assumptions) -> Non
     interest = [row["interest_expense"] for row in result.pnl]
     taxes = [row["taxes"] for row in result.pnl]
     net_income = [row["net_income"] for row in result.pnl]
-    net_contribution = [
-        revenue[idx] - personnel_costs[idx] for idx in range(len(result.pnl))
-    ]
+    net_contribution = [revenue[idx] - personnel_costs[idx] for idx in range(years)]
 
     consultant_costs = [row.get("consultant_costs", 0.0) for row in result.cost]
     backoffice_costs = [row.get("backoffice_costs", 0.0) for row in result.cost]
@@ -134,7 +130,7 @@ def render_operating_model(result: ModelResult, assumptions: Assumptions) -> Non
     it_costs = []
     office_costs = []
     other_services = []
-    for year_index in range(5):
+    for year_index in range(years):
         fixed = assumptions.cost.fixed_overhead_by_year[year_index]
         inflation_factor = (
             (1 + assumptions.cost.inflation_rate_pct) ** year_index
@@ -160,14 +156,14 @@ def render_operating_model(result: ModelResult, assumptions: Assumptions) -> Non
         )
         if assumptions.cost.personnel_by_year[idx].consultant_fte
         else _format_money(0.0)
-        for idx in range(5)
+        for idx in range(years)
     ]
-    ebitda_margin = [_format_percent(ebitda[idx], revenue[idx]) for idx in range(5)]
+    ebitda_margin = [_format_percent(ebitda[idx], revenue[idx]) for idx in range(years)]
     personnel_cost_ratio = [
-        _format_percent(personnel_costs[idx], revenue[idx]) for idx in range(5)
+        _format_percent(personnel_costs[idx], revenue[idx]) for idx in range(years)
     ]
-    net_margin = [_format_percent(net_income[idx], revenue[idx]) for idx in range(5)]
-    opex_ratio = [_format_percent(overhead_costs[idx], revenue[idx]) for idx in range(5)]
+    net_margin = [_format_percent(net_income[idx], revenue[idx]) for idx in range(years)]
+    opex_ratio = [_format_percent(overhead_costs[idx], revenue[idx]) for idx in range(years)]
 
     rows = [
         ("REVENUE ENGINE", None),
@@ -191,7 +187,7 @@ def render_operating_model(result: ModelResult, assumptions: Assumptions) -> Non
         ("Net Income", net_income),
         ("Net Margin", net_margin),
     ]
-    year_labels = YEAR_LABELS
+    year_labels = build_year_labels(years)
     _render_statement_table_html(
         rows,
         bold_labels={
@@ -264,7 +260,7 @@ def render_operating_model(result: ModelResult, assumptions: Assumptions) -> Non
                     f"{components[idx].get('consulting_fte', 0.0):,.1f}"
                     if idx < len(components)
                     else "0.0"
-                    for idx in range(5)
+                    for idx in range(years)
                 ],
             ),
             (
@@ -273,7 +269,7 @@ def render_operating_model(result: ModelResult, assumptions: Assumptions) -> Non
                     f"{components[idx].get('capacity_days', 0.0):,.0f}"
                     if idx < len(components)
                     else "0"
-                    for idx in range(5)
+                    for idx in range(years)
                 ],
             ),
             (
@@ -282,7 +278,7 @@ def render_operating_model(result: ModelResult, assumptions: Assumptions) -> Non
                     f"{components[idx].get('adjusted_capacity_days', 0.0):,.0f}"
                     if idx < len(components)
                     else "0"
-                    for idx in range(5)
+                    for idx in range(years)
                 ],
             ),
             (
@@ -291,7 +287,7 @@ def render_operating_model(result: ModelResult, assumptions: Assumptions) -> Non
                     components[idx].get("modeled_group_revenue", 0.0)
                     if idx < len(components)
                     else 0.0
-                    for idx in range(5)
+                    for idx in range(years)
                 ],
             ),
             (
@@ -300,7 +296,7 @@ def render_operating_model(result: ModelResult, assumptions: Assumptions) -> Non
                     components[idx].get("modeled_external_revenue", 0.0)
                     if idx < len(components)
                     else 0.0
-                    for idx in range(5)
+                    for idx in range(years)
                 ],
             ),
             (
@@ -309,7 +305,7 @@ def render_operating_model(result: ModelResult, assumptions: Assumptions) -> Non
                     components[idx].get("guaranteed_floor", 0.0)
                     if idx < len(components)
                     else 0.0
-                    for idx in range(5)
+                    for idx in range(years)
                 ],
             ),
             (
@@ -318,7 +314,7 @@ def render_operating_model(result: ModelResult, assumptions: Assumptions) -> Non
                     components[idx].get("final_total", 0.0)
                     if idx < len(components)
                     else 0.0
-                    for idx in range(5)
+                    for idx in range(years)
                 ],
             ),
         ]
@@ -655,13 +651,18 @@ def render_equity_case(result: ModelResult, assumptions: Assumptions) -> None:
     management_exit = exit_value * management_share if total_equity else 0.0
 
     st.markdown("### Cash Flow to Equity")
-    year_labels = YEAR_LABELS
+    years = len(result.cashflow)
+    year_labels = build_year_labels(years)
     operating_cf = [row["operating_cf"] for row in result.cashflow]
     debt_service = [row.get("debt_service", 0.0) for row in result.debt]
     equity_cashflows = result.equity.get("equity_cashflows", [])
-    cashflow_years = equity_cashflows[1:6] if len(equity_cashflows) >= 6 else equity_cashflows
+    cashflow_years = (
+        equity_cashflows[1 : years + 1]
+        if len(equity_cashflows) > years
+        else equity_cashflows
+    )
     residual_equity = [
-        cashflow_years[idx] if idx < len(cashflow_years) else 0.0 for idx in range(5)
+        cashflow_years[idx] if idx < len(cashflow_years) else 0.0 for idx in range(years)
     ]
     investor_cashflows = [
         (value * external_share) if idx < len(cashflow_years) else 0.0
@@ -678,7 +679,7 @@ def render_equity_case(result: ModelResult, assumptions: Assumptions) -> None:
         ("Allocation – External Investor", investor_cashflows),
         ("Allocation – Management", management_cashflows),
     ]
-    _render_statement_table_html(cashflow_rows, years=5, year_labels=year_labels)
+    _render_statement_table_html(cashflow_rows, year_labels=year_labels)
     st.markdown(
         '<div class="subtle">No dividends assumed in early years; cash is retained to deleverage and stabilize the business.</div>',
         unsafe_allow_html=True,
@@ -722,7 +723,7 @@ def render_equity_case(result: ModelResult, assumptions: Assumptions) -> None:
             ),
             (
                 "IRR",
-                [f"{result.equity.get('irr', 0.0) * 100:.1f}%" if external_equity else "n/a"],
+                [_format_irr(result.equity.get("irr")) if external_equity else "n/a"],
             ),
         ]
         st.markdown("#### External Investor")
@@ -737,7 +738,7 @@ def render_equity_case(result: ModelResult, assumptions: Assumptions) -> None:
             ),
             (
                 "IRR",
-                [f"{result.equity.get('irr', 0.0) * 100:.1f}%" if management_equity else "n/a"],
+                [_format_irr(result.equity.get("irr")) if management_equity else "n/a"],
             ),
         ]
         st.markdown("#### Management")
@@ -1064,6 +1065,22 @@ def _format_percent(value: float, base: float) -> str:
     return f"{(value / base) * 100:.1f}%"
 
 
+def _format_metric(metric: str, value: float) -> str:
+    if value != value:
+        return "n/a"
+    if metric == "irr":
+        return f"{value * 100:.1f}%"
+    if metric == "min_dscr":
+        return f"{value:.2f}x"
+    return _format_money(value)
+
+
+def _format_irr(value: float | None) -> str:
+    if value is None:
+        return "n/a"
+    return f"{value * 100:.1f}%"
+
+
 def _format_output_value(value) -> str:
     if value is None or value == "":
         return ""
@@ -1077,7 +1094,7 @@ def _format_output_value(value) -> str:
 def _render_statement_table_html(
     rows: List[tuple[str, List[float] | List[str] | None]],
     bold_labels: Iterable[str] | None = None,
-    years: int = 5,
+    years: int | None = None,
     row_classes: Dict[str, str] | None = None,
     year_labels: List[str] | None = None,
 ) -> None:
@@ -1087,6 +1104,8 @@ def _render_statement_table_html(
         years = len(year_labels)
         headers = ["Line Item"] + year_labels
     else:
+        if years is None:
+            years = max((len(values) for _, values in rows if values is not None), default=1)
         headers = ["Line Item"] + build_year_labels(years)
     html = ['<table class="fin-table">', "<thead><tr>"]
     for index, header in enumerate(headers):
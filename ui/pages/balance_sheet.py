@@ -4,7 +4,8 @@ from dataclasses import replace
 
 import streamlit as st
 
-from model.run_model import ModelResult, run_model
+from model.cache import cached_run_model
+from model.run_model import ModelResult
 from state.assumptions import Assumptions
 from ui import outputs
 from ui import inputs
@@ -65,7 +66,7 @@ def render(result: ModelResult, assumptions: Assumptions) -> Assumptions:
     )
     _render_scenario_selector(assumptions.scenario)
     output_container = st.container()
-    updated_result = run_model(updated_assumptions)
+    updated_result = cached_run_model(updated_assumptions)
     pension_obligation = updated_assumptions.balance_sheet.pension_obligations_eur
     net_debt = [
         row["financial_debt"] - row["cash"] for row in updated_result.balance_sheet
@@ -81,19 +82,19 @@ def render(result: ModelResult, assumptions: Assumptions) -> Assumptions:
         (net_debt[idx] / ebitda[idx]) if ebitda[idx] else 0.0
         for idx in range(len(net_debt))
     ]
-    year_labels = outputs.YEAR_LABELS
+    year_labels = outputs.build_year_labels(len(updated_result.balance_sheet))
     kpi_rows = [
         {
             "Metric": "Net Debt",
-            **{year_labels[i]: outputs._format_money(net_debt[i]) for i in range(5)},
+            **{year_labels[i]: outputs._format_money(net_debt[i]) for i in range(len(year_labels))},
         },
         {
             "Metric": "Equity Ratio",
-            **{year_labels[i]: f"{equity_ratio[i] * 100:.1f}%" for i in range(5)},
+            **{year_labels[i]: f"{equity_ratio[i] * 100:.1f}%" for i in range(len(year_labels))},
         },
         {
             "Metric": "Net Debt / EBITDA",
-            **{year_labels[i]: f"{net_debt_ebitda[i]:.2f}x" for i in range(5)},
+            **{year_labels[i]: f"{net_debt_ebitda[i]:.2f}x" for i in range(len(year_labels))},
         },
     ]
     with output_container:
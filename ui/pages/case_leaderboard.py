@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+
+import streamlit as st
+
+from model.cache import cached_portfolio
+from model.portfolio import LEADERBOARD_METRICS, CaseSummary, leaderboard
+from state.cases import discover_case_paths
+from ui import outputs
+
+SORT_OPTIONS = {
+    "Equity IRR": "irr",
+    "Exit Equity Value": "exit_value",
+    "Minimum DSCR": "min_dscr",
+    "Minimum Cash": "min_cash",
+    "Peak Debt": "peak_debt",
+    "Price Headroom": "price_headroom",
+}
+
+
+def _case_label(summary: CaseSummary) -> str:
+    if summary.path.endswith("base_case.json"):
+        return "Base Case"
+    return summary.name
+
+
+def _row_values(summary: CaseSummary) -> list[str]:
+    if summary.error is not None:
+        return ["n/a"] * len(SORT_OPTIONS)
+    values = []
+    for metric in SORT_OPTIONS.values():
+        value = getattr(summary, metric)
+        if value is None:
+            values.append("n/a")
+        elif metric in {"peak_debt", "price_headroom"}:
+            values.append(outputs._format_money(value))
+        else:
+            values.append(outputs._format_metric(metric, value))
+    return values
+
+
+def render(data_path: str) -> None:
+    st.markdown("# Case Leaderboard")
+    paths = discover_case_paths()
+    st.markdown(
+        f'<div class="page-indicator">{len(paths)} cases in the library</div>',
+        unsafe_allow_html=True,
+    )
+    sort_column, order_column = st.columns(2)
+    with sort_column:
+        sort_label = st.selectbox("Sort by", list(SORT_OPTIONS), key="case_leaderboard.sort")
+    with order_column:
+        order = st.radio(
+            "Order",
+            ["Best first", "Worst first"],
+            horizontal=True,
+            key="case_leaderboard.order",
+        )
+    summaries = cached_portfolio(paths, workers=os.cpu_count())
+    metric = SORT_OPTIONS[sort_label]
+    higher_is_better = LEADERBOARD_METRICS[metric]
+    ranked = leaderboard(
+        summaries, metric, descending=higher_is_better == (order == "Best first")
+    )
+    active = {
+        _case_label(summary) for summary in ranked if summary.path == data_path
+    }
+    outputs._render_statement_table_html(
+        [(_case_label(summary), _row_values(summary)) for summary in ranked],
+        bold_labels=active,
+        year_labels=list(SORT_OPTIONS),
+    )
+    st.markdown(
+        '<div class="subtle">Minimum DSCR covers years with debt service; price headroom is '
+        "the solved purchase-price ceiling minus the case price. Cases are re-evaluated only "
+        "when their file content changes.</div>",
+        unsafe_allow_html=True,
+    )
+    failed = [summary for summary in ranked if summary.error is not None]
+    if failed:
+        st.markdown(
+            f'<div class="subtle">{len(failed)} cases failed, e.g. '
+            f"{_case_label(failed[0])}: {failed[0].error}</div>",
+            unsafe_allow_html=True,
+        )
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
-from pathlib import Path
+import html
+import os
+import time
 
 import streamlit as st
 
-from state.assumptions import Assumptions
+from state.assumptions import MAX_PLANNING_YEARS, Assumptions
+from state.cases import case_history, discover_case_paths
+from state.history import diff_assumptions
+from state.journal import case_parent
+from state.schema import build_assumptions
+from ui import outputs
+
+HISTORY_ROWS = 20
+WARNING_ROWS = 20
+CURRENT_VERSION = "Current session"
 
 
 def render(assumptions: Assumptions, data_path: str, case_options: list[str]) -> dict:
@@ -17,6 +28,28 @@ def render(assumptions: Assumptions, data_path: str, case_options: list[str]) ->
     st.caption(f"Source: {'Base' if is_base_case else 'Custom'}")
     st.caption(f"Active Scenario: {assumptions.scenario}")
     st.caption(f"File path: {data_path}")
+    parent = case_parent(data_path) if os.path.exists(data_path) else None
+    if parent is not None:
+        st.caption(f"Overlay of: {parent} (only changed drivers are stored)")
+    warnings = st.session_state.get("case_warnings", [])
+    if warnings:
+        st.warning(
+            "Adjusted while loading this case file:\n"
+            + "\n".join(f"- {warning}" for warning in warnings[:WARNING_ROWS])
+            + (f"\n- and {len(warnings) - WARNING_ROWS} more" if len(warnings) > WARNING_ROWS else "")
+        )
+    planning_years = int(
+        st.number_input(
+            "Planning Horizon (Years)",
+            min_value=1,
+            max_value=MAX_PLANNING_YEARS,
+            value=int(assumptions.planning_years),
+            step=1,
+        )
+    )
+    st.caption(
+        "Extending the horizon repeats the last plan year; shortening it drops later years."
+    )
 
     st.markdown("---")
 
@@ -24,7 +57,7 @@ def render(assumptions: Assumptions, data_path: str, case_options: list[str]) ->
     st.subheader("B. Switch Case")
     st.caption("Loading a case replaces the current session immediately.")
 
-    library_paths = _discover_case_paths(case_options)
+    library_paths = discover_case_paths()
     load_choice = st.selectbox(
         "Available cases",
         ["Select case..."] + library_paths,
@@ -46,6 +79,12 @@ def render(assumptions: Assumptions, data_path: str, case_options: list[str]) ->
         placeholder="e.g. downside_case_v2",
         label_visibility="visible",
     ).strip()
+    save_as_overlay = st.checkbox(
+        "Save As stores only the changes against this case",
+        value=False,
+        help="The copy keeps a reference to this case and picks up later edits to any "
+        "driver it does not override.",
+    )
 
     save_cols = st.columns([1, 1, 3])
     with save_cols[0]:
@@ -60,10 +99,18 @@ def render(assumptions: Assumptions, data_path: str, case_options: list[str]) ->
     st.caption("This will discard all unsaved changes in the current session.")
     reset_pressed = st.button("Reset to Base Case", type="secondary")
 
+    st.markdown("---")
+
+    # E. History
+    st.subheader("E. History")
+    _render_history(assumptions, data_path)
+
     return {
         "scenario": assumptions.scenario,
+        "planning_years": planning_years,
         "save": save_pressed,
         "save_as": save_as_pressed,
+        "save_as_overlay": save_as_overlay,
         "load": load_pressed,
         "reset": reset_pressed,
         "load_choice": load_choice,
@@ -78,35 +125,76 @@ def _case_name(path: str) -> str:
     return name or "Unnamed Case"
 
 
-def _discover_case_paths(case_options: list[str]) -> list[str]:
-    paths: list[str] = []
-
-    base_case = Path("data") / "base_case.json"
-    if base_case.exists():
-        paths.append(str(base_case))
-
-    data_dir = Path("data")
-    if data_dir.exists():
-        for path in sorted(data_dir.glob("*.json")):
-            if path.name == "base_case.json":
-                continue
-            paths.append(str(path))
-
-    cases_dir = data_dir / "cases"
-    if cases_dir.exists():
-        for name in case_options:
-            candidate = cases_dir / f"{name}.json"
-            if candidate.exists():
-                paths.append(str(candidate))
-
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for item in paths:
-        if item in seen:
-            continue
-        seen.add(item)
-        ordered.append(item)
-    return ordered
+def _render_history(assumptions: Assumptions, data_path: str) -> None:
+    history = case_history()
+    entries = history.log(data_path, limit=HISTORY_ROWS)
+    if not entries:
+        st.caption("No saved versions yet. Each Save records a version of this case.")
+        return
+    labels = {entry.version: _version_label(entry.version, entry.time) for entry in entries}
+    outputs._render_statement_table_html(
+        [
+            (
+                labels[entry.version],
+                [
+                    html.escape(entry.message),
+                    "n/a" if entry.changes is None else str(entry.changes),
+                ],
+            )
+            for entry in entries
+        ],
+        year_labels=["Note", "Changed Fields"],
+    )
+    options = [CURRENT_VERSION] + list(labels)
+    compare_cols = st.columns(2)
+    with compare_cols[0]:
+        old_version = st.selectbox(
+            "Compare from",
+            options,
+            index=1,
+            format_func=lambda value: labels.get(value, value),
+            key="case_management.compare_from",
+        )
+    with compare_cols[1]:
+        new_version = st.selectbox(
+            "Compare to",
+            options,
+            index=0,
+            format_func=lambda value: labels.get(value, value),
+            key="case_management.compare_to",
+        )
+    changes = diff_assumptions(
+        _version_assumptions(old_version, assumptions),
+        _version_assumptions(new_version, assumptions),
+    )
+    if not changes:
+        st.caption("No differences between the selected versions.")
+        return
+    outputs._render_statement_table_html(
+        [
+            (html.escape(change.path), [_change_value(change.old), _change_value(change.new)])
+            for change in changes
+        ],
+        year_labels=["From", "To"],
+    )
+
+
+def _version_assumptions(version: str, assumptions: Assumptions) -> Assumptions:
+    if version == CURRENT_VERSION:
+        return assumptions
+    return build_assumptions(case_history().checkout(version))
+
+
+def _version_label(version: str, saved_at: float) -> str:
+    return f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(saved_at))} ({version[:8]})"
+
+
+def _change_value(value: object) -> str:
+    if value is None:
+        return "n/a"
+    if isinstance(value, float):
+        return f"{value:,.6g}"
+    return html.escape(str(value))
 
 
 def _case_option_label(value: str) -> str:
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import streamlit as st
 
-from model.run_model import ModelResult, run_model
+from model.cache import cached_run_model
+from model.run_model import ModelResult
 from state.assumptions import Assumptions
 from ui import outputs
 from ui import inputs
@@ -48,7 +49,7 @@ def render(result: ModelResult, assumptions: Assumptions) -> Assumptions:
     )
     _render_scenario_selector(assumptions.scenario)
     output_container = st.container()
-    updated_result = run_model(updated_assumptions)
+    updated_result = cached_run_model(updated_assumptions)
     cash_balances = [row["cash_balance"] for row in updated_result.cashflow]
     min_cash = min(cash_balances) if cash_balances else 0.0
     negative_years = len([value for value in cash_balances if value < 0])
@@ -63,7 +64,7 @@ def render(result: ModelResult, assumptions: Assumptions) -> Assumptions:
     ]
     with output_container:
         outputs._render_kpi_table_html(kpi_rows, ["Metric", "Value"])
-        year_labels = outputs.build_year_labels(5)
+        year_labels = outputs.build_year_labels(len(updated_result.cashflow))
         year_labels[0] = (
             "Transition Year (As-Is / Closing) – Includes one-off transaction and financing effects"
         )
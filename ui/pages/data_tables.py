@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+import streamlit as st
+
+from model.data_table import GridAxis, grid_axis, run_data_table
+from model.sensitivity import SensitivityLeaf, sensitivity_leaves
+from state.assumptions import Assumptions
+from ui import outputs
+
+METRIC_OPTIONS = {
+    "Equity IRR": "irr",
+    "Minimum DSCR": "min_dscr",
+    "Minimum Cash": "min_cash",
+    "Exit Equity Value": "exit_value",
+}
+DEFAULT_ROW_INPUT = "Purchase Price"
+DEFAULT_COLUMN_INPUT = "Interest Rate %"
+MAX_STEPS = 50
+
+
+def _axis_options(assumptions: Assumptions) -> Dict[str, Tuple[str, str, bool, float]]:
+    options = {}
+    for leaf in sensitivity_leaves(assumptions):
+        if leaf.year is None:
+            options[leaf.label] = (leaf.path, leaf.name, False, leaf.value)
+            continue
+        label = f"{SensitivityLeaf(leaf.path, leaf.name, None, 0.0).label} (All Years)"
+        path = ".".join(part for part in leaf.path.split(".") if not part.isdigit())
+        options.setdefault(label, (path, leaf.name, True, 1.0))
+    return options
+
+
+def _format_axis_value(name: str, value: float, relative: bool) -> str:
+    if relative:
+        return f"{value * 100:.0f}% of plan"
+    if name.endswith("_eur"):
+        return outputs._format_money(value)
+    if "_pct" in name:
+        return f"{value * 100:.2f}%"
+    return f"{value:,.2f}"
+
+
+def _render_axis(
+    title: str,
+    options: Dict[str, Tuple[str, str, bool, float]],
+    default: str,
+    key: str,
+) -> Tuple[GridAxis, str]:
+    labels = list(options)
+    label = st.selectbox(
+        title,
+        labels,
+        index=labels.index(default) if default in labels else 0,
+        key=f"data_tables.{key}.input",
+    )
+    path, name, relative, base_value = options[label]
+    scale = 100.0 if relative else 1.0
+    start_column, stop_column, steps_column = st.columns(3)
+    with start_column:
+        start = st.number_input(
+            "From (% of plan)" if relative else "From",
+            value=float(base_value * 0.8 * scale),
+            key=f"data_tables.{key}.{path}.start",
+        )
+    with stop_column:
+        stop = st.number_input(
+            "To (% of plan)" if relative else "To",
+            value=float(base_value * 1.2 * scale),
+            key=f"data_tables.{key}.{path}.stop",
+        )
+    with steps_column:
+        steps = st.number_input(
+            "Steps",
+            min_value=1,
+            max_value=MAX_STEPS,
+            value=5,
+            step=1,
+            key=f"data_tables.{key}.{path}.steps",
+        )
+    return grid_axis(path, start / scale, stop / scale, int(steps), relative), name
+
+
+def render(assumptions: Assumptions) -> None:
+    st.markdown("# Data Tables")
+    st.markdown(
+        f'<div class="page-indicator">Scenario: {assumptions.scenario}</div>',
+        unsafe_allow_html=True,
+    )
+    options = _axis_options(assumptions)
+    metric_label = st.selectbox("Outcome", list(METRIC_OPTIONS), key="data_tables.metric")
+    metric = METRIC_OPTIONS[metric_label]
+    row_column, column_column = st.columns(2)
+    with row_column:
+        rows, row_name = _render_axis("Row Input", options, DEFAULT_ROW_INPUT, "rows")
+    with column_column:
+        columns, column_name = _render_axis(
+            "Column Input", options, DEFAULT_COLUMN_INPUT, "columns"
+        )
+
+    try:
+        table = run_data_table(assumptions, rows, columns)
+    except ValueError as exc:
+        st.error(str(exc))
+        return
+    values = table.table(metric)
+    table_rows = [
+        (
+            _format_axis_value(row_name, row_value, rows.relative),
+            [outputs._format_metric(metric, value) for value in values[row_index].tolist()],
+        )
+        for row_index, row_value in enumerate(rows.values)
+    ]
+    outputs._render_statement_table_html(
+        table_rows,
+        year_labels=[
+            _format_axis_value(column_name, value, columns.relative)
+            for value in columns.values
+        ],
+    )
+    st.markdown(
+        f'<div class="subtle">{metric_label} for {len(rows.values)} × {len(columns.values)} '
+        "cases, evaluated in one batch run. Per-year inputs scale every plan year; "
+        '"n/a" marks cases the model rejects.</div>',
+        unsafe_allow_html=True,
+    )
+    if table.errors:
+        first_error = next(iter(table.errors.values()))
+        st.markdown(
+            f'<div class="subtle">{len(table.errors)} cases failed, e.g. {first_error}</div>',
+            unsafe_allow_html=True,
+        )
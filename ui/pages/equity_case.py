@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import streamlit as st
 
-from model.run_model import ModelResult, run_model
+from model.cache import cached_run_model
+from model.run_model import ModelResult
 from state.assumptions import Assumptions
 from ui import outputs
 from ui import inputs
@@ -15,7 +16,7 @@ def render(result: ModelResult, assumptions: Assumptions) -> Assumptions:
         updated_assumptions = inputs.render_equity_key_assumptions(
             assumptions, "equity.assumptions"
         )
-    updated_result = run_model(updated_assumptions)
+    updated_result = cached_run_model(updated_assumptions)
     with output_container:
         outputs.render_equity_case(updated_result, updated_assumptions)
         pension_obligation = updated_assumptions.balance_sheet.pension_obligations_eur
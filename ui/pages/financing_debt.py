@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import streamlit as st
 
-from model.run_model import ModelResult, run_model
+from model.cache import cached_run_model
+from model.run_model import ModelResult
 from state.assumptions import Assumptions
 from ui import outputs
 from ui import inputs
@@ -15,11 +16,11 @@ def render(result: ModelResult, assumptions: Assumptions) -> Assumptions:
             assumptions, "financing.assumptions"
         )
     output_container = st.container()
-    updated_result = run_model(updated_assumptions)
+    updated_result = cached_run_model(updated_assumptions)
     with output_container:
         outputs.render_financing_debt(updated_result, updated_assumptions)
         st.markdown(
-            '<div class="subtle">Repayment profile is fixed to linear amortization for this model version to maintain comparability across cases; changes to repayment structure should be evaluated as a separate financing scenario.</div>',
+            '<div class="subtle">Repayment profile is linear by default. Sculpted repayment sizes annual principal so DSCR equals the minimum DSCR covenant; compare repayment structures as separate financing scenarios.</div>',
             unsafe_allow_html=True,
         )
         pension_obligation = updated_assumptions.balance_sheet.pension_obligations_eur
@@ -44,6 +45,7 @@ def render(result: ModelResult, assumptions: Assumptions) -> Assumptions:
             "\n**3) Calculation Logic (Transparent, Step-by-Step)**\n"
             "- CFADS = EBITDA − Cash Taxes − Maintenance Capex ± Working Capital Change.\n"
             "- Total Debt Service = Interest Expense + Scheduled Repayment.\n"
+            "- Sculpted Repayment = CFADS / Minimum DSCR − Interest Expense (capped at the open balance).\n"
             "- DSCR = CFADS / Total Debt Service.\n"
             "- DSCR Headroom = DSCR − Minimum Required DSCR.\n"
             "- Covenant Breach = YES when DSCR < Minimum Required DSCR.\n"
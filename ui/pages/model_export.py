@@ -7,8 +7,9 @@ import streamlit as st
 
 from dataclasses import replace
 
+from model.cache import cached_run_model
 from model.excel_export import export_ic_excel
-from model.run_model import ModelResult, run_model
+from model.run_model import ModelResult
 from state.assumptions import Assumptions
 from state.json_export import export_case_snapshot_json
 
@@ -22,7 +23,7 @@ def render(assumptions: Assumptions, result: ModelResult) -> None:
     export_assumptions = assumptions
     if scenario in {"Worst", "Base", "Best"} and scenario != assumptions.scenario:
         export_assumptions = replace(assumptions, scenario=scenario)
-        result = run_model(export_assumptions)
+        result = cached_run_model(export_assumptions)
     st.caption(f"Current selection: {case_name} · {scenario}")
 
     export_key = (case_name, scenario)
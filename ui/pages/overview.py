@@ -2,10 +2,43 @@ from __future__ import annotations
 
 import streamlit as st
 
+from model.autodiff import run_jacobian
+from model.cache import cached_break_even
 from model.run_model import ModelResult
+from model.sensitivity import run_sensitivity
 from state.assumptions import Assumptions
 from ui import outputs
 
+SENSITIVITY_OPTIONS = {
+    "Equity IRR": "irr",
+    "Minimum DSCR": "min_dscr",
+    "Minimum Cash": "min_cash",
+    "Exit Equity Value": "exit_value",
+}
+SENSITIVITY_BUMPS = [5, 10, 20]
+TORNADO_ROWS = 10
+MARGINAL_OPTIONS = {
+    "Equity IRR": "irr",
+    "Net Income": "net_income",
+    "Cash Balance": "cash_balance",
+    "DSCR": "dscr",
+}
+KINK_LABELS = {
+    "guarantee_clamp": "the guarantee % sits at a 0% or 100% bound",
+    "guarantee_floor": "modeled group revenue equals the guarantee floor",
+    "tax_floor": "EBT is exactly zero",
+}
+BREAK_EVEN_OPTIONS = {
+    "EBITDA = 0": "ebitda",
+    "Net Cash Flow = 0": "net_cashflow",
+    "DSCR = Covenant": "dscr",
+}
+BREAK_EVEN_DRIVER_LABELS = {
+    "utilization": "Utilization",
+    "day_rate": "Blended Day Rate",
+    "consultant_fte": "Consultant FTE",
+}
+
 
 def _case_name(path: str) -> str:
     if not path:
@@ -19,7 +52,7 @@ def _case_name(path: str) -> str:
 def _format_first_negative_year(values: list[float]) -> str:
     for idx, value in enumerate(values):
         if value < 0:
-            return outputs.YEAR_LABELS[idx]
+            return outputs._year_label(idx)
     return "None"
 
 
@@ -33,6 +66,160 @@ def _interpret_liquidity(values: list[float]) -> str:
     return "Liquidity remains positive across the plan horizon."
 
 
+def _format_driver(driver: str, value: float) -> str:
+    if value != value:
+        return "n/a"
+    if driver == "utilization":
+        return f"{value * 100:.1f}%"
+    if driver == "day_rate":
+        return outputs._format_money(value)
+    return f"{value:,.1f}"
+
+
+def _render_break_even(assumptions: Assumptions) -> None:
+    st.markdown("### Break-even View")
+    target_column, driver_column = st.columns(2)
+    with target_column:
+        target_label = st.selectbox(
+            "Break-even Target", list(BREAK_EVEN_OPTIONS), key="overview.break_even_target"
+        )
+    with driver_column:
+        driver_label = st.selectbox(
+            "Driver", list(BREAK_EVEN_DRIVER_LABELS.values()), key="overview.break_even_driver"
+        )
+    try:
+        solutions = cached_break_even(assumptions, BREAK_EVEN_OPTIONS[target_label])
+    except ValueError as exc:
+        st.markdown(f'<div class="subtle">Break-even not available: {exc}</div>', unsafe_allow_html=True)
+        return
+    driver = next(key for key, label in BREAK_EVEN_DRIVER_LABELS.items() if label == driver_label)
+    selected = solutions[driver]
+    year_labels = [outputs._year_label(idx) for idx in range(len(selected.plan))]
+    st.line_chart({"Plan": selected.plan.tolist(), "Break-even": selected.values.tolist()})
+    break_even_rows = []
+    for key, solution in solutions.items():
+        label = BREAK_EVEN_DRIVER_LABELS[key]
+        break_even_rows.append(
+            (f"{label} (Plan)", [_format_driver(key, value) for value in solution.plan.tolist()])
+        )
+        break_even_rows.append(
+            (f"{label} (Break-even)", [_format_driver(key, value) for value in solution.values.tolist()])
+        )
+    outputs._render_statement_table_html(
+        break_even_rows,
+        bold_labels={f"{label} (Break-even)" for label in BREAK_EVEN_DRIVER_LABELS.values()},
+        years=len(year_labels),
+        year_labels=year_labels,
+    )
+    st.markdown(
+        '<div class="subtle">Each driver is moved in one year at a time, all other inputs held at plan. '
+        "The blended day rate scales group and external rates together; "
+        '"n/a" means the target is not reached within 0–400% of plan.</div>',
+        unsafe_allow_html=True,
+    )
+
+
+def _render_sensitivity(assumptions: Assumptions) -> None:
+    st.markdown("### Sensitivity – What Moves the Outcome")
+    metric_column, bump_column = st.columns(2)
+    with metric_column:
+        metric_label = st.selectbox(
+            "Outcome", list(SENSITIVITY_OPTIONS), key="overview.sensitivity_metric"
+        )
+    with bump_column:
+        bump = st.select_slider(
+            "Bump (±%)", SENSITIVITY_BUMPS, value=10, key="overview.sensitivity_bump"
+        )
+    metric = SENSITIVITY_OPTIONS[metric_label]
+    try:
+        sensitivity = run_sensitivity(assumptions, bump=bump / 100)
+    except ValueError as exc:
+        st.markdown(f'<div class="subtle">Sensitivity not available: {exc}</div>', unsafe_allow_html=True)
+        return
+    tornado_rows = [
+        (
+            row.leaf.label,
+            [
+                outputs._format_metric(metric, row.low),
+                outputs._format_metric(metric, row.high),
+                outputs._format_metric(metric, row.swing),
+            ],
+        )
+        for row in sensitivity.tornado(metric, TORNADO_ROWS)
+    ]
+    outputs._render_statement_table_html(
+        tornado_rows,
+        years=3,
+        year_labels=[f"Input −{bump}%", f"Input +{bump}%", "Swing"],
+    )
+    st.markdown(
+        f'<div class="subtle">Base {metric_label}: {outputs._format_metric(metric, sensitivity.base[metric])}. '
+        f"Each of {len(sensitivity.leaves)} inputs is bumped on its own; "
+        "all variants are evaluated in one batch run.</div>",
+        unsafe_allow_html=True,
+    )
+
+
+def _render_marginal_drivers(assumptions: Assumptions) -> None:
+    st.markdown("### What Moves This Number – Exact Slopes")
+    metric_column, year_column = st.columns(2)
+    with metric_column:
+        metric_label = st.selectbox(
+            "Outcome", list(MARGINAL_OPTIONS), key="overview.marginal_metric"
+        )
+    metric = MARGINAL_OPTIONS[metric_label]
+    year = None
+    if metric != "irr":
+        with year_column:
+            year = st.selectbox(
+                "Year",
+                list(range(assumptions.planning_years)),
+                index=assumptions.planning_years - 1,
+                format_func=outputs._year_label,
+                key="overview.marginal_year",
+            )
+    try:
+        jacobian = run_jacobian(assumptions)
+    except ValueError as exc:
+        st.markdown(f'<div class="subtle">Slopes not available: {exc}</div>', unsafe_allow_html=True)
+        return
+    rows = [
+        (leaf.label, [f"{derivative:,.4g}", _format_impact(metric, impact)])
+        for leaf, derivative, impact in jacobian.ranking(metric, year, TORNADO_ROWS)
+    ]
+    outputs._render_statement_table_html(
+        rows,
+        years=2,
+        year_labels=["Slope (per Unit)", "Input +1%"],
+    )
+    value = jacobian.values[metric] if year is None else jacobian.values[metric][year]
+    hits = {name: flags if year is None else flags[year] for name, flags in jacobian.kinks.items()}
+    kinks = [label for name, label in KINK_LABELS.items() if hits[name].any()]
+    note = (
+        f" At this point {', and '.join(kinks)}; slopes there are for an increase of the input."
+        if kinks
+        else ""
+    )
+    st.markdown(
+        f'<div class="subtle">{metric_label}: {_format_impact(metric, value, signed=False)}. '
+        f"Exact derivatives for all {len(jacobian.leaves)} inputs from one forward pass; "
+        f"drivers are ranked by the effect of a 1% increase.{note}</div>",
+        unsafe_allow_html=True,
+    )
+
+
+def _format_impact(metric: str, value: float, signed: bool = True) -> str:
+    if value != value:
+        return "n/a"
+    sign = "+" if signed else ""
+    if metric == "irr":
+        return f"{value * 100:{sign}.2f}" + (" pp" if signed else "%")
+    if metric == "dscr":
+        return f"{value:{sign}.3f}x"
+    formatted = outputs._format_money(value)
+    return f"+{formatted}" if signed and value > 0 else formatted
+
+
 def render(result: ModelResult, assumptions: Assumptions) -> None:
     case_name = _case_name(st.session_state.get("data_path", ""))
     st.markdown("# Overview")
@@ -95,7 +282,7 @@ def render(result: ModelResult, assumptions: Assumptions) -> None:
 
     with top_left:
         st.markdown("### Business Economics (Steady-State)")
-        year_index = 2
+        year_index = min(2, len(result.pnl) - 1)
         revenue = result.pnl[year_index]["revenue"]
         personnel_costs = result.pnl[year_index]["personnel_costs"]
         ebitda = result.pnl[year_index]["ebitda"]
@@ -118,7 +305,7 @@ def render(result: ModelResult, assumptions: Assumptions) -> None:
         outputs._render_statement_table_html(
             operating_rows,
             years=1,
-            year_labels=[outputs.YEAR_LABELS[year_index]],
+            year_labels=[outputs._year_label(year_index)],
         )
 
     with top_right:
@@ -245,6 +432,10 @@ def render(result: ModelResult, assumptions: Assumptions) -> None:
             interpretation = "Price is financeable and below market reference."
         st.markdown(f'<div class="subtle">{interpretation}</div>', unsafe_allow_html=True)
 
+    _render_break_even(assumptions)
+    _render_sensitivity(assumptions)
+    _render_marginal_drivers(assumptions)
+
     with st.expander("Key Assumptions (View Only)", expanded=False):
         key_rows = [
             ("Purchase Price", [purchase_price]),
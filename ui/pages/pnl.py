@@ -2,10 +2,20 @@ from __future__ import annotations
 
 import streamlit as st
 
-from model.run_model import ModelResult, run_model
+from model.cache import cached_run_model, cached_stress_frontier, request_stress_surface
+from model.run_model import ModelResult
 from state.assumptions import Assumptions
 from ui import outputs
-from ui.pages.quick_adjust import render_quick_adjust_pnl
+from ui.pages.quick_adjust import (
+    COST_INFLATION_MAX_PCT,
+    PRICING_STRESS_RANGE_PCT,
+    UTILIZATION_STRESS_MIN_PP,
+    _max_utilization_delta,
+    render_quick_adjust_pnl,
+)
+
+FRONTIER_PRICING_LINES = (-20, -10, -5, 0, 5)
+BREACH_NAMES = {0: "model error", 1: "DSCR below covenant", 2: "negative cash"}
 
 
 def _case_name(path: str) -> str:
@@ -34,6 +44,86 @@ def _render_scenario_selector(current: str) -> None:
     )
 
 
+def _stress_ranges(assumptions: Assumptions) -> tuple[range, range]:
+    planned_utilization = assumptions.revenue.scenarios[assumptions.scenario].utilization_rate_pct[0]
+    utilization_deltas = range(
+        UTILIZATION_STRESS_MIN_PP, _max_utilization_delta(planned_utilization) + 1
+    )
+    pricing_stresses = range(PRICING_STRESS_RANGE_PCT[0], PRICING_STRESS_RANGE_PCT[1] + 1)
+    return utilization_deltas, pricing_stresses
+
+
+def _stressed_result(assumptions: Assumptions, updated_assumptions: Assumptions) -> ModelResult:
+    stress = st.session_state.get("operational_steering", {}).get(assumptions.scenario, {})
+    utilization_delta = int(stress.get("utilization_delta_pp", 0))
+    pricing_stress = int(stress.get("pricing_stress_pct", 0))
+    cost_inflation = int(stress.get("cost_inflation_pct", 0))
+    utilization_deltas, pricing_stresses = _stress_ranges(assumptions)
+    surface = request_stress_surface(
+        assumptions, utilization_deltas, pricing_stresses, range(COST_INFLATION_MAX_PCT + 1)
+    )
+    if surface is not None and (utilization_delta, pricing_stress, cost_inflation) != (0, 0, 0):
+        result = surface.operating_result(utilization_delta, pricing_stress, cost_inflation)
+        if result is not None:
+            return result
+    return cached_run_model(updated_assumptions)
+
+
+def _render_stress_frontier(assumptions: Assumptions) -> None:
+    utilization_deltas, pricing_stresses = _stress_ranges(assumptions)
+    try:
+        frontier = cached_stress_frontier(assumptions, utilization_deltas, pricing_stresses)
+    except ValueError as exc:
+        st.markdown(f'<div class="subtle">Stress frontier not available: {exc}</div>', unsafe_allow_html=True)
+        return
+    st.markdown("### Covenant Stress Frontier")
+    st.line_chart(
+        {
+            f"Pricing {pricing:+d}%": dict(
+                zip(
+                    utilization_deltas,
+                    frontier.breach_cost_inflation_pct[:, pricing_stresses.index(pricing)].tolist(),
+                )
+            )
+            for pricing in FRONTIER_PRICING_LINES
+            if pricing in pricing_stresses
+        }
+    )
+    stress = st.session_state.get("operational_steering", {}).get(assumptions.scenario, {})
+    utilization_delta = int(stress.get("utilization_delta_pp", 0))
+    pricing_stress = int(stress.get("pricing_stress_pct", 0))
+    cost_inflation = int(stress.get("cost_inflation_pct", 0))
+    if utilization_delta in utilization_deltas and pricing_stress in pricing_stresses:
+        row = utilization_deltas.index(utilization_delta)
+        column = pricing_stresses.index(pricing_stress)
+        distance = frontier.distance(utilization_delta, pricing_stress, cost_inflation)
+        if distance != distance:
+            note = f"No breach up to {COST_INFLATION_MAX_PCT}% cost inflation."
+        elif distance <= 0:
+            note = (
+                f"already past the frontier, first breach "
+                f"({BREACH_NAMES[int(frontier.binding[row, column])]}) in "
+                f"{outputs._year_label(int(frontier.breach_year[row, column]))}."
+            )
+        else:
+            note = (
+                f"{distance:.0f} pp of additional cost inflation until the first breach "
+                f"({BREACH_NAMES[int(frontier.binding[row, column])]}, "
+                f"{outputs._year_label(int(frontier.breach_year[row, column]))})."
+            )
+        st.markdown(
+            f'<div class="subtle">Current overlay ({utilization_delta:+d} pp utilization, '
+            f"{pricing_stress:+d}% pricing, {cost_inflation}% cost inflation): {note}</div>",
+            unsafe_allow_html=True,
+        )
+    st.markdown(
+        '<div class="subtle">Each line shows, per utilization stress in pp (x-axis), the lowest cost inflation '
+        "(%, y-axis) at which any year falls below the minimum DSCR or turns cash-negative. Points at 0% "
+        "already breach without cost stress; gaps mean no breach within the slider range.</div>",
+        unsafe_allow_html=True,
+    )
+
+
 def render(result: ModelResult, assumptions: Assumptions) -> None:
     case_name = _case_name(st.session_state.get("data_path", ""))
     scenario = assumptions.scenario
@@ -45,7 +135,8 @@ def render(result: ModelResult, assumptions: Assumptions) -> None:
     _render_scenario_selector(assumptions.scenario)
 
     updated_assumptions = render_quick_adjust_pnl(assumptions, "pnl.quick")
-    updated_result = run_model(updated_assumptions)
+    _render_stress_frontier(assumptions)
+    updated_result = _stressed_result(assumptions, updated_assumptions)
     st.markdown(
         "<div class=\"info-box\"><strong>Interpretation</strong><ul>"
         "<li>Economics are driven by utilization and seniority mix, not pricing power.</li>"
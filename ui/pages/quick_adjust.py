@@ -9,6 +9,14 @@ from state.assumptions import (
     RevenueAssumptions,
 )
 
+UTILIZATION_STRESS_MIN_PP = -30
+PRICING_STRESS_RANGE_PCT = (-20, 5)
+COST_INFLATION_MAX_PCT = 150
+
+
+def _max_utilization_delta(planned_utilization: float) -> int:
+    return max(int(round((1 - planned_utilization) * 100)), 10)
+
 
 def render_quick_adjust_pnl(assumptions: Assumptions, key_prefix: str) -> Assumptions:
     scenario = assumptions.scenario
@@ -35,13 +43,10 @@ def render_quick_adjust_pnl(assumptions: Assumptions, key_prefix: str) -> Assump
         st.markdown("**Utilization stress (delta vs. plan, percentage points)**")
         utilization_key = f"{key_prefix}.utilization_delta_pp.{scenario}"
         planned_utilization = scenario_assumptions.utilization_rate_pct[year_index]
-        max_utilization_delta = int(round((1 - planned_utilization) * 100))
-        if max_utilization_delta < 10:
-            max_utilization_delta = 10
         utilization_delta_pp = st.slider(
             "Utilization stress (delta vs. plan, percentage points)",
-            min_value=-30,
-            max_value=max_utilization_delta,
+            min_value=UTILIZATION_STRESS_MIN_PP,
+            max_value=_max_utilization_delta(planned_utilization),
             value=int(scenario_state.get("utilization_delta_pp", 0)),
             step=1,
             key=utilization_key,
@@ -59,8 +64,8 @@ def render_quick_adjust_pnl(assumptions: Assumptions, key_prefix: str) -> Assump
         pricing_key = f"{key_prefix}.pricing_stress_pct.{scenario}"
         pricing_stress_pct = st.slider(
             "Pricing stress (day-rate change vs. plan, %)",
-            min_value=-20,
-            max_value=5,
+            min_value=PRICING_STRESS_RANGE_PCT[0],
+            max_value=PRICING_STRESS_RANGE_PCT[1],
             value=int(scenario_state.get("pricing_stress_pct", 0)),
             step=1,
             key=pricing_key,
@@ -76,7 +81,7 @@ def render_quick_adjust_pnl(assumptions: Assumptions, key_prefix: str) -> Assump
         cost_inflation_pct = st.slider(
             "Cost inflation stress (people + opex, %)",
             min_value=0,
-            max_value=150,
+            max_value=COST_INFLATION_MAX_PCT,
             value=int(scenario_state.get("cost_inflation_pct", 0)),
             step=1,
             key=cost_key,
@@ -4,7 +4,7 @@ import streamlit as st
 
 from dataclasses import replace
 
-from model.run_model import run_model
+from model.cache import cached_run_model
 from state.assumptions import Assumptions
 from ui import inputs
 from ui import outputs
@@ -39,10 +39,10 @@ def render(assumptions: Assumptions) -> Assumptions:
     if selected_scenario != assumptions.scenario:
         assumptions = replace(assumptions, scenario=selected_scenario)
     st.markdown("### Consultant Capacity (Derived)")
-    year_columns = inputs.YEARS
+    year_columns = outputs.build_year_labels(assumptions.planning_years)
     consultant_fte = [
         int(round(assumptions.cost.personnel_by_year[idx].consultant_fte))
-        for idx in range(5)
+        for idx in range(assumptions.planning_years)
     ]
     rows = [
         (
@@ -56,7 +56,7 @@ def render(assumptions: Assumptions) -> Assumptions:
         year_labels=year_columns,
     )
     updated_assumptions = inputs.render_revenue_inputs(assumptions)
-    updated_result = run_model(updated_assumptions)
+    updated_result = cached_run_model(updated_assumptions)
     components = updated_result.revenue.get("components_by_year", [])
     if components:
         st.markdown("### Revenue Bridge")
@@ -70,7 +70,7 @@ def render(assumptions: Assumptions) -> Assumptions:
         outputs._render_statement_table_html(
             rows,
             bold_labels={"Total Revenue", "Effective Group Revenue"},
-            year_labels=outputs.YEAR_LABELS,
+            year_labels=outputs.build_year_labels(len(components)),
         )
         if any(
             row["modeled_group_revenue"] < row["guaranteed_floor"]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import Dict
+
+import streamlit as st
+
+from model.cache import cached_run_all_scenarios
+from model.run_model import ModelResult
+from state.assumptions import Assumptions
+from ui import outputs
+
+SCENARIO_ORDER = ["Worst", "Base", "Best"]
+YEARLY_OPTIONS = {
+    "Revenue": ("pnl", "revenue"),
+    "EBITDA": ("pnl", "ebitda"),
+    "Net Income": ("pnl", "net_income"),
+    "Net Cash Flow": ("cashflow", "net_cashflow"),
+    "Cash Balance": ("cashflow", "cash_balance"),
+    "DSCR": ("debt", "dscr"),
+}
+
+
+def _ordered(results: Dict[str, ModelResult]) -> Dict[str, ModelResult]:
+    names = [name for name in SCENARIO_ORDER if name in results]
+    names += [name for name in results if name not in names]
+    return {name: results[name] for name in names}
+
+
+def _summary_rows(results: Dict[str, ModelResult], minimum_dscr: float) -> list:
+    last_year = {name: result.pnl[len(result.pnl) - 1] for name, result in results.items()}
+    rows = [
+        ("Revenue (Final Year)", [row["revenue"] for row in last_year.values()]),
+        ("EBITDA (Final Year)", [row["ebitda"] for row in last_year.values()]),
+        (
+            "EBITDA Margin (Final Year)",
+            [outputs._format_percent(row["ebitda"], row["revenue"]) for row in last_year.values()],
+        ),
+    ]
+    min_cash = []
+    min_dscr = []
+    breaches = []
+    irr = []
+    exit_value = []
+    for result in results.values():
+        cash_balances = [row["cash_balance"] for row in result.cashflow]
+        serviced = [row["dscr"] for row in result.debt if row["debt_service"]]
+        min_cash.append(outputs._format_metric("min_cash", min(cash_balances)))
+        min_dscr.append(
+            outputs._format_metric("min_dscr", min(serviced)) if serviced else "n/a"
+        )
+        breaches.append(str(len([value for value in serviced if value < minimum_dscr])))
+        value = result.equity.get("irr")
+        irr.append(outputs._format_metric("irr", float("nan") if value is None else value))
+        exit_value.append(outputs._format_metric("exit_value", result.equity["exit_value"]))
+    rows += [
+        ("Minimum Cash Balance", min_cash),
+        ("Minimum DSCR", min_dscr),
+        ("Years below covenant", breaches),
+        ("Equity IRR", irr),
+        ("Exit Equity Value", exit_value),
+    ]
+    return rows
+
+
+def render(assumptions: Assumptions) -> None:
+    st.markdown("# Scenario Comparison")
+    st.markdown(
+        f'<div class="page-indicator">Active scenario: {assumptions.scenario}</div>',
+        unsafe_allow_html=True,
+    )
+    try:
+        results = _ordered(cached_run_all_scenarios(assumptions))
+    except ValueError as exc:
+        st.error(str(exc))
+        return
+    names = list(results)
+
+    st.markdown("### Key Figures")
+    outputs._render_statement_table_html(
+        _summary_rows(results, assumptions.financing.minimum_dscr),
+        bold_labels={"EBITDA (Final Year)", "Equity IRR"},
+        year_labels=names,
+    )
+
+    st.markdown("### By Year")
+    metric_label = st.selectbox(
+        "Line Item", list(YEARLY_OPTIONS), key="scenario_comparison.metric"
+    )
+    table, column = YEARLY_OPTIONS[metric_label]
+    series = {
+        name: [row[column] for row in getattr(result, table)]
+        for name, result in results.items()
+    }
+    st.line_chart(series)
+    if column == "dscr":
+        yearly_rows = [
+            (name, [f"{value:.2f}x" for value in values]) for name, values in series.items()
+        ]
+    else:
+        yearly_rows = list(series.items())
+    outputs._render_statement_table_html(
+        yearly_rows,
+        year_labels=[outputs._year_label(idx) for idx in range(assumptions.planning_years)],
+    )
+    st.markdown(
+        f'<div class="subtle">All {len(names)} scenarios are evaluated together and cached; '
+        "switching the view scenario on other pages reuses these results.</div>",
+        unsafe_allow_html=True,
+    )
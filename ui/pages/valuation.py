@@ -2,11 +2,24 @@ from __future__ import annotations
 
 import streamlit as st
 
-from model.run_model import ModelResult, run_model
+from model.cache import cached_goal_seek, cached_run_model
+from model.goal_seek import GoalSeekResult
+from model.run_model import ModelResult
 from state.assumptions import Assumptions
 from ui import outputs
 from ui import inputs
 
+BINDING_LABELS = {
+    "min_dscr": "minimum DSCR",
+    "min_cash": "minimum cash balance",
+    "model": "model validity",
+}
+GOAL_SEEK_LABELS = {
+    "purchase_price": "Maximum purchase price",
+    "senior_debt": "Maximum senior debt",
+    "equity_contribution": "Minimum equity contribution",
+}
+
 
 def _case_name(path: str) -> str:
     if not path:
@@ -34,6 +47,23 @@ def _render_scenario_selector(current: str) -> None:
     )
 
 
+def _goal_seek_value(value: float | None, status: str = "solved") -> float | str:
+    if status == "infeasible":
+        return "infeasible"
+    return "n/a" if value is None else value
+
+
+def _binding_note(result: GoalSeekResult) -> str:
+    if result.status == "infeasible":
+        return (
+            "Solved ceiling: infeasible at any price "
+            f"(binding: {BINDING_LABELS[result.binding]})."
+        )
+    if result.status == "unbounded":
+        return "Solved ceiling: no DSCR or cash limit found within the search range."
+    return f"Solved ceiling is bound by the {BINDING_LABELS[result.binding]}."
+
+
 def render(result: ModelResult, assumptions: Assumptions) -> Assumptions:
     case_name = _case_name(st.session_state.get("data_path", ""))
     scenario = assumptions.scenario
@@ -48,7 +78,7 @@ def render(result: ModelResult, assumptions: Assumptions) -> Assumptions:
     )
     _render_scenario_selector(assumptions.scenario)
     output_container = st.container()
-    updated_result = run_model(updated_assumptions)
+    updated_result = cached_run_model(updated_assumptions)
     pension_obligation = updated_assumptions.balance_sheet.pension_obligations_eur
     if not updated_result.pnl:
         st.error("P&L data is missing for the current plan horizon.")
@@ -96,6 +126,7 @@ def render(result: ModelResult, assumptions: Assumptions) -> Assumptions:
     discount_to_intrinsic = dcf_value - purchase_price
     discount_to_market = enterprise_value_multiple - purchase_price
     implied_multiple = purchase_price / transition_ebit if transition_ebit else 0.0
+    price_ceiling = cached_goal_seek(updated_assumptions, "purchase_price")
 
     intrinsic_label = (
         "Discount to intrinsic value"
@@ -185,6 +216,8 @@ def render(result: ModelResult, assumptions: Assumptions) -> Assumptions:
         )
         deal_rows = [
             ("Purchase Price (Enterprise)", [purchase_price]),
+            ("Solved ceiling (max price within DSCR & min. cash)", [_goal_seek_value(price_ceiling.value, price_ceiling.status)]),
+            ("Headroom vs solved ceiling", [_goal_seek_value(price_ceiling.headroom)]),
             ("Implied Equity Price (after net debt & pensions)", [equity_price]),
             (intrinsic_label, [intrinsic_amount]),
             (f"{intrinsic_label} (%)", [intrinsic_percent]),
@@ -200,6 +233,10 @@ def render(result: ModelResult, assumptions: Assumptions) -> Assumptions:
             years=1,
             year_labels=["Value"],
         )
+        st.markdown(
+            f'<div class="subtle">{_binding_note(price_ceiling)}</div>',
+            unsafe_allow_html=True,
+        )
 
     with st.expander("Detailed Mechanics (Transparency for Review)", expanded=False):
         st.markdown("#### Seller PV Mechanics")
@@ -293,6 +330,31 @@ def render(result: ModelResult, assumptions: Assumptions) -> Assumptions:
             year_labels=["Value"],
         )
 
+        st.markdown("#### Goal-Seek Limits")
+        st.markdown(
+            '<div class="subtle">What this shows: each input solved on its own so every year keeps minimum DSCR and minimum cash.</div>',
+            unsafe_allow_html=True,
+        )
+        goal_seek_rows = []
+        for target, label in GOAL_SEEK_LABELS.items():
+            solved = cached_goal_seek(updated_assumptions, target)
+            goal_seek_rows.append(
+                (
+                    label,
+                    [
+                        solved.current,
+                        _goal_seek_value(solved.value, solved.status),
+                        _goal_seek_value(solved.headroom),
+                        BINDING_LABELS.get(solved.binding, "none"),
+                    ],
+                )
+            )
+        outputs._render_statement_table_html(
+            goal_seek_rows,
+            years=4,
+            year_labels=["Current", "Solved", "Headroom", "Binding constraint"],
+        )
+
         st.markdown("#### Deal Metrics Proof")
         st.markdown(
             '<div class="subtle">What this shows: formulas used for EUR and % discounts.</div>',